@@ -0,0 +1,70 @@
+"""Measures the memory used by the srcmlcpp elements, in bytes per element.
+
+The integration headers (src/litgen/integration_tests/mylib) are concatenated, repeated --repeat times,
+and parsed into a CppUnit. Two figures are printed:
+* the size of the element objects themselves (sys.getsizeof of the object, plus its __dict__ if any)
+* the memory retained after parsing (tracemalloc), which also includes the xml tree produced by srcML
+
+Run it from the repository root, before and after a change, to compare:
+    python ci_scripts/benchmarks/bench_elements_memory.py [--repeat 5]
+"""
+
+from __future__ import annotations
+import argparse
+import gc
+import glob
+import os
+import sys
+import tracemalloc
+
+REPO_DIR = os.path.realpath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.insert(0, os.path.join(REPO_DIR, "src"))
+
+import srcmlcpp  # noqa: E402
+from srcmlcpp.cpp_types import CppElement  # noqa: E402
+
+
+def integration_headers_code() -> str:
+    mylib_dir = os.path.join(REPO_DIR, "src", "litgen", "integration_tests", "mylib")
+    codes = []
+    for header in sorted(glob.glob(os.path.join(mylib_dir, "**", "*.h"), recursive=True)):
+        with open(header, encoding="utf-8") as f:
+            codes.append(f.read())
+    return "\n".join(codes)
+
+
+def element_object_size(element: CppElement) -> int:
+    r = sys.getsizeof(element)
+    if hasattr(element, "__dict__"):
+        r += sys.getsizeof(element.__dict__)
+    return r
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="number of times the headers are repeated")
+    args = parser.parse_args()
+
+    code = "\n".join([integration_headers_code()] * args.repeat)
+    options = srcmlcpp.SrcmlcppOptions()
+    options.flag_quiet = True
+
+    gc.collect()
+    tracemalloc.start()
+    memory_before = tracemalloc.get_traced_memory()[0]
+    cpp_unit = srcmlcpp.code_to_cpp_unit(options, code)
+    gc.collect()
+    retained_memory = tracemalloc.get_traced_memory()[0] - memory_before
+    tracemalloc.stop()
+
+    elements = cpp_unit.all_cpp_elements_recursive()
+    nb_elements = len(elements)
+    objects_size = sum(element_object_size(element) for element in elements)
+
+    print(f"python {sys.version.split()[0]}, {nb_elements} elements")
+    print(f"element objects:               {objects_size / nb_elements:.0f} bytes/element")
+    print(f"retained memory (tracemalloc): {retained_memory / nb_elements:.0f} bytes/element")
+
+
+if __name__ == "__main__":
+    main()
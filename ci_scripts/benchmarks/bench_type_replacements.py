@@ -0,0 +1,109 @@
+"""Benchmarks RegexReplacementList.apply() with standard_type_replacements() and standard_value_replacements(),
+over real strings.
+
+The corpora are extracted from the integration headers (src/litgen/integration_tests/mylib):
+- the types they contain (CppType elements, parameter and return types), repeated --type-corpus-repeat times
+- the initial values of the decls, repeated --value-corpus-repeat times
+The compiled engine (RegexReplacementList.apply: prefilter + memoization) is compared with
+the previous implementation (RegexReplacementList._apply_without_engine), and the results are checked to be identical.
+
+Run it from the repository root:
+    python ci_scripts/benchmarks/bench_type_replacements.py [--repeat 5] [--type-corpus-repeat 20] [--value-corpus-repeat 50]
+"""
+
+from __future__ import annotations
+import argparse
+import glob
+import os
+import sys
+import time
+from typing import Callable
+
+REPO_DIR = os.path.realpath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.insert(0, os.path.join(REPO_DIR, "src"))
+
+from codemanip.code_replacements import RegexReplacementList  # noqa: E402
+import srcmlcpp  # noqa: E402
+from srcmlcpp.cpp_types import CppDecl, CppType, CppUnit  # noqa: E402
+from litgen.internal.cpp_to_python import standard_type_replacements, standard_value_replacements  # noqa: E402
+
+
+def parse_integration_headers() -> CppUnit:
+    mylib_dir = os.path.join(REPO_DIR, "src", "litgen", "integration_tests", "mylib")
+    codes = []
+    for header in sorted(glob.glob(os.path.join(mylib_dir, "**", "*.h"), recursive=True)):
+        with open(header, encoding="utf-8") as f:
+            codes.append(f.read())
+    options = srcmlcpp.SrcmlcppOptions()
+    options.flag_quiet = True
+    return srcmlcpp.code_to_cpp_unit(options, "\n".join(codes))
+
+
+def extract_type_strings(cpp_unit: CppUnit) -> list[str]:
+    """The types of the unit: its CppType elements, plus the parameter and return types of its functions"""
+    r = [cpp_type.str_code() for cpp_type in cpp_unit.all_cpp_elements_recursive(CppType)]
+    for cpp_function in cpp_unit.all_functions_recursive():
+        r += [parameter.decl.cpp_type.str_code() for parameter in cpp_function.parameter_list.parameters]
+        if hasattr(cpp_function, "return_type"):
+            r.append(cpp_function.return_type.str_code())
+    return r
+
+
+def extract_value_strings(cpp_unit: CppUnit) -> list[str]:
+    """The initial values of the decls of the unit"""
+    return [decl.initial_value_code for decl in cpp_unit.all_cpp_elements_recursive(CppDecl) if decl.initial_value_code]
+
+
+def best_time_ms(
+    make_replacements: Callable[[], RegexReplacementList],
+    apply_all: Callable[[RegexReplacementList, list[str]], object],
+    strings: list[str],
+    repeat: int,
+) -> float:
+    """The best time of apply_all(replacements, strings), with new replacements for each run
+    (i.e. with a new compiled engine, whose memo is empty)"""
+    times = []
+    for _ in range(repeat):
+        replacements = make_replacements()
+        start = time.perf_counter()
+        apply_all(replacements, strings)
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def apply_without_engine(replacements: RegexReplacementList, strings: list[str]) -> list[str]:
+    return [replacements._apply_without_engine(s) for s in strings]
+
+
+def apply_with_engine(replacements: RegexReplacementList, strings: list[str]) -> list[str]:
+    return [replacements.apply(s) for s in strings]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="number of runs (the best time is kept)")
+    parser.add_argument("--type-corpus-repeat", type=int, default=20, help="number of times the types are repeated")
+    parser.add_argument("--value-corpus-repeat", type=int, default=50, help="number of times the values are repeated")
+    args = parser.parse_args()
+
+    cpp_unit = parse_integration_headers()
+    corpora = [
+        ("type", standard_type_replacements, extract_type_strings(cpp_unit) * args.type_corpus_repeat),
+        ("value", standard_value_replacements, extract_value_strings(cpp_unit) * args.value_corpus_repeat),
+    ]
+
+    for name, make_replacements, corpus in corpora:
+        distinct_corpus = list(dict.fromkeys(corpus))
+        print(f"standard_{name}_replacements(): {len(corpus)} strings, {len(distinct_corpus)} distinct")
+
+        expected = apply_without_engine(make_replacements(), corpus)
+        assert apply_with_engine(make_replacements(), corpus) == expected, "the results differ!"
+
+        for title, strings in [("all strings", corpus), ("distinct strings only (no memo hit)", distinct_corpus)]:
+            time_before = best_time_ms(make_replacements, apply_without_engine, strings, args.repeat)
+            time_after = best_time_ms(make_replacements, apply_with_engine, strings, args.repeat)
+            print(f"    {title}: without engine: {time_before:.1f} ms, with engine: {time_after:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,48 @@
 from __future__ import annotations
 import re
+import weakref
 from re import Pattern
+from typing import Any
+
+try:
+    from re import _parser as _sre_parser  # type: ignore  # python >= 3.11
+except ImportError:  # python 3.10
+    import sre_parse as _sre_parser  # type: ignore
+
+
+def _required_literal(pattern: Pattern) -> str | None:  # type: ignore
+    """Returns a substring that is present in any string matched by the pattern (the longest one found by a
+    simple analysis of the pattern), or None if no such substring was found.
+    A pattern whose required literal is not in a string cannot match it (and can be skipped)."""
+    if not isinstance(pattern.pattern, str) or pattern.flags & re.IGNORECASE:
+        return None
+    try:
+        parsed = _sre_parser.parse(pattern.pattern, pattern.flags)
+    except Exception:
+        return None
+
+    literals: list[str] = []
+
+    def visit(items: Any) -> None:
+        # Only sequences that are always matched are visited (branches and optional repeats are skipped)
+        current_literal = ""
+        for op, av in items:
+            if op == _sre_parser.LITERAL:
+                current_literal += chr(av)
+                continue
+            literals.append(current_literal)
+            current_literal = ""
+            if op == _sre_parser.SUBPATTERN:
+                _group, add_flags, _del_flags, sub_pattern = av
+                if not add_flags & re.IGNORECASE:
+                    visit(sub_pattern)
+            elif op in (_sre_parser.MAX_REPEAT, _sre_parser.MIN_REPEAT) and av[0] >= 1:
+                visit(av[2])
+        literals.append(current_literal)
+
+    visit(parsed)
+    longest = max(literals, key=len)
+    return longest if len(longest) > 0 else None
 
 
 class RegexReplacement:
@@ -35,7 +77,68 @@ class RegexReplacement:
         return RegexReplacement(replace_what_str, by_what)
 
 
+class _CompiledRegexReplacementList:
+    """An engine for RegexReplacementList.apply(), with the same (ordered) semantics, which
+    * skips the replacements whose required literal is not present in the string
+    * memoizes the results
+
+    It is only valid for the replacements it was built from (see is_valid_for()).
+    """
+
+    _MAX_MEMO_SIZE = 16384
+
+    replacements: list[RegexReplacement]
+    # (replacement, required literal or None)
+    filtered_replacements: list[tuple[RegexReplacement, str | None]]
+    memo: dict[str, str]
+
+    def __init__(self, replacements: list[RegexReplacement]) -> None:
+        self.replacements = list(replacements)
+        self.filtered_replacements = [
+            (replacement, _required_literal(replacement.replace_what_re)) for replacement in replacements
+        ]
+        self.memo = {}
+
+    def is_valid_for(self, replacements: list[RegexReplacement]) -> bool:
+        # list equality checks identity first: this is a fast check
+        return self.replacements == replacements
+
+    def apply(self, s: str) -> str:
+        r = self.memo.get(s)
+        if r is not None:
+            return r
+
+        previous_s = None
+        r = s
+        max_iterations = 3
+        iteration = 0
+        while previous_s != r and iteration < max_iterations:
+            previous_s = r
+            for replacement, required_literal in self.filtered_replacements:
+                if required_literal is None or required_literal in r:
+                    r = replacement.apply(r)
+            iteration += 1
+
+        if len(self.memo) >= self._MAX_MEMO_SIZE:
+            self.memo.clear()
+        self.memo[s] = r
+        return r
+
+
+# The compiled engines of the RegexReplacementList instances.
+# They are stored outside the instances, so that they are not copied, pickled or hashed with them (with the options)
+_COMPILED_REPLACEMENT_LISTS: weakref.WeakKeyDictionary[RegexReplacementList, _CompiledRegexReplacementList] = (
+    weakref.WeakKeyDictionary()
+)
+
+
 class RegexReplacementList:
+    """An ordered list of regex replacements.
+
+    apply() uses a compiled engine, which is rebuilt whenever the content of self.replacements changes.
+    Note: the RegexReplacement inside the list should not be modified in place (replace them instead).
+    """
+
     replacements: list[RegexReplacement]
 
     def __init__(self) -> None:
@@ -53,6 +156,15 @@ class RegexReplacementList:
         return r
 
     def apply(self, s: str) -> str:
+        """Applies the replacements in order, and repeats them (up to 3 times) until the string does not change"""
+        compiled = _COMPILED_REPLACEMENT_LISTS.get(self)
+        if compiled is None or not compiled.is_valid_for(self.replacements):
+            compiled = _CompiledRegexReplacementList(self.replacements)
+            _COMPILED_REPLACEMENT_LISTS[self] = compiled
+        return compiled.apply(s)
+
+    def _apply_without_engine(self, s: str) -> str:
+        """Same as apply(), without the compiled engine (i.e. without prefilter and memoization)"""
         previous_s = None
         r = s
         max_iterations = 3
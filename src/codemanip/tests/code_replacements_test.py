@@ -32,3 +32,34 @@ def test_code_replacements():
     s = "cv::Sizeounette cv::Size s = cv::Size()"
     r = replacements_list.first_replacement().apply(s)
     assert r == "cv::Sizeounette Size s = Size()"
+
+
+def test_required_literal():
+    import re
+
+    assert code_replacements._required_literal(re.compile(r"\bstd::vector\s*<\s*(.*?)\s*>")) == "std::vector"
+    assert code_replacements._required_literal(re.compile(r"\bconst \s*char*\b")) == "const "
+    assert code_replacements._required_literal(re.compile(r"(ab)+c")) == "ab"
+    # No required literal for alternatives, optional parts or case-insensitive patterns
+    assert code_replacements._required_literal(re.compile(r"int|long")) is None
+    assert code_replacements._required_literal(re.compile(r"(abc)?\d")) is None
+    assert code_replacements._required_literal(re.compile(r"(?i)abc")) is None
+
+
+def test_compiled_replacement_list():
+    replacements_list = RegexReplacementList.from_string(r"""
+        \bunsigned \s*int\b -> int
+        \bstd::vector\s*<\s*(.*?)\s*> -> List[\1]
+        \bconst\b -> REMOVE
+        & -> REMOVE
+        """)
+    for s in ["const std::vector<unsigned int> &", "int", "std::vector<std::vector<int>>", "MyConst &"]:
+        assert replacements_list.apply(s) == replacements_list._apply_without_engine(s)
+    assert replacements_list.apply("const std::vector<unsigned int> &").strip() == "List[int]"
+
+    # The compiled engine is rebuilt when the list changes (including in place modifications)
+    assert replacements_list.apply("float") == "float"
+    replacements_list.replacements.append(code_replacements.RegexReplacement(r"\bfloat\b", "double"))
+    assert replacements_list.apply("float") == "double"
+    replacements_list.add_first_replacement(r"\bfloat\b", "float32")
+    assert replacements_list.apply("float") == "float32"
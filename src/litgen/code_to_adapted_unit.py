@@ -2,6 +2,9 @@ from __future__ import annotations
 from typing import Optional
 
 import srcmlcpp
+from srcmlcpp import srcmlcpp_main
+
+from litgen.internal.adapt_function_params.apply_all_adapters import prefetch_constructors_wrappers
 
 from litgen.internal.adapted_types.adapted_unit import (
     AdaptedUnit,
@@ -33,7 +36,12 @@ def code_to_adapted_unit_in_context(
     if lg_context.options.comments_exclude:
         _remove_all_comments(cpp_unit)
 
-    adapted_unit = AdaptedUnit(lg_context, cpp_unit)
+    # Parse all the constructors wrappers signatures at once (they will be used during the adaptation)
+    prefetch_constructors_wrappers(lg_context.options, cpp_unit)
+    try:
+        adapted_unit = AdaptedUnit(lg_context, cpp_unit)
+    finally:
+        srcmlcpp_main.clear_prefetched_code_snippets()
 
     return adapted_unit
 
@@ -1,13 +1,12 @@
 from __future__ import annotations
-import copy
 from typing import Optional
 
-from codemanip import code_utils
 
 from srcmlcpp.cpp_types import CppParameter
 
 from litgen.internal.adapt_function_params._lambda_adapter import LambdaAdapter
 from litgen.internal.adapted_types import AdaptedFunction, AdaptedParameter
+from litgen.internal.option_matchers import does_match_option
 
 
 def adapt_c_arrays(adapted_function: AdaptedFunction) -> Optional[LambdaAdapter]:
@@ -58,8 +57,8 @@ def adapt_c_arrays(adapted_function: AdaptedFunction) -> Optional[LambdaAdapter]
     function_name = adapted_function.cpp_adapted_function.function_name
 
     def shall_replace_by_boxed(param: AdaptedParameter) -> bool:
-        flag_replace_by_boxed = code_utils.does_match_regex_or_matcher(
-            options.fn_params_replace_c_array_modifiable_by_boxed__regex, function_name
+        flag_replace_by_boxed = does_match_option(
+            options, "fn_params_replace_c_array_modifiable_by_boxed__regex", function_name
         )
         cpp_decl = param.adapted_decl().cpp_element()
         is_c_array_known_fixed_size = cpp_decl.is_c_array_known_fixed_size()
@@ -67,8 +66,8 @@ def adapt_c_arrays(adapted_function: AdaptedFunction) -> Optional[LambdaAdapter]
         return is_modifiable and is_c_array_known_fixed_size and flag_replace_by_boxed
 
     def shall_replace_by_std_array(param: AdaptedParameter) -> bool:
-        flag_replace_by_std_array = code_utils.does_match_regex_or_matcher(
-            options.fn_params_replace_c_array_const_by_std_array__regex, function_name
+        flag_replace_by_std_array = does_match_option(
+            options, "fn_params_replace_c_array_const_by_std_array__regex", function_name
         )
         cpp_decl = param.adapted_decl().cpp_element()
         is_c_array_known_fixed_size = cpp_decl.is_c_array_known_fixed_size()
@@ -89,7 +88,7 @@ def adapt_c_arrays(adapted_function: AdaptedFunction) -> Optional[LambdaAdapter]
 
     lambda_adapter = LambdaAdapter()
 
-    lambda_adapter.new_function_infos = copy.deepcopy(adapted_function.cpp_adapted_function)
+    lambda_adapter.new_function_infos = adapted_function.cpp_adapted_function.clone_path("parameter_list")
 
     # old_function_params: List[CppParameter] = adapted_function.cpp_adapted_function.parameter_list.parameters
     old_function_params: list[AdaptedParameter] = adapted_function.adapted_parameters()
@@ -131,7 +130,9 @@ def adapt_c_arrays(adapted_function: AdaptedFunction) -> Optional[LambdaAdapter]
                     # output_0.value = output_raw[0];   // `lambda_output_code`
                     # output_1.value = output_raw[1];
 
-                    old_adapted_param_renamed = copy.deepcopy(old_adapted_param)
+                    old_adapted_param_renamed = AdaptedParameter(
+                        old_adapted_param.lg_context, old_adapted_param.cpp_element().clone_path("decl")
+                    )
                     old_adapted_param_renamed.cpp_element().decl.decl_name = (
                         old_adapted_param_renamed.cpp_element().decl.decl_name + "_raw"
                     )
@@ -151,7 +152,7 @@ def adapt_c_arrays(adapted_function: AdaptedFunction) -> Optional[LambdaAdapter]
                         new_function_params.append(new_param)
 
         if not was_replaced:
-            new_function_params.append(old_adapted_param.cpp_element())
+            new_function_params.append(old_adapted_param.cpp_element().shallow_clone())
             lambda_adapter.adapted_cpp_parameter_list.append(old_cpp_decl.decl_name)
 
     lambda_adapter.new_function_infos.parameter_list.parameters = new_function_params
@@ -1,5 +1,4 @@
 from __future__ import annotations
-import copy
 from typing import Optional
 
 from codemanip import code_utils
@@ -11,6 +10,7 @@ from litgen.internal import cpp_to_python
 from litgen.internal.adapt_function_params._lambda_adapter import LambdaAdapter
 from litgen.internal.adapted_types import AdaptedFunction
 from litgen.options import LitgenOptions, BindLibraryType
+from litgen.internal.option_matchers import does_match_option
 
 
 def _possible_buffer_pointer_types(options: LitgenOptions) -> list[str]:
@@ -48,7 +48,7 @@ def _name_looks_like_buffer_standard_or_template(options: LitgenOptions, param:
 
 
 def _name_looks_like_buffer_size(options: LitgenOptions, param: CppParameter) -> bool:
-    r = code_utils.does_match_regex_or_matcher(options.fn_params_buffer_size_names__regex, param.variable_name())
+    r = does_match_option(options, "fn_params_buffer_size_names__regex", param.variable_name())
     return r
 
 
@@ -134,8 +134,9 @@ class _AdaptBuffersHelper:
             return r
 
     def shall_adapt(self) -> bool:
-        if not code_utils.does_match_regex_or_matcher(
-            self.options.fn_params_replace_buffer_by_array__regex,
+        if not does_match_option(
+            self.options,
+            "fn_params_replace_buffer_by_array__regex",
             self.adapted_function.cpp_adapted_function.function_name,
         ):
             return False
@@ -466,7 +467,7 @@ class _AdaptBuffersHelper:
         return code
 
     def _new_param_buffer_standard(self, idx_param: int) -> CppParameter:
-        new_param = copy.deepcopy(self._param(idx_param))
+        new_param = self._param(idx_param).clone_path("decl", "cpp_type")
 
         if self.options.bind_library == BindLibraryType.pybind11:
             new_param.decl.cpp_type.typenames = ["py::array"]
@@ -659,7 +660,7 @@ class _AdaptBuffersHelper:
 
     def _new_param_stride(self, idx_param: int) -> CppParameter:
         stride_param = self._param(idx_param)
-        new_stride_param = copy.deepcopy(stride_param)
+        new_stride_param = stride_param.clone_path("decl", "cpp_type")
         new_stride_param.decl.cpp_type.typenames = ["int"]
         new_stride_param.decl.initial_value_code = "-1"
         return new_stride_param
@@ -707,7 +708,7 @@ def adapt_c_buffers(adapted_function: AdaptedFunction) -> Optional[LambdaAdapter
         return None
 
     lambda_adapter = LambdaAdapter()
-    lambda_adapter.new_function_infos = copy.deepcopy(adapted_function.cpp_adapted_function)
+    lambda_adapter.new_function_infos = adapted_function.cpp_adapted_function.clone_path("parameter_list")
 
     new_function_params: list[CppParameter] = []
 
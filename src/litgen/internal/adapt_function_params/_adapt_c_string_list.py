@@ -1,5 +1,4 @@
 from __future__ import annotations
-import copy
 from typing import Optional
 
 from codemanip import code_utils
@@ -10,6 +9,7 @@ from litgen import BindLibraryType
 from litgen.internal import cpp_to_python
 from litgen.internal.adapt_function_params._lambda_adapter import LambdaAdapter
 from litgen.internal.adapted_types import AdaptedFunction
+from litgen.internal.option_matchers import does_match_option
 
 
 def adapt_c_string_list(adapted_function: AdaptedFunction) -> Optional[LambdaAdapter]:
@@ -34,8 +34,8 @@ def adapt_c_string_list(adapted_function: AdaptedFunction) -> Optional[LambdaAda
         },
     """
     options = adapted_function.options
-    if not code_utils.does_match_regex_or_matcher(
-        options.fn_params_replace_c_string_list__regex, adapted_function.cpp_adapted_function.function_name
+    if not does_match_option(
+        options, "fn_params_replace_c_string_list__regex", adapted_function.cpp_adapted_function.function_name
     ):
         return None
 
@@ -56,7 +56,7 @@ def adapt_c_string_list(adapted_function: AdaptedFunction) -> Optional[LambdaAda
 
     _i_ = options._indent_cpp_spaces()
 
-    lambda_adapter.new_function_infos = copy.deepcopy(adapted_function.cpp_adapted_function)
+    lambda_adapter.new_function_infos = adapted_function.cpp_adapted_function.clone_path("parameter_list")
     new_function_params = []
 
     def is_c_string_list(i: int) -> bool:
@@ -83,7 +83,7 @@ def adapt_c_string_list(adapted_function: AdaptedFunction) -> Optional[LambdaAda
             #
             # Create new calling param (std::vector<std::string> &)
             #
-            new_param = copy.deepcopy(old_param)
+            new_param = old_param.clone_path("decl", "cpp_type")
             new_decl = new_param.decl
             if new_decl.is_c_array():
                 new_decl.c_array_code = ""
@@ -129,7 +129,7 @@ def adapt_c_string_list(adapted_function: AdaptedFunction) -> Optional[LambdaAda
             continue
 
         if not was_replaced:
-            new_function_params.append(old_param)
+            new_function_params.append(old_param.shallow_clone())
             lambda_adapter.adapted_cpp_parameter_list.append(old_param.decl.decl_name)
 
     lambda_adapter.new_function_infos.parameter_list.parameters = new_function_params
@@ -161,8 +161,8 @@ def adapt_c_string_list_no_count(adapted_function: AdaptedFunction) -> Optional[
         },
     """
     options = adapted_function.options
-    if not code_utils.does_match_regex_or_matcher(
-        options.fn_params_replace_c_string_list__regex, adapted_function.cpp_adapted_function.function_name
+    if not does_match_option(
+        options, "fn_params_replace_c_string_list__regex", adapted_function.cpp_adapted_function.function_name
     ):
         return None
 
@@ -181,7 +181,7 @@ def adapt_c_string_list_no_count(adapted_function: AdaptedFunction) -> Optional[
 
     _i_ = options._indent_cpp_spaces()
 
-    lambda_adapter.new_function_infos = copy.deepcopy(adapted_function.cpp_adapted_function)
+    lambda_adapter.new_function_infos = adapted_function.cpp_adapted_function.clone_path("parameter_list")
     new_function_params = []
 
     def is_c_string_list(i: int) -> bool:
@@ -197,7 +197,7 @@ def adapt_c_string_list_no_count(adapted_function: AdaptedFunction) -> Optional[
             #
             # Create new calling param (std::vector<std::string> &)
             #
-            new_param = copy.deepcopy(old_param)
+            new_param = old_param.clone_path("decl", "cpp_type")
             new_decl = new_param.decl
             if new_decl.is_c_array():
                 new_decl.c_array_code = ""
@@ -229,7 +229,7 @@ def adapt_c_string_list_no_count(adapted_function: AdaptedFunction) -> Optional[
             lambda_adapter.adapted_cpp_parameter_list.append(vec_name + ".data()")
 
         if not was_replaced:
-            new_function_params.append(old_param)
+            new_function_params.append(old_param.shallow_clone())
             lambda_adapter.adapted_cpp_parameter_list.append(old_param.decl.decl_name)
 
     lambda_adapter.new_function_infos.parameter_list.parameters = new_function_params
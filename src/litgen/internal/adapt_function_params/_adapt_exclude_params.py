@@ -1,13 +1,12 @@
 from __future__ import annotations
-import copy
 from typing import Optional
 
-from codemanip import code_utils
 
 from srcmlcpp.cpp_types import CppParameter
 
 from litgen.internal.adapt_function_params._lambda_adapter import LambdaAdapter
 from litgen.internal.adapted_types import AdaptedFunction
+from litgen.internal.option_matchers import does_match_option
 
 
 def adapt_exclude_params(adapted_function: AdaptedFunction) -> Optional[LambdaAdapter]:
@@ -20,11 +19,9 @@ def adapt_exclude_params(adapted_function: AdaptedFunction) -> Optional[LambdaAd
 
     def shall_exclude(param: CppParameter) -> bool:
         param_name = param.decl.decl_name
-        matches_regex_name = code_utils.does_match_regex_or_matcher(options.fn_params_exclude_names__regex, param_name)
+        matches_regex_name = does_match_option(options, "fn_params_exclude_names__regex", param_name)
         param_cpp_type = param.decl.cpp_type.str_code()
-        matches_regex_type = code_utils.does_match_regex_or_matcher(
-            options.fn_params_exclude_types__regex, param_cpp_type
-        )
+        matches_regex_type = does_match_option(options, "fn_params_exclude_types__regex", param_cpp_type)
         has_default_value = param.has_default_value()
         r = (matches_regex_name or matches_regex_type) and has_default_value
         return r
@@ -40,7 +37,7 @@ def adapt_exclude_params(adapted_function: AdaptedFunction) -> Optional[LambdaAd
 
     lambda_adapter = LambdaAdapter()
 
-    lambda_adapter.new_function_infos = copy.deepcopy(adapted_function.cpp_adapted_function)
+    lambda_adapter.new_function_infos = adapted_function.cpp_adapted_function.clone_path("parameter_list")
     new_function_params = []
 
     for old_param in old_function_params:
@@ -59,7 +56,7 @@ def adapt_exclude_params(adapted_function: AdaptedFunction) -> Optional[LambdaAd
             lambda_adapter.adapted_cpp_parameter_list.append(old_param.default_value())
 
         else:
-            new_function_params.append(old_param)
+            new_function_params.append(old_param.shallow_clone())
             lambda_adapter.adapted_cpp_parameter_list.append(old_param.decl.decl_name)
 
     lambda_adapter.new_function_infos.parameter_list.parameters = new_function_params
@@ -1,5 +1,4 @@
 from __future__ import annotations
-import copy
 
 from srcmlcpp.cpp_types import CppParameter
 
@@ -17,10 +16,10 @@ def adapt_force_lambda(adapted_function: AdaptedFunction) -> LambdaAdapter:
 
     lambda_adapter = LambdaAdapter()
 
-    lambda_adapter.new_function_infos = copy.deepcopy(adapted_function.cpp_adapted_function)
+    lambda_adapter.new_function_infos = adapted_function.cpp_adapted_function.clone_path("parameter_list")
     new_function_params = []
     for old_param in old_function_params:
-        new_function_params.append(old_param)
+        new_function_params.append(old_param.shallow_clone())
         lambda_adapter.adapted_cpp_parameter_list.append(old_param.decl.decl_name)
 
     lambda_adapter.new_function_infos.parameter_list.parameters = new_function_params
@@ -47,28 +47,12 @@ from codemanip import code_utils
 from litgen.internal.adapt_function_params._lambda_adapter import LambdaAdapter
 from litgen.internal.adapted_types import AdaptedFunction
 from litgen.internal import cpp_to_python, LitgenContext
-from srcmlcpp import CppScope, CppEnum
+from litgen.internal.option_matchers import does_match_option
+from srcmlcpp import CppScope
 from srcmlcpp.cpp_types import CppParameter, CppType
 from dataclasses import dataclass
 
 
-def _can_access_enum_with_type(
-    current_scope: CppScope,  # Represent e.g. "A::B::C"
-    cpp_type_str: str,  # A type name being checked (e.g. MyEnum, A::MyEnum)
-    cpp_enum: CppEnum,  # The enum being checked (e.g. "A::MyEnum")
-) -> bool:
-    """Check if the current scope can access the enum with the given type name"""
-    cpp_type_str = cpp_type_str.lstrip(":")
-    enum_name_with_scope = cpp_enum.cpp_scope_str(include_self=True)
-
-    # If cpp_type_str is unqualified, we need to check each scope in the hierarchy
-    for scope in current_scope.scope_hierarchy_list:
-        full_type_name = scope.qualified_name(cpp_type_str)
-        if full_type_name == enum_name_with_scope:
-            return True
-    return False
-
-
 @dataclass
 class _ImmutableCallables:
     fn_immutables_types: Callable[[str], bool]
@@ -88,9 +72,8 @@ def _immutable_functions_default(lg_context: LitgenContext, code_scope: CppScope
             return False
 
     def _fn_immutables_types(cpp_type_str: str) -> bool:
-        for cpp_enum in lg_context.encountered_cpp_enums:
-            if _can_access_enum_with_type(code_scope, cpp_type_str, cpp_enum):
-                return True
+        if lg_context.is_encountered_enum_type(code_scope, cpp_type_str):
+            return True
 
         _fn_immutables_types_user = options.fn_params_adapt_mutable_param_with_default_value__fn_is_known_immutable_type
         if _fn_immutables_types_user is not None:
@@ -122,8 +105,9 @@ def adapt_mutable_param_with_default_value(adapted_function: AdaptedFunction) ->
         options.fn_params_adapt_mutable_param_with_default_value__to_autogenerated_named_ctor
         and is_autogenerated_named_ctor
     )
-    match_regex = code_utils.does_match_regex_or_matcher(
-        options.fn_params_adapt_mutable_param_with_default_value__regex,
+    match_regex = does_match_option(
+        options,
+        "fn_params_adapt_mutable_param_with_default_value__regex",
         adapted_function.cpp_adapted_function.function_name,
     )
     if not (apply_because_autogen or match_regex):
@@ -168,7 +152,7 @@ def adapt_mutable_param_with_default_value(adapted_function: AdaptedFunction) ->
 
     lambda_adapter = LambdaAdapter()
 
-    lambda_adapter.new_function_infos = copy.deepcopy(adapted_function.cpp_adapted_function)
+    lambda_adapter.new_function_infos = adapted_function.cpp_adapted_function.clone_path("parameter_list")
     new_function_params = []
 
     new_function_comment_lines = {}
@@ -193,7 +177,7 @@ def adapt_mutable_param_with_default_value(adapted_function: AdaptedFunction) ->
             new_function_comment_lines[param_name] = param_or__real_default
 
             # Create new calling param (std::optional<T>)
-            new_param = copy.deepcopy(old_param)
+            new_param = old_param.clone_path("decl")
             new_decl = new_param.decl
             new_decl.initial_value_code = "std::nullopt"
             new_decl.cpp_type = _fn_cpp_type_to_optional(param_type)
@@ -216,7 +200,7 @@ def adapt_mutable_param_with_default_value(adapted_function: AdaptedFunction) ->
             lambda_adapter.adapted_cpp_parameter_list.append(param_or__name)
 
         if not was_replaced:
-            new_function_params.append(old_param)
+            new_function_params.append(old_param.shallow_clone())
             lambda_adapter.adapted_cpp_parameter_list.append(old_param.decl.decl_name)
 
     lambda_adapter.new_function_infos.parameter_list.parameters = new_function_params
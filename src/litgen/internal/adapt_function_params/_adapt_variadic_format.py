@@ -1,5 +1,4 @@
 from __future__ import annotations
-import copy
 from typing import Optional
 
 from srcmlcpp.cpp_types import CppParameter
@@ -34,15 +33,15 @@ def adapt_variadic_format(adapted_function: AdaptedFunction) -> Optional[LambdaA
 
     lambda_adapter = LambdaAdapter()
 
-    lambda_adapter.new_function_infos = copy.deepcopy(adapted_function.cpp_adapted_function)
+    lambda_adapter.new_function_infos = adapted_function.cpp_adapted_function.clone_path("parameter_list")
     new_function_params = []
 
     # process all params except last
     for old_param in old_function_params[:-2]:
-        new_function_params.append(old_param)
+        new_function_params.append(old_param.shallow_clone())
         lambda_adapter.adapted_cpp_parameter_list.append(old_param.decl.decl_name)
     # Process param_before_last (const char *)
-    new_function_params.append(param_before_last)
+    new_function_params.append(param_before_last.shallow_clone())
     lambda_adapter.adapted_cpp_parameter_list.append('"%s"')
     # Process last_param
     lambda_adapter.adapted_cpp_parameter_list.append(param_before_last.decl.decl_name)
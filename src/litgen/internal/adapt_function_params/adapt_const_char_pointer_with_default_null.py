@@ -1,10 +1,9 @@
-import copy
-
 from typing import Optional
 from codemanip import code_utils
 from srcmlcpp.cpp_types import CppParameter
 from litgen.internal.adapt_function_params._lambda_adapter import LambdaAdapter
 from litgen.internal.adapted_types import AdaptedFunction, AdaptedParameter
+from litgen.internal.option_matchers import does_match_option
 
 
 def adapt_const_char_pointer_with_default_null(adapted_function: AdaptedFunction) -> Optional[LambdaAdapter]:
@@ -14,9 +13,7 @@ def adapt_const_char_pointer_with_default_null(adapted_function: AdaptedFunction
         return None
 
     function_name = adapted_function.cpp_adapted_function.function_name
-    if not code_utils.does_match_regex_or_matcher(
-        options.fn_params_output_modifiable_immutable_to_return__regex, function_name
-    ):
+    if not does_match_option(options, "fn_params_output_modifiable_immutable_to_return__regex", function_name):
         return None
 
     needs_adapt = False
@@ -30,14 +27,14 @@ def adapt_const_char_pointer_with_default_null(adapted_function: AdaptedFunction
 
     lambda_adapter = LambdaAdapter()
 
-    lambda_adapter.new_function_infos = copy.deepcopy(adapted_function.cpp_adapted_function)
+    lambda_adapter.new_function_infos = adapted_function.cpp_adapted_function.clone_path("parameter_list")
 
     old_function_params: list[AdaptedParameter] = adapted_function.adapted_parameters()
 
     new_function_params: list[CppParameter] = []
     for old_adapted_param in old_function_params:
         if old_adapted_param.is_const_char_pointer_with_default_null():
-            new_param = copy.deepcopy(old_adapted_param.cpp_element())
+            new_param = old_adapted_param.cpp_element().clone_path("decl", "cpp_type")
             new_decl = new_param.decl
             new_decl.cpp_type.modifiers = []
             new_decl.cpp_type.specifiers = []
@@ -67,7 +64,7 @@ def adapt_const_char_pointer_with_default_null(adapted_function: AdaptedFunction
             lambda_adapter.adapted_cpp_parameter_list.append(f"{param_name_value}")
 
         else:
-            new_function_params.append(old_adapted_param.cpp_element())
+            new_function_params.append(old_adapted_param.cpp_element().shallow_clone())
             lambda_adapter.adapted_cpp_parameter_list.append(old_adapted_param.cpp_element().decl.decl_name)
 
     lambda_adapter.new_function_infos.parameter_list.parameters = new_function_params
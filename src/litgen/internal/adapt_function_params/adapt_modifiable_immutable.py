@@ -1,5 +1,4 @@
 from __future__ import annotations
-import copy
 from typing import Optional
 
 from codemanip import code_utils
@@ -9,6 +8,7 @@ from srcmlcpp.cpp_types import CppParameter
 from litgen.internal import boxed_python_type
 from litgen.internal.adapt_function_params._lambda_adapter import LambdaAdapter
 from litgen.internal.adapted_types import AdaptedFunction, AdaptedParameter
+from litgen.internal.option_matchers import does_match_option
 
 
 def adapt_modifiable_immutable(adapted_function: AdaptedFunction) -> Optional[LambdaAdapter]:
@@ -43,9 +43,7 @@ def adapt_modifiable_immutable(adapted_function: AdaptedFunction) -> Optional[La
     options = adapted_function.options
 
     function_name = adapted_function.cpp_adapted_function.function_name
-    if not code_utils.does_match_regex_or_matcher(
-        options.fn_params_replace_modifiable_immutable_by_boxed__regex, function_name
-    ):
+    if not does_match_option(options, "fn_params_replace_modifiable_immutable_by_boxed__regex", function_name):
         return None
 
     needs_adapt = False
@@ -59,7 +57,7 @@ def adapt_modifiable_immutable(adapted_function: AdaptedFunction) -> Optional[La
 
     lambda_adapter = LambdaAdapter()
 
-    lambda_adapter.new_function_infos = copy.deepcopy(adapted_function.cpp_adapted_function)
+    lambda_adapter.new_function_infos = adapted_function.cpp_adapted_function.clone_path("parameter_list")
 
     # old_function_params: List[CppParameter] = adapted_function.cpp_adapted_function.parameter_list.parameters
     old_function_params: list[AdaptedParameter] = adapted_function.adapted_parameters()
@@ -86,7 +84,7 @@ def adapt_modifiable_immutable(adapted_function: AdaptedFunction) -> Optional[La
             #
             # Create new calling param (BoxedType<T>)
             #
-            new_param = copy.deepcopy(old_adapted_param.cpp_element())
+            new_param = old_adapted_param.cpp_element().clone_path("decl", "cpp_type")
             cpp_type_str = old_adapted_param.cpp_element().decl.cpp_type.name_without_modifier_specifier()
 
             boxed_type_name = boxed_python_type.registered_boxed_type_name(adapted_function.lg_context, cpp_type_str)
@@ -136,7 +134,7 @@ def adapt_modifiable_immutable(adapted_function: AdaptedFunction) -> Optional[La
             lambda_adapter.adapted_cpp_parameter_list.append(f"{param_name_value}")
 
         if not was_replaced:
-            new_function_params.append(old_adapted_param.cpp_element())
+            new_function_params.append(old_adapted_param.cpp_element().shallow_clone())
             lambda_adapter.adapted_cpp_parameter_list.append(old_adapted_param.cpp_element().decl.decl_name)
 
     lambda_adapter.new_function_infos.parameter_list.parameters = new_function_params
@@ -1,5 +1,4 @@
 from __future__ import annotations
-import copy
 from typing import Optional
 
 from munch import Munch  # type: ignore
@@ -10,6 +9,7 @@ from srcmlcpp.cpp_types import CppParameter, CppType
 
 from litgen.internal.adapt_function_params._lambda_adapter import LambdaAdapter
 from litgen.internal.adapted_types import AdaptedFunction, AdaptedParameter
+from litgen.internal.option_matchers import does_match_option
 
 
 def adapt_modifiable_immutable_to_return(adapted_function: AdaptedFunction) -> Optional[LambdaAdapter]:
@@ -42,9 +42,7 @@ def adapt_modifiable_immutable_to_return(adapted_function: AdaptedFunction) -> O
     options = adapted_function.options
 
     function_name = adapted_function.cpp_adapted_function.function_name
-    if not code_utils.does_match_regex_or_matcher(
-        options.fn_params_output_modifiable_immutable_to_return__regex, function_name
-    ):
+    if not does_match_option(options, "fn_params_output_modifiable_immutable_to_return__regex", function_name):
         return None
 
     needs_adapt = False
@@ -61,7 +59,7 @@ def adapt_modifiable_immutable_to_return(adapted_function: AdaptedFunction) -> O
 
     lambda_adapter = LambdaAdapter()
 
-    lambda_adapter.new_function_infos = copy.deepcopy(adapted_function.cpp_adapted_function)
+    lambda_adapter.new_function_infos = adapted_function.cpp_adapted_function.clone_path("parameter_list")
 
     old_function_params: list[AdaptedParameter] = adapted_function.adapted_parameters()
 
@@ -84,7 +82,7 @@ def adapt_modifiable_immutable_to_return(adapted_function: AdaptedFunction) -> O
             #
             # Create new calling param same type, without pointer or reference
             #
-            new_param = copy.deepcopy(old_adapted_param.cpp_element())
+            new_param = old_adapted_param.cpp_element().clone_path("decl", "cpp_type")
             new_decl = new_param.decl
             old_decl = old_adapted_param.cpp_element().decl
             new_decl.cpp_type.typenames = old_decl.cpp_type.typenames
@@ -141,7 +139,7 @@ def adapt_modifiable_immutable_to_return(adapted_function: AdaptedFunction) -> O
             #
             # Create new calling param same type, without pointer or reference
             #
-            new_param = copy.deepcopy(old_adapted_param.cpp_element())
+            new_param = old_adapted_param.cpp_element().shallow_clone()
             array_type = new_param.decl.cpp_type.name_without_modifier_specifier()
             array_size = new_param.decl.c_array_size_as_int()
             decl_name = new_param.decl.decl_name
@@ -179,7 +177,7 @@ def adapt_modifiable_immutable_to_return(adapted_function: AdaptedFunction) -> O
             new_output_function_params.append(new_param)
 
         else:
-            new_function_params.append(old_adapted_param.cpp_element())
+            new_function_params.append(old_adapted_param.cpp_element().shallow_clone())
             lambda_adapter.adapted_cpp_parameter_list.append(old_adapted_param.cpp_element().decl.decl_name)
 
     lambda_adapter.new_function_infos.parameter_list.parameters = new_function_params
@@ -2,13 +2,15 @@ from __future__ import annotations
 from munch import Munch  # type: ignore
 
 from codemanip import code_utils
-from litgen import BindLibraryType
+from litgen import BindLibraryType, LitgenOptions
 
-from srcmlcpp.cpp_types import CppFunctionDecl
-from srcmlcpp import srcmlcpp_main
+from srcmlcpp.cpp_types import CppFunctionDecl, CppUnit
+from srcmlcpp import srcmlcpp_main, SrcmlcppException
 
 from litgen.internal.adapt_function_params._lambda_adapter import LambdaAdapter
 from litgen.internal.adapted_types import AdaptedFunction
+from litgen.internal.adapted_types.adaptation_filters import is_element_adapted_with_ancestors
+from litgen.internal.option_matchers import does_match_option
 
 
 def apply_all_adapters(inout_adapted_function: AdaptedFunction) -> None:
@@ -67,21 +69,24 @@ def apply_all_adapters(inout_adapted_function: AdaptedFunction) -> None:
         if lambda_adapter is not None:
             _apply_lambda_adapter(inout_adapted_function, lambda_adapter)
 
-    flag_force_lambda = code_utils.does_match_regex_or_matcher(
-        inout_adapted_function.options.fn_force_lambda__regex, inout_adapted_function.cpp_adapted_function.function_name
+    flag_force_lambda = does_match_option(
+        inout_adapted_function.options,
+        "fn_force_lambda__regex",
+        inout_adapted_function.cpp_adapted_function.function_name,
     )
     if flag_force_lambda and inout_adapted_function.lambda_to_call is None:
         lambda_adapter = adapt_force_lambda(inout_adapted_function)
         _apply_lambda_adapter(inout_adapted_function, lambda_adapter)
 
 
-def _apply_all_adapters_on_constructor(inout_adapted_function: AdaptedFunction) -> None:
-    parent_struct = inout_adapted_function.cpp_element().parent_struct_if_method()
+def _ctor_wrapper_codes(options: LitgenOptions, cpp_ctor: CppFunctionDecl) -> tuple[str, str]:
+    """Returns the C++ signature and lambda code of the wrapper that will construct the class of this constructor"""
+    parent_struct = cpp_ctor.parent_struct_if_method()
     assert parent_struct is not None
 
-    parameter_list = inout_adapted_function.cpp_element().parameter_list
+    parameter_list = cpp_ctor.parameter_list
 
-    if inout_adapted_function.options.bind_library == BindLibraryType.pybind11:
+    if options.bind_library == BindLibraryType.pybind11:
         ctor_wrapper_signature_template = code_utils.unindent_code(
             """
                 std::unique_ptr<{class_name}> ctor_wrapper({parameters_code});
@@ -121,6 +126,29 @@ def _apply_all_adapters_on_constructor(inout_adapted_function: AdaptedFunction)
 
     ctor_wrapper_signature_code = code_utils.process_code_template(ctor_wrapper_signature_template, replacements)
     ctor_wrapper_lambda_code = code_utils.process_code_template(ctor_wrapper_lambda_template, replacements)
+    return ctor_wrapper_signature_code, ctor_wrapper_lambda_code
+
+
+def prefetch_constructors_wrappers(options: LitgenOptions, cpp_unit: CppUnit) -> None:
+    """Parses the wrapper signatures of all the constructors in the unit with a single call to srcML
+    (instead of one call per constructor in _apply_all_adapters_on_constructor)"""
+    signatures_codes = []
+    for cpp_function in cpp_unit.all_functions_recursive():
+        if not cpp_function.is_constructor() or not is_element_adapted_with_ancestors(options, cpp_function):
+            continue
+        try:
+            signature_code, _ = _ctor_wrapper_codes(options, cpp_function)
+        except SrcmlcppException:
+            continue
+        signatures_codes.append(signature_code)
+    if len(signatures_codes) > 1:
+        srcmlcpp_main.prefetch_code_snippets(options.srcmlcpp_options, signatures_codes)
+
+
+def _apply_all_adapters_on_constructor(inout_adapted_function: AdaptedFunction) -> None:
+    ctor_wrapper_signature_code, ctor_wrapper_lambda_code = _ctor_wrapper_codes(
+        inout_adapted_function.options, inout_adapted_function.cpp_element()
+    )
 
     cpp_wrapper_function = srcmlcpp_main.code_first_function_decl(
         inout_adapted_function.options.srcmlcpp_options, ctor_wrapper_signature_code
@@ -0,0 +1,80 @@
+"""The exclusion rules of the adaptation: which C++ elements are adapted (i.e. published to python).
+
+AdaptedBlock and AdaptedClass call is_element_adapted() on their children,
+and is_element_adapted_with_ancestors() applies the same rules to a whole path of the tree
+(e.g. to find the constructors that will be adapted, before the adaptation).
+"""
+
+from __future__ import annotations
+
+from codemanip import code_utils
+
+from srcmlcpp.cpp_types import (
+    CppAccessType,
+    CppElement,
+    CppEnum,
+    CppFunctionDecl,
+    CppNamespace,
+    CppPublicProtectedPrivate,
+    CppStruct,
+)
+
+from litgen import LitgenOptions
+from litgen.internal.adapted_types.adapted_function import AdaptedFunction
+from litgen.internal.option_matchers import does_match_option
+
+
+def _is_function_adapted(options: LitgenOptions, cpp_function: CppFunctionDecl) -> bool:
+    parent_struct = cpp_function.parent_struct_if_method()
+    if parent_struct is not None:
+        access_type = cpp_function.access_type_if_method()
+        if access_type == CppAccessType.public:
+            is_excluded_by_name_and_class = code_utils.does_match_regex_or_matcher(
+                options.member_exclude_by_name_and_class__regex.get(parent_struct.class_name, ""),
+                cpp_function.name(),
+            )
+            if is_excluded_by_name_and_class:
+                return False
+        elif access_type == CppAccessType.protected:
+            if not does_match_option(options, "class_expose_protected_methods__regex", parent_struct.class_name):
+                return False
+        else:
+            return False
+    return AdaptedFunction.init_is_function_publishable(options, cpp_function)
+
+
+def is_element_adapted(options: LitgenOptions, cpp_element: CppElement) -> bool:
+    """Returns False if the element is excluded from the adaptation by the options.
+    Its ancestors are not checked (see is_element_adapted_with_ancestors)"""
+    if isinstance(cpp_element, CppStruct):
+        return not does_match_option(options, "class_exclude_by_name__regex", cpp_element.class_name)
+    elif isinstance(cpp_element, CppEnum):
+        return not does_match_option(options, "enum_exclude_by_name__regex", cpp_element.enum_name)
+    elif isinstance(cpp_element, CppNamespace):
+        is_anonymous_namespace = cpp_element.ns_name == ""
+        is_excluded_by_name = does_match_option(options, "namespace_exclude__regex", cpp_element.ns_name)
+        has_block = hasattr(cpp_element, "_block")
+        return has_block and not is_excluded_by_name and not is_anonymous_namespace
+    elif isinstance(cpp_element, CppFunctionDecl):
+        return _is_function_adapted(options, cpp_element)
+    else:
+        return True
+
+
+def is_element_adapted_with_ancestors(options: LitgenOptions, cpp_element: CppElement) -> bool:
+    """Returns False if the element, or one of its ancestors, is excluded from the adaptation.
+
+    Inside a class, only the public elements are adapted (plus the protected methods, see is_element_adapted)
+    """
+    previous_element: CppElement | None = None
+    for element in cpp_element.ancestors_list(include_self=True):
+        if not is_element_adapted(options, element):
+            return False
+        if isinstance(element, CppPublicProtectedPrivate) and element.access_type != CppAccessType.public:
+            is_protected_method = element.access_type == CppAccessType.protected and isinstance(
+                previous_element, CppFunctionDecl
+            )
+            if not is_protected_method:
+                return False
+        previous_element = element
+    return True
@@ -2,7 +2,6 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Union, cast
 
-from codemanip import code_utils
 from codemanip.parse_progress_bar import global_progress_bars
 
 from srcmlcpp.cpp_types import (
@@ -20,6 +19,7 @@ from srcmlcpp.cpp_types import (
 from srcmlcpp.srcmlcpp_exception import SrcmlcppException
 from srcmlcpp.scrml_warning_settings import WarningType
 
+from litgen.internal.adapted_types.adaptation_filters import is_element_adapted
 from litgen.internal.adapted_types.adapted_class import AdaptedClass
 from litgen.internal.adapted_types.adapted_comment import (
     AdaptedComment,
@@ -36,6 +36,7 @@ from litgen.internal.context.litgen_context import LitgenContext
 from litgen.internal.adapted_types.adapted_define import AdaptedDefine
 from litgen.internal.adapted_types.adapted_condition_macro import AdaptedConditionMacro
 from litgen.internal.adapted_types.adapted_decl import AdaptedGlobalDecl
+from litgen.internal.option_matchers import does_match_option
 
 
 def group_overloaded_functions(elements: list[Any]) -> list[Any]:
@@ -121,35 +122,24 @@ class AdaptedBlock(AdaptedElement):
                 elif isinstance(child, CppConditionMacro):
                     self.adapted_elements.append(AdaptedConditionMacro(self.lg_context, child))
                 elif isinstance(child, CppStruct):
-                    is_excluded_by_name = code_utils.does_match_regex_or_matcher(
-                        self.options.class_exclude_by_name__regex, child.class_name
-                    )
-                    if not is_excluded_by_name:
+                    if is_element_adapted(self.options, child):
                         self.adapted_elements.append(AdaptedClass(self.lg_context, child))
                 elif isinstance(child, CppFunctionDecl):
-                    if AdaptedFunction.init_is_function_publishable(self.options, child):
+                    if is_element_adapted(self.options, child):
                         is_overloaded = self.cpp_element().is_function_overloaded(child)
                         self.adapted_elements.append(AdaptedFunction(self.lg_context, child, is_overloaded))
                 elif isinstance(child, CppDefine):
-                    is_included = code_utils.does_match_regex_or_matcher(
-                        self.options.macro_define_include_by_name__regex, child.macro_name
+                    is_included = does_match_option(
+                        self.options, "macro_define_include_by_name__regex", child.macro_name
                     )
                     is_publishable = AdaptedDefine.is_publishable(child)
                     if is_included and is_publishable:
                         self.adapted_elements.append(AdaptedDefine(self.lg_context, child))
                 elif isinstance(child, CppEnum):
-                    is_excluded_by_name = code_utils.does_match_regex_or_matcher(
-                        self.options.enum_exclude_by_name__regex, child.enum_name
-                    )
-                    if not is_excluded_by_name:
+                    if is_element_adapted(self.options, child):
                         self.adapted_elements.append(AdaptedEnum(self.lg_context, child))
                 elif isinstance(child, CppNamespace):
-                    is_anonymous_namespace = child.ns_name == ""
-                    is_excluded_by_name = code_utils.does_match_regex_or_matcher(
-                        self.options.namespace_exclude__regex, child.ns_name
-                    )
-                    has_block = hasattr(child, "_block")
-                    if has_block and not is_excluded_by_name and not is_anonymous_namespace:
+                    if is_element_adapted(self.options, child):
                         self.adapted_elements.append(AdaptedNamespace(self.lg_context, child))  # type: ignore
                 elif isinstance(child, CppDeclStatement):
                     # We should filter by Unit or Namespace, But we don't have the info at the time being.
@@ -157,8 +147,8 @@ class AdaptedBlock(AdaptedElement):
                     if True:
                         for cpp_decl in child.cpp_decls:
                             # print(f"Add global: class={self.__class__} decl={cpp_decl}")
-                            is_included = code_utils.does_match_regex_or_matcher(
-                                self.options.globals_vars_include_by_name__regex, cpp_decl.decl_name
+                            is_included = does_match_option(
+                                self.options, "globals_vars_include_by_name__regex", cpp_decl.decl_name
                             )
                             if is_included:
                                 self.adapted_elements.append(AdaptedGlobalDecl(self.lg_context, cpp_decl))  # type: ignore
@@ -6,7 +6,6 @@ from typing import cast
 import munch  # type: ignore
 
 import litgen
-import srcmlcpp
 from codemanip import code_utils
 
 from srcmlcpp.cpp_types import (
@@ -22,8 +21,6 @@ from srcmlcpp.cpp_types import (
     CppEnum,
     CppConditionMacro,
     CppClass,
-    CppUnit,
-    CppPublicProtectedPrivate,
     CppConstructorDecl,
     CppTemplateSpecialization,
 )
@@ -33,6 +30,7 @@ from srcmlcpp.scrml_warning_settings import WarningType
 
 from litgen import BindLibraryType
 from litgen.internal import cpp_to_python, template_options
+from litgen.internal.adapted_types.adaptation_filters import is_element_adapted
 from litgen.internal.adapted_types.adapted_comment import (
     AdaptedComment,
     AdaptedEmptyLine,
@@ -43,6 +41,7 @@ from litgen.internal.adapted_types.adapted_enum import AdaptedEnum
 from litgen.internal.adapted_types.adapted_function import AdaptedFunction
 from litgen.internal.adapted_types.adapted_condition_macro import AdaptedConditionMacro
 from litgen.internal.context.litgen_context import LitgenContext
+from litgen.internal.option_matchers import OptionRuleName, does_match_option
 
 
 @dataclass
@@ -78,9 +77,7 @@ class AdaptedClassMember(AdaptedDecl):
         array_typename = cpp_decl.cpp_type.str_code()
         if array_typename not in options._member_numeric_c_array_types_list():
             return False
-        shall_replace = code_utils.does_match_regex_or_matcher(
-            options.member_numeric_c_array_replace__regex, cpp_decl.decl_name
-        )
+        shall_replace = does_match_option(options, "member_numeric_c_array_replace__regex", cpp_decl.decl_name)
         if not shall_replace:
             return False
         if cpp_decl.c_array_size_as_int() is None:
@@ -101,9 +98,7 @@ class AdaptedClassMember(AdaptedDecl):
             )
             return False
 
-        shall_replace = code_utils.does_match_regex_or_matcher(
-            options.member_numeric_c_array_replace__regex, cpp_decl.decl_name
-        )
+        shall_replace = does_match_option(options, "member_numeric_c_array_replace__regex", cpp_decl.decl_name)
         if not shall_replace:
             cpp_decl.emit_warning(
                 """
@@ -228,9 +223,9 @@ class AdaptedClassMember(AdaptedDecl):
         is_readonly = False
         if cpp_type.is_const():
             is_readonly = True
-        if code_utils.does_match_regex_or_matcher(self.options.member_readonly_by_type__regex, cpp_type.str_code()):
+        if does_match_option(self.options, "member_readonly_by_type__regex", cpp_type.str_code()):
             is_readonly = True
-        if code_utils.does_match_regex_or_matcher(self.options.member_readonly_by_name__regex, name_cpp):
+        if does_match_option(self.options, "member_readonly_by_name__regex", name_cpp):
             is_readonly = True
         return is_readonly
 
@@ -404,11 +399,9 @@ class AdaptedClass(AdaptedElement):
             is_excluded_by_name_and_class = code_utils.does_match_regex_or_matcher(
                 self.options.member_exclude_by_name_and_class__regex.get(class_name, ""), cpp_decl.decl_name
             )
-            is_excluded_by_name = code_utils.does_match_regex_or_matcher(
-                self.options.member_exclude_by_name__regex, cpp_decl.decl_name
-            )
-            is_excluded_by_type = code_utils.does_match_regex_or_matcher(
-                self.options.member_exclude_by_type__regex, cpp_decl.cpp_type.str_code()
+            is_excluded_by_name = does_match_option(self.options, "member_exclude_by_name__regex", cpp_decl.decl_name)
+            is_excluded_by_type = does_match_option(
+                self.options, "member_exclude_by_type__regex", cpp_decl.cpp_type.str_code()
             )
             if not is_excluded_by_name_and_class and not is_excluded_by_name and not is_excluded_by_type:
                 adapted_class_member = AdaptedClassMember(self.lg_context, cpp_decl, self)
@@ -416,15 +409,9 @@ class AdaptedClass(AdaptedElement):
                     self.adapted_public_children.append(adapted_class_member)
 
     def _init_add_adopted_class_function(self, cpp_function_decl: CppFunctionDecl) -> None:
-        class_name = self.cpp_element().class_name
-
-        is_excluded_by_name_and_class = code_utils.does_match_regex_or_matcher(
-            self.options.member_exclude_by_name_and_class__regex.get(class_name, ""), cpp_function_decl.name()
-        )
-        if not is_excluded_by_name_and_class:
-            if AdaptedFunction.init_is_function_publishable(self.options, cpp_function_decl):
-                is_overloaded = cpp_function_decl.is_overloaded_method()
-                self.adapted_public_children.append(AdaptedFunction(self.lg_context, cpp_function_decl, is_overloaded))
+        if is_element_adapted(self.options, cpp_function_decl):
+            is_overloaded = cpp_function_decl.is_overloaded_method()
+            self.adapted_public_children.append(AdaptedFunction(self.lg_context, cpp_function_decl, is_overloaded))
 
     def _init_fill_public_children(self) -> None:
         public_elements = self.cpp_element().get_elements(access_type=CppAccessType.public)
@@ -441,17 +428,11 @@ class AdaptedClass(AdaptedElement):
                 elif isinstance(child, CppUnprocessed):
                     continue
                 elif isinstance(child, CppStruct):
-                    is_excluded_by_name = code_utils.does_match_regex_or_matcher(
-                        self.options.class_exclude_by_name__regex, child.class_name
-                    )
-                    if not is_excluded_by_name:
+                    if is_element_adapted(self.options, child):
                         adapted_subclass = AdaptedClass(self.lg_context, child)
                         self.adapted_public_children.append(adapted_subclass)
                 elif isinstance(child, CppEnum):
-                    is_excluded_by_name = code_utils.does_match_regex_or_matcher(
-                        self.options.enum_exclude_by_name__regex, child.enum_name
-                    )
-                    if not is_excluded_by_name:
+                    if is_element_adapted(self.options, child):
                         adapted_enum = AdaptedEnum(self.lg_context, child)
                         self.adapted_public_children.append(adapted_enum)
                 elif isinstance(child, CppConditionMacro):
@@ -734,9 +715,7 @@ class AdaptedClass(AdaptedElement):
             else:
                 replacements.maybe_py_is_final = ""
 
-            if code_utils.does_match_regex_or_matcher(
-                self.options.class_dynamic_attributes__regex, self.cpp_element().class_name
-            ):
+            if does_match_option(self.options, "class_dynamic_attributes__regex", self.cpp_element().class_name):
                 if options.bind_library == BindLibraryType.pybind11:
                     replacements.maybe_py_is_dynamic = ", py::dynamic_attr()"
                 else:
@@ -747,9 +726,7 @@ class AdaptedClass(AdaptedElement):
             replacements.comment = self._elm_comment_pydef_one_line()
 
             if (
-                code_utils.does_match_regex_or_matcher(
-                    options.class_held_as_shared__regex, self.cpp_element().class_name
-                )
+                does_match_option(options, "class_held_as_shared__regex", self.cpp_element().class_name)
                 and self.options.bind_library == BindLibraryType.pybind11
             ):
                 replacements.maybe_shared_ptr_holder = f", std::shared_ptr<{qualified_struct_name}>"
@@ -881,12 +858,13 @@ class AdaptedClass(AdaptedElement):
     #  ============================================================================================
 
     def _cp_shall_create_copy_impl(self, copy_or_deepcopy: str) -> bool:
+        rule_name: OptionRuleName
         if copy_or_deepcopy == "copy":
-            match_regex = self.options.class_copy__regex
+            rule_name = "class_copy__regex"
         else:
-            match_regex = self.options.class_deep_copy__regex
+            rule_name = "class_deep_copy__regex"
 
-        if not code_utils.does_match_regex_or_matcher(match_regex, self.cpp_element().class_name):
+        if not does_match_option(self.options, rule_name, self.cpp_element().class_name):
             return False
 
         user_defined_copy_constructor = self.cpp_element().get_user_defined_copy_constructor()
@@ -1108,8 +1086,8 @@ class AdaptedClass(AdaptedElement):
         self.lg_context.virtual_methods_glue_code += glue_code_str
 
     def _virt_shall_override(self) -> bool:
-        active = code_utils.does_match_regex_or_matcher(
-            self.options.class_override_virtual_methods_in_python__regex, self.cpp_element().class_name
+        active = does_match_option(
+            self.options, "class_override_virtual_methods_in_python__regex", self.cpp_element().class_name
         )
         if not active:
             return False
@@ -1196,14 +1174,12 @@ class AdaptedClass(AdaptedElement):
             return
         for child in self.cpp_element().get_elements(access_type=CppAccessType.protected):
             if isinstance(child, CppFunctionDecl):
-                if AdaptedFunction.init_is_function_publishable(self.options, child):
+                if is_element_adapted(self.options, child):
                     is_overloaded = child.is_overloaded_method()
                     self.adapted_protected_methods.append(AdaptedFunction(self.lg_context, child, is_overloaded))
 
     def _prot_shall_publish(self) -> bool:
-        r = code_utils.does_match_regex_or_matcher(
-            self.options.class_expose_protected_methods__regex, self.cpp_element().class_name
-        )
+        r = does_match_option(self.options, "class_expose_protected_methods__regex", self.cpp_element().class_name)
         return r
 
 
@@ -1222,14 +1198,19 @@ class PythonNamedConstructorHelper:
 
     def flag_generate_named_ctor_params(self) -> bool:
         cpp_class = self.adapted_class.cpp_element()
-        from codemanip.code_utils import RegexOrMatcher
-
-        ctor__regex: RegexOrMatcher = ""
+        result = False
         if type(cpp_class) is CppClass:
-            ctor__regex = self.options.class_create_default_named_ctor__regex
+            result = does_match_option(
+                self.options,
+                "class_create_default_named_ctor__regex",
+                self.adapted_class.cpp_element().class_name,
+            )
         elif type(cpp_class) is CppStruct:
-            ctor__regex = self.options.struct_create_default_named_ctor__regex
-        result = code_utils.does_match_regex_or_matcher(ctor__regex, self.adapted_class.cpp_element().class_name)
+            result = does_match_option(
+                self.options,
+                "struct_create_default_named_ctor__regex",
+                self.adapted_class.cpp_element().class_name,
+            )
 
         if cpp_class.has_private_destructor():
             result = False
@@ -1286,10 +1267,10 @@ class PythonNamedConstructorHelper:
                     # they introduce too many syntax exceptions
                     return False
 
-                if code_utils.does_match_regex_or_matcher(options.member_exclude_by_type__regex, cpp_type_str):
+                if does_match_option(options, "member_exclude_by_type__regex", cpp_type_str):
                     return False
 
-                if code_utils.does_match_regex_or_matcher(options.member_exclude_by_name__regex, member.name()):
+                if does_match_option(options, "member_exclude_by_name__regex", member.name()):
                     return False
 
                 cls_name = self.cpp_class.class_name
@@ -1302,68 +1283,13 @@ class PythonNamedConstructorHelper:
             members_decls = list(filter(can_be_set, members_decls))
             return members_decls
 
-        def make_fake_struct_cpp_code() -> str:
-            class_name = self.adapted_class.cpp_element().class_name
-            members = compatible_members_list()
-            members_strs = []
-            for member in members:
-                s = f"{member.cpp_type.str_code()} {member.name()}"
-                if len(member.initial_value_code) > 0:
-                    s += " = " + member.initial_value_code
-                else:
-                    cpp_type_str = member.cpp_type.str_code()
-                    s += " = " + cpp_type_str + "()"
-                members_strs.append(s)
-            parameters_str = ", ".join(members_strs)
-            str_cpp_code = f"""
-                struct {class_name} {{
-                    {class_name}({parameters_str});
-                }};
-            """
-
-            class_scope = self.adapted_class.cpp_element().cpp_scope()
-            for scope_part in class_scope.scope_parts:
-                if scope_part.scope_type == CppScopeType.Namespace:
-                    str_cpp_code = "namespace " + scope_part.scope_name + " {\n" + str_cpp_code + "\n}\n"
-                elif scope_part.scope_type == CppScopeType.ClassOrStruct:
-                    # Emit as namespace (srcmlcpp can't handle nested struct wrappers here),
-                    # then fix the scope type after parsing (see below).
-                    str_cpp_code = "namespace " + scope_part.scope_name + " {\n" + str_cpp_code + "\n}\n"
-
-            return str_cpp_code
-
         def make_cpp_constructor() -> CppFunctionDecl:
-            def make_cpp_unit_quiet(options: litgen.LitgenOptions, code: str) -> CppUnit:
-                flag_progress = options.srcmlcpp_options.flag_show_progress
-                options.srcmlcpp_options.flag_show_progress = False
-                unit = srcmlcpp.code_to_cpp_unit(options.srcmlcpp_options, code)
-                options.srcmlcpp_options.flag_show_progress = flag_progress
-                return unit
-
-            cpp_code = make_fake_struct_cpp_code()
-            cpp_unit = make_cpp_unit_quiet(self.adapted_class.options, cpp_code)
-
-            # We have a CppUnit, that represents a struct, but we need to reparent the constructor
-            #      srcmlcpp xml "struct Foo { Foo(); };"
-            #        <struct>struct
-            #           <name>Foo</name>
-            #           <block>{
-            #              <public type="default">    <=======   reattach this public to the block of the correct class
-            #                 <constructor_decl> <name>Foo</name>
-            #                    <parameter_list>()</parameter_list>;
-            #                 </constructor_decl>
-            #              </public>}
-            #           </block>;
-            #        </struct>
-            public_regions = cpp_unit.all_cpp_elements_recursive(CppPublicProtectedPrivate)
-            assert len(public_regions) == 1
-            public_region = public_regions[0]
-            public_region.parent = self.adapted_class.cpp_element().block
-
-            # Find the constructor
-            ctors = cpp_unit.all_cpp_elements_recursive(CppConstructorDecl)
-            assert len(ctors) == 1
-            ctor_decl = cast(CppConstructorDecl, ctors[0])
+            # Build the constructor directly from the members (no need to call srcML)
+            ctor_decl = CppConstructorDecl.from_decls(self.cpp_class, compatible_members_list())
+            for parameter in ctor_decl.parameter_list.parameters:
+                if len(parameter.decl.initial_value_code) == 0:
+                    parameter.decl.initial_value_code = parameter.decl.cpp_type.str_code() + "()"
+
             if self.flag_generate_void_constructor():
                 ctor_decl.cpp_element_comments.comment_on_previous_lines = (
                     "Auto-generated default constructor (omit named params)"
@@ -1377,17 +1303,6 @@ class PythonNamedConstructorHelper:
                     ctor_decl.cpp_element_comments.comment_on_previous_lines = "Auto-generated default constructor"
             # And qualify its types
             ctor_qualified = ctor_decl.with_qualified_types()
-
-            # Fix scope types: the synthetic code emits enclosing classes as
-            # namespaces (to avoid nested struct parsing issues), so the
-            # constructor's scope has Namespace where it should have ClassOrStruct.
-            # Restore the correct types from the original class scope.
-            original_scope = self.adapted_class.cpp_element().cpp_scope(include_self=True)
-            original_types = {part.scope_name: part.scope_type for part in original_scope.scope_parts}
-            for part in ctor_qualified.cpp_scope(include_self=False).scope_parts:
-                if part.scope_name in original_types:
-                    part.scope_type = original_types[part.scope_name]
-
             return ctor_qualified
 
         return make_cpp_constructor()
@@ -1,5 +1,4 @@
 from __future__ import annotations
-import copy
 from dataclasses import dataclass
 from typing import cast
 
@@ -68,7 +67,7 @@ class AdaptedDecl(AdaptedElement):
 
         # If the array is `const`, then we simply wrap it into a std::array, like this:
         # `const int v[2]` --> `[ const std::array<int, 2> v ]`
-        new_cpp_decl = copy.deepcopy(self.cpp_element())
+        new_cpp_decl = self.cpp_element().clone_path("cpp_type")
         new_cpp_decl.c_array_code = ""
 
         new_cpp_decl.cpp_type.specifiers.remove("const")
@@ -110,7 +109,7 @@ class AdaptedDecl(AdaptedElement):
 
         new_decls: list[AdaptedDecl] = []
         for i in range(array_size):
-            new_decl = copy.deepcopy(self)
+            new_decl = AdaptedDecl(self.lg_context, self.cpp_element().clone_path("cpp_type"))
             new_decl.cpp_element().decl_name = new_decl.cpp_element().decl_name + "_" + str(i)
             new_decl.cpp_element().cpp_type.typenames = [cpp_type_name]
             new_decl.cpp_element().cpp_type.modifiers = ["&"]
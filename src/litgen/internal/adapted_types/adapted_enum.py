@@ -1,4 +1,5 @@
 from __future__ import annotations
+import re
 from dataclasses import dataclass
 from typing import cast
 
@@ -16,6 +17,7 @@ from litgen.internal.adapted_types.adapted_comment import (
 from litgen.internal.adapted_types.adapted_decl import AdaptedDecl
 from litgen.internal.adapted_types.adapted_element import AdaptedElement
 from litgen.internal.context.litgen_context import LitgenContext
+from litgen.internal.option_matchers import does_match_option
 
 
 @dataclass
@@ -98,8 +100,7 @@ class AdaptedEnumDecl(AdaptedDecl):
         # Sometimes, enum decls have interdependent values like this:
         #     enum MyEnum { /*....*/ MyEnum_foo = MyEnum_a | MyEnum_b };
         # So, we search and replace enum strings in the default value
-        replacements = self.enum_parent.cpp_to_python_replacements(from_inside_block=True)
-        decl_value_python = replacements.apply(decl_value_python)
+        decl_value_python = self.enum_parent.apply_cpp_to_python_replacements(decl_value_python, from_inside_block=True)
 
         return decl_value_python
 
@@ -163,21 +164,76 @@ class AdaptedEnumDecl(AdaptedDecl):
         return str(self.cpp_element())
 
 
+class _EnumMembersReplacer:
+    """Applies the replacements of all the members of an enum in a single pass:
+    their patterns are combined into one alternation, and the replacement is looked up by the group that matched.
+
+    This is equivalent to applying the replacements one after the other (as RegexReplacementList.apply does),
+    provided that no replacement result is matched by a pattern: otherwise, the replacements are applied
+    one after the other.
+    """
+
+    replacement_list: RegexReplacementList
+    _combined_re: re.Pattern[str] | None
+    _by_what: dict[int, str]  # group index -> replacement
+
+    def __init__(self, replacement_list: RegexReplacementList) -> None:
+        self.replacement_list = replacement_list
+        self._combined_re = None
+        self._by_what = {}
+
+        replacements = replacement_list.replacements
+        if len(replacements) == 0:
+            return
+        if any(replacement.replace_what_re.groups > 0 or "\\" in replacement.by_what for replacement in replacements):
+            return
+        combined_re = re.compile("|".join(f"({replacement.replace_what_re.pattern})" for replacement in replacements))
+        if any(combined_re.search(replacement.by_what) is not None for replacement in replacements):
+            return  # the replacements would be chained
+        self._combined_re = combined_re
+        self._by_what = {i + 1: replacement.by_what for i, replacement in enumerate(replacements)}
+
+    def _replace_match(self, match: re.Match[str]) -> str:
+        assert match.lastindex is not None
+        return self._by_what[match.lastindex]
+
+    def apply(self, s: str) -> str:
+        if self._combined_re is None:
+            return self.replacement_list.apply(s)
+        previous_s = None
+        r = s
+        max_iterations = 3
+        iteration = 0
+        while previous_s != r and iteration < max_iterations:
+            previous_s = r
+            r = self._combined_re.sub(self._replace_match, r)
+            iteration += 1
+        return r
+
+
 @dataclass
 class AdaptedEnum(AdaptedElement):
     adapted_children: list[AdaptedDecl | AdaptedEmptyLine | AdaptedComment]
     adapted_enum_decls: list[AdaptedEnumDecl]
 
+    # caches for cpp_to_python_replacements() and apply_cpp_to_python_replacements(), indexed by from_inside_block
+    _cpp_to_python_replacements: dict[bool, RegexReplacementList]
+    _cpp_to_python_replacers: dict[bool, _EnumMembersReplacer]
+
     def __init__(self, lg_context: LitgenContext, enum_: CppEnum) -> None:
         super().__init__(lg_context, enum_)
         self.adapted_children = []
         self.adapted_enum_decls = []
+        self._cpp_to_python_replacements = {}
+        self._cpp_to_python_replacers = {}
         self._fill_children()
 
         replacements = self.cpp_to_python_replacements()
         scope = self.cpp_element().cpp_scope(include_self=False)
         self.lg_context.get_scoped_replacements(scope).store_replacements(replacements)
-        self.lg_context.encountered_cpp_enums.append(self.cpp_element())
+        self.lg_context.encountered_cpp_enums_qualified_names.append(
+            self.cpp_element().cpp_scope_str(include_self=True)
+        )
 
     # override
     def cpp_element(self) -> CppEnum:
@@ -202,11 +258,23 @@ class AdaptedEnum(AdaptedElement):
                     self.adapted_enum_decls.append(new_adapted_decl)
 
     def cpp_to_python_replacements(self, from_inside_block: bool = False) -> RegexReplacementList:
-        r = RegexReplacementList()
-        for decl in self.adapted_enum_decls:
-            r.merge_replacements(decl.cpp_to_python_replacements(from_inside_block))
+        """The replacements for the names of the enum members (computed once; do not modify the result)"""
+        r = self._cpp_to_python_replacements.get(from_inside_block)
+        if r is None:
+            r = RegexReplacementList()
+            for decl in self.adapted_enum_decls:
+                r.merge_replacements(decl.cpp_to_python_replacements(from_inside_block))
+            self._cpp_to_python_replacements[from_inside_block] = r
         return r
 
+    def apply_cpp_to_python_replacements(self, s: str, from_inside_block: bool = False) -> str:
+        """Same as self.cpp_to_python_replacements(from_inside_block).apply(s), in a single pass"""
+        replacer = self._cpp_to_python_replacers.get(from_inside_block)
+        if replacer is None:
+            replacer = _EnumMembersReplacer(self.cpp_to_python_replacements(from_inside_block))
+            self._cpp_to_python_replacers[from_inside_block] = replacer
+        return replacer.apply(s)
+
     # override
     def stub_lines(self) -> list[str]:
         from litgen.internal.adapted_types.line_spacer import LineSpacerPython
@@ -214,8 +282,8 @@ class AdaptedEnum(AdaptedElement):
         line_spacer = LineSpacerPython(self.options)
 
         enum_name_cpp = self.cpp_element().cpp_scope_str(True)
-        is_arithmetic = code_utils.does_match_regex_or_matcher(self.options.enum_make_arithmetic__regex, enum_name_cpp)
-        is_flag = code_utils.does_match_regex_or_matcher(self.options.enum_make_flag__regex, enum_name_cpp)
+        is_arithmetic = does_match_option(self.options, "enum_make_arithmetic__regex", enum_name_cpp)
+        is_flag = does_match_option(self.options, "enum_make_flag__regex", enum_name_cpp)
 
         enum_parent = "enum.Enum"  # Default parent for enum
         if is_arithmetic and is_flag:
@@ -247,13 +315,13 @@ class AdaptedEnum(AdaptedElement):
         lines: list[str] = []
 
         # Enum decl first line
-        is_arithmetic = code_utils.does_match_regex_or_matcher(self.options.enum_make_arithmetic__regex, enum_name_cpp)
+        is_arithmetic = does_match_option(self.options, "enum_make_arithmetic__regex", enum_name_cpp)
         if is_arithmetic:
             if self.options.bind_library == BindLibraryType.pybind11:
                 enum_annotation = ", py::arithmetic()"
             else:
                 enum_annotation = ", nb::is_arithmetic()"
-                is_flag = code_utils.does_match_regex_or_matcher(self.options.enum_make_flag__regex, enum_name_cpp)
+                is_flag = does_match_option(self.options, "enum_make_flag__regex", enum_name_cpp)
                 if is_flag:
                     enum_annotation += ", nb::is_flag()"
         pydef_class_var_parent = cpp_to_python.cpp_scope_to_pybind_parent_var_name(self.options, self.cpp_element())
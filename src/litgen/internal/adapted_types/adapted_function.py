@@ -23,6 +23,7 @@ from litgen.internal import cpp_to_python
 from litgen.internal.adapted_types.adapted_decl import AdaptedDecl
 from litgen.internal.adapted_types.adapted_element import AdaptedElement
 from litgen.internal.context.litgen_context import LitgenContext
+from litgen.internal.option_matchers import does_match_option
 
 
 @dataclass
@@ -290,7 +291,7 @@ class AdaptedFunction(AdaptedElement):
                 options, self.cpp_element(), exclude_even_if_options_fn_exclude_non_api=True
             )
             if is_private_api and len(options.fn_non_api_comment) > 0:
-                self._cpp_element = copy.deepcopy(self._cpp_element)
+                self._cpp_element = self._cpp_element.shallow_clone()
                 if len(self._cpp_element.cpp_element_comments.comment_on_previous_lines) == 0:
                     self._cpp_element.cpp_element_comments.comment_on_previous_lines = f"{options.fn_non_api_comment}"
                 else:
@@ -329,16 +330,15 @@ class AdaptedFunction(AdaptedElement):
             return False
 
         # Check options.fn_exclude_by_name__regex
-        if code_utils.does_match_regex_or_matcher(options.fn_exclude_by_name__regex, cpp_function.function_name):
+        if does_match_option(options, "fn_exclude_by_name__regex", cpp_function.function_name):
             return False
 
         # Check options.fn_exclude_by_param_type__regex
-        reg = options.fn_exclude_by_param_type__regex
         if hasattr(cpp_function, "return_type"):
-            if code_utils.does_match_regex_or_matcher(reg, cpp_function.return_type.str_code()):
+            if does_match_option(options, "fn_exclude_by_param_type__regex", cpp_function.return_type.str_code()):
                 return False
         for param in cpp_function.parameter_list.parameters:
-            if code_utils.does_match_regex_or_matcher(reg, param.decl.cpp_type.str_code()):
+            if does_match_option(options, "fn_exclude_by_param_type__regex", param.decl.cpp_type.str_code()):
                 return False
 
         # Check options.fn_exclude_by_name_and_signature
@@ -401,7 +401,7 @@ class AdaptedFunction(AdaptedElement):
             if param.decl.decl_name == "":
                 has_unnamed_param = True
         if has_unnamed_param:
-            parameters_list.parameters = copy.deepcopy(parameters_list.parameters)
+            parameters_list.parameters = [param.clone_path("decl") for param in parameters_list.parameters]
             for i, param in enumerate(parameters_list.parameters):
                 if param.decl.decl_name == "":
                     param.decl.decl_name = f"param_{i}"
@@ -417,10 +417,8 @@ class AdaptedFunction(AdaptedElement):
         if self.options.bind_library != BindLibraryType.pybind11:
             return False
         ns_name = self.cpp_element().cpp_scope_str(include_self=False)
-        match_ns_name = code_utils.does_match_regex_or_matcher(self.options.fn_namespace_vectorize__regex, ns_name)
-        match_fn_name = code_utils.does_match_regex_or_matcher(
-            self.options.fn_vectorize__regex, self.cpp_element().function_name
-        )
+        match_ns_name = does_match_option(self.options, "fn_namespace_vectorize__regex", ns_name)
+        match_fn_name = does_match_option(self.options, "fn_vectorize__regex", self.cpp_element().function_name)
         r = match_ns_name and match_fn_name and not self.is_vectorize_impl
         return r
 
@@ -553,9 +551,7 @@ class AdaptedFunction(AdaptedElement):
         replace_lines.maybe_call_guard = self._pydef_fill_call_guard_from_function_comment()
 
         # Add gil_scoped_release call guard if regex matches
-        if code_utils.does_match_regex_or_matcher(
-            self.options.fn_add_gil_scoped_release_guard__regex, self.cpp_element().function_name
-        ):
+        if does_match_option(self.options, "fn_add_gil_scoped_release_guard__regex", self.cpp_element().function_name):
             py_ns = "py" if self.options.bind_library == BindLibraryType.pybind11 else "nb"
             gil_guard = f"{py_ns}::call_guard<{py_ns}::gil_scoped_release>()"
             if replace_lines.maybe_call_guard is None:
@@ -638,8 +634,8 @@ class AdaptedFunction(AdaptedElement):
         if self.is_method():
             replace_tokens.function_pointer = "&" + replace_tokens.function_pointer
 
-        force_overload_in_pydef = code_utils.does_match_regex_or_matcher(
-            self.options.fn_force_overload__regex, self.cpp_element().function_name
+        force_overload_in_pydef = does_match_option(
+            self.options, "fn_force_overload__regex", self.cpp_element().function_name
         )
 
         if self.is_overloaded or force_overload_in_pydef:
@@ -880,7 +876,7 @@ class AdaptedFunction(AdaptedElement):
 
         new_initial_value_code = add_class_scope_to_initial_value(param.decl.initial_value_code)
         if new_initial_value_code is not None:
-            new_param = copy.deepcopy(param)
+            new_param = param.clone_path("decl")
             new_param.decl.initial_value_code = new_initial_value_code
             return new_param
         else:
@@ -946,11 +942,11 @@ class AdaptedFunction(AdaptedElement):
         options = self.options
         returns_pointer = self.cpp_element().returns_pointer()
         returns_reference = self.cpp_element().returns_reference()
-        matches_regex_pointer = code_utils.does_match_regex_or_matcher(
-            options.fn_return_force_policy_reference_for_pointers__regex, function_name
+        matches_regex_pointer = does_match_option(
+            options, "fn_return_force_policy_reference_for_pointers__regex", function_name
         )
-        matches_regex_reference = code_utils.does_match_regex_or_matcher(
-            options.fn_return_force_policy_reference_for_references__regex, function_name
+        matches_regex_reference = does_match_option(
+            options, "fn_return_force_policy_reference_for_references__regex", function_name
         )
 
         if (matches_regex_pointer and returns_pointer) or (matches_regex_reference and returns_reference):
@@ -1059,8 +1055,8 @@ class AdaptedFunction(AdaptedElement):
         if self.cpp_element().is_virtual_method():
             parent_struct = self.cpp_element().parent_struct_if_method()
             assert parent_struct is not None
-            is_overridable = code_utils.does_match_regex_or_matcher(
-                self.options.class_override_virtual_methods_in_python__regex, parent_struct.class_name
+            is_overridable = does_match_option(
+                self.options, "class_override_virtual_methods_in_python__regex", parent_struct.class_name
             )
             if is_overridable:
                 comment_python_overridable = " # overridable"
@@ -1360,12 +1356,9 @@ class AdaptedFunction(AdaptedElement):
         cpp_name = self.cpp_element().function_name
         py_name = cpp_to_python.function_name_to_python(self.options, cpp_name)
         if cpp_name != py_name:
-            from codemanip.code_replacements import RegexReplacement
-
             scope = self.cpp_element().cpp_scope(include_self=False)
             cache = self.lg_context.get_scoped_replacements(scope)
-            replacement = RegexReplacement(rf"\b{cpp_name}(?=\s*\()", py_name)
-            cache.store_replacement(replacement)
+            cache.store_function_name_replacement(cpp_name, py_name)
 
     #  ============================================================================================
     #
@@ -128,7 +128,10 @@ def cpp_split_spaceship_operator(adapted_spaceship_operator: AdaptedFunction) ->
     r: list[AdaptedFunction] = []
 
     def make_cmp(cpp_operator_name: str, test_to_run: str) -> AdaptedFunction:
-        f = copy.deepcopy(adapted_spaceship_operator)
+        f = copy.copy(adapted_spaceship_operator)
+        f.cpp_adapted_function = f.cpp_adapted_function.clone_path("return_type")
+        if adapted_spaceship_operator.cpp_element() is adapted_spaceship_operator.cpp_adapted_function:
+            f._cpp_element = f.cpp_adapted_function
         f.cpp_adapted_function.return_type.typenames = ["bool"]
         f.cpp_adapted_function.function_name = f"operator{cpp_operator_name}"
         f.cpp_adapter_code = code_utils.unindent_code(
@@ -1,15 +1,18 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import Any, TYPE_CHECKING
+
+from codemanip.code_replacements import RegexReplacement
 
 from litgen.internal.context.namespaces_code_tree import (
     NamespacesCodeTree,
     PydefOrStub,
 )
 from litgen.internal.context.replacements_cache import ReplacementsCache
+from litgen.internal.context.type_to_python_cache import TypeToPythonCache
 from litgen.internal.context.type_synonyms import CppTypeName
 from litgen.internal.context.type_synonyms import CppNamespaceName, CppQualifiedNamespaceName
-from srcmlcpp.cpp_types.cpp_enum import CppEnum
+from litgen.internal.option_matchers import option_matchers
 from srcmlcpp.cpp_types.scope.cpp_scope import CppScope
 
 if TYPE_CHECKING:
@@ -38,6 +41,56 @@ class ScopeMembers:
     member_names: set[str] = field(default_factory=set)
 
 
+@dataclass
+class ContextContributions:
+    """The state of a LitgenContext that is shared between headers, or what processing some headers
+    added to it (see LitgenContext.contributions_since).
+
+    It only contains picklable data, so that it can be computed in another process.
+    """
+
+    encountered_cpp_boxed_types: set[CppTypeName] = field(default_factory=set)
+    encountered_cpp_enums_qualified_names: list[str] = field(default_factory=list)
+    scoped_replacements: dict[str, list[RegexReplacement]] = field(default_factory=dict)
+    scope_members: dict[str, ScopeMembers] = field(default_factory=dict)
+    protected_methods_glue_code: str = ""
+    virtual_methods_glue_code: str = ""
+    # The names of the options rules which matched something (see option_matchers)
+    matched_options_rules: set[str] = field(default_factory=set)
+
+
+@dataclass
+class ContextReads:
+    """The reads made on the state shared between headers, while processing a header in a fresh LitgenContext.
+
+    Used to check whether the result would have been the same in a context where other headers
+    had been processed before (see LitgenContext.would_read_the_same).
+    """
+
+    # Names looked up in scope_members, which were not (yet) registered
+    scope_members_misses: set[str] = field(default_factory=set)
+    # (scope, type) of the types which were not recognized as an encountered enum
+    enum_types_misses: list[tuple[CppScope, str]] = field(default_factory=list)
+    # (scope key, value, number of replacements for this scope at that time, value after replacements)
+    replaced_values: list[tuple[str, str, int, str]] = field(default_factory=list)
+
+
+def _can_access_enum_with_type(
+    current_scope: CppScope,  # Represent e.g. "A::B::C"
+    cpp_type_str: str,  # A type name being checked (e.g. MyEnum, A::MyEnum)
+    enum_qualified_name: str,  # The enum being checked (e.g. "A::MyEnum")
+) -> bool:
+    """Check if the current scope can access the enum with the given type name"""
+    cpp_type_str = cpp_type_str.lstrip(":")
+
+    # If cpp_type_str is unqualified, we need to check each scope in the hierarchy
+    for scope in current_scope.scope_hierarchy_list:
+        full_type_name = scope.qualified_name(cpp_type_str)
+        if full_type_name == enum_qualified_name:
+            return True
+    return False
+
+
 @dataclass
 class LitgenContext:
     """
@@ -47,7 +100,8 @@ class LitgenContext:
 
     options: LitgenOptions
     encountered_cpp_boxed_types: set[CppTypeName]
-    encountered_cpp_enums: list[CppEnum]
+    # Qualified names of the encountered enums (e.g. "A::MyEnum")
+    encountered_cpp_enums_qualified_names: list[str]
     namespaces_stub: NamespacesCodeTree
     namespaces_pydef: NamespacesCodeTree
     # Per-scope replacement caches for default value translation.
@@ -58,6 +112,9 @@ class LitgenContext:
     # See ScopeMembers for details.
     scope_members: dict[str, ScopeMembers]
 
+    # Memo cache for cpp_to_python.type_to_python()
+    type_to_python_cache: TypeToPythonCache
+
     # cf https://pybind11.readthedocs.io/en/stable/advanced/classes.html#binding-protected-member-functions
     protected_methods_glue_code: str = ""
     # cf https://pybind11.readthedocs.io/en/stable/advanced/classes.html#overriding-virtual-functions-in-python
@@ -65,25 +122,72 @@ class LitgenContext:
 
     current_parsed_filename: str = ""
 
+    # When not None, the reads made on the state shared between headers are recorded here
+    # (see LitgenGenerator.process_cpp_files)
+    recorded_reads: ContextReads | None = None
+
     def __init__(self, options: LitgenOptions):
         self.options = options
         self.encountered_cpp_boxed_types = set()
-        self.encountered_cpp_enums = []
+        self.encountered_cpp_enums_qualified_names = []
         self.namespaces_stub = NamespacesCodeTree(self.options, PydefOrStub.Stub)
         self.namespaces_pydef = NamespacesCodeTree(self.options, PydefOrStub.Pydef)
         self._scoped_replacements = {}
         self.scope_members = {}
+        self.type_to_python_cache = TypeToPythonCache()
 
     def clear_namespaces_code_tree(self) -> None:
         self.namespaces_stub = NamespacesCodeTree(self.options, PydefOrStub.Stub)
         self.namespaces_pydef = NamespacesCodeTree(self.options, PydefOrStub.Pydef)
 
+    def get_scope_members(self, cpp_name: str) -> ScopeMembers | None:
+        r = self.scope_members.get(cpp_name)
+        if r is None and self.recorded_reads is not None:
+            self.recorded_reads.scope_members_misses.add(cpp_name)
+        return r
+
+    def is_encountered_enum_type(self, current_scope: CppScope, cpp_type_str: str) -> bool:
+        """Returns True if cpp_type_str designates an encountered enum, when accessed from current_scope"""
+        for enum_qualified_name in self.encountered_cpp_enums_qualified_names:
+            if _can_access_enum_with_type(current_scope, cpp_type_str, enum_qualified_name):
+                return True
+        if self.recorded_reads is not None:
+            self.recorded_reads.enum_types_misses.append((current_scope, cpp_type_str))
+        return False
+
     def qualified_stub_namespaces(self) -> set[CppQualifiedNamespaceName]:
         return self.namespaces_stub.qualified_namespaces()
 
     def unqualified_stub_namespaces(self) -> set[CppNamespaceName]:
         return self.namespaces_stub.unqualified_namespaces()
 
+    def _type_to_python_stamp(self) -> tuple[Any, ...]:
+        """The state on which cpp_to_python.type_to_python() depends (besides the type string):
+        the stub namespaces and some options.
+        Mutable values are stored together with their length, and compared by identity"""
+        options = self.options
+        return (
+            self.namespaces_stub,
+            len(self.namespaces_stub.qualified_namespaces()),
+            options.class_template_options,
+            len(options.class_template_options.specs),
+            tuple(options.namespaces_root),
+            options.python_convert_to_snake_case,
+            *(
+                (replacement_list, len(replacement_list.replacements))
+                for replacement_list in (
+                    options.type_replacements,
+                    options.namespace_names_replacements,
+                    options.var_names_replacements,
+                )
+            ),
+        )
+
+    def validated_type_to_python_cache(self) -> TypeToPythonCache:
+        """The memo cache for cpp_to_python.type_to_python(), validated against the current state"""
+        self.type_to_python_cache.validate(self._type_to_python_stamp())
+        return self.type_to_python_cache
+
     def get_scoped_replacements(self, scope: CppScope) -> ReplacementsCache:
         """Get (or create) the ReplacementsCache for a given scope."""
         key = scope.str_cpp
@@ -100,6 +204,86 @@ class LitgenContext:
             cpp_scope = CppScope([])
         for scope in cpp_scope.scope_hierarchy_list:
             key = scope.str_cpp
-            if key in self._scoped_replacements:
+            if self.recorded_reads is not None:
+                value = s
+                nb_replacements = 0
+                if key in self._scoped_replacements:
+                    s = self._scoped_replacements[key].apply(s)
+                    nb_replacements = len(self._scoped_replacements[key].replacement_list.replacements)
+                self.recorded_reads.replaced_values.append((key, value, nb_replacements, s))
+            elif key in self._scoped_replacements:
                 s = self._scoped_replacements[key].apply(s)
         return s
+
+    def state_snapshot(self) -> ContextContributions:
+        """A copy of the state shared between headers"""
+        r = ContextContributions(
+            encountered_cpp_boxed_types=set(self.encountered_cpp_boxed_types),
+            encountered_cpp_enums_qualified_names=list(self.encountered_cpp_enums_qualified_names),
+            scoped_replacements={
+                key: list(cache.replacement_list.replacements) for key, cache in self._scoped_replacements.items()
+            },
+            scope_members=dict(self.scope_members),
+            protected_methods_glue_code=self.protected_methods_glue_code,
+            virtual_methods_glue_code=self.virtual_methods_glue_code,
+        )
+        return r
+
+    def contributions_since(self, snapshot: ContextContributions) -> ContextContributions:
+        """What was added to the state shared between headers, since the snapshot was taken"""
+        current = self.state_snapshot()
+        r = ContextContributions(
+            encountered_cpp_boxed_types=current.encountered_cpp_boxed_types - snapshot.encountered_cpp_boxed_types,
+            encountered_cpp_enums_qualified_names=current.encountered_cpp_enums_qualified_names[
+                len(snapshot.encountered_cpp_enums_qualified_names) :
+            ],
+            scoped_replacements={
+                key: replacements[len(snapshot.scoped_replacements.get(key, [])) :]
+                for key, replacements in current.scoped_replacements.items()
+            },
+            scope_members={
+                name: members
+                for name, members in current.scope_members.items()
+                if snapshot.scope_members.get(name) is not members
+            },
+            protected_methods_glue_code=current.protected_methods_glue_code[
+                len(snapshot.protected_methods_glue_code) :
+            ],
+            virtual_methods_glue_code=current.virtual_methods_glue_code[len(snapshot.virtual_methods_glue_code) :],
+        )
+        return r
+
+    def apply_contributions(self, contributions: ContextContributions) -> None:
+        self.encountered_cpp_boxed_types |= contributions.encountered_cpp_boxed_types
+        self.encountered_cpp_enums_qualified_names += contributions.encountered_cpp_enums_qualified_names
+        for key, replacements in contributions.scoped_replacements.items():
+            cache = self._scoped_replacements.setdefault(key, ReplacementsCache())
+            cache.replacement_list.replacements += replacements
+        self.scope_members.update(contributions.scope_members)
+        self.protected_methods_glue_code += contributions.protected_methods_glue_code
+        self.virtual_methods_glue_code += contributions.virtual_methods_glue_code
+        option_matchers(self.options).add_matched_rules_elsewhere(contributions.matched_options_rules)
+
+    def would_read_the_same(self, reads: ContextReads, contributions: ContextContributions) -> bool:
+        """Returns True if processing a header in this context would give the same results as in a fresh context,
+        where it made these reads and these contributions."""
+        for name in reads.scope_members_misses:
+            if name in self.scope_members:
+                return False
+
+        for current_scope, cpp_type_str in reads.enum_types_misses:
+            if self.is_encountered_enum_type(current_scope, cpp_type_str):
+                return False
+
+        for key, value, nb_replacements, value_replaced in reads.replaced_values:
+            if key not in self._scoped_replacements:
+                continue
+            replacements_cache = ReplacementsCache()
+            replacements_cache.replacement_list.replacements = (
+                self._scoped_replacements[key].replacement_list.replacements
+                + contributions.scoped_replacements.get(key, [])[:nb_replacements]
+            )
+            if replacements_cache.apply(value) != value_replaced:
+                return False
+
+        return True
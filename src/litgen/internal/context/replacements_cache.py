@@ -1,18 +1,84 @@
 from __future__ import annotations
+import re
+from typing import Protocol
+
 from codemanip.code_replacements import RegexReplacement, RegexReplacementList
 
+# The pattern of the replacements registered by store_function_name_replacement()
+_FUNCTION_NAME_PATTERN_RE = re.compile(r"\\b(\w+)\(\?=\\s\*\\\(\)")
+_IDENTIFIER_RE = re.compile(r"\w+")
+
+
+def _function_name_pattern(cpp_name: str) -> str:
+    return rf"\b{cpp_name}(?=\s*\()"
+
+
+class _Replacement(Protocol):
+    def apply(self, s: str) -> str: ...
+
+
+class _FunctionNamesReplacement:
+    """Replaces several function names (when followed by a parenthesis) in a single pass.
+
+    Equivalent to applying RegexReplacement(rf"\\b{cpp_name}(?=\\s*\\()", py_name) for each entry, in any order,
+    provided that the python names are identifiers which are not themselves replaced, and that
+    each cpp name is replaced only once (see ReplacementsCache._compile_steps())
+    """
+
+    names: dict[str, str]  # cpp_name -> py_name
+    py_names: set[str]
+    _combined_re: re.Pattern[str] | None
+
+    def __init__(self) -> None:
+        self.names = {}
+        self.py_names = set()
+        self._combined_re = None
+
+    def add(self, cpp_name: str, py_name: str) -> None:
+        self.names[cpp_name] = py_name
+        self.py_names.add(py_name)
+        self._combined_re = None
+
+    def _replace_match(self, match: re.Match[str]) -> str:
+        return self.names[match.group(0)]
+
+    def apply(self, s: str) -> str:
+        if "(" not in s:
+            return s
+        if self._combined_re is None:
+            # longest names first (although the lookahead already prevents a name from matching a prefix of another)
+            alternatives = sorted(self.names.keys(), key=len, reverse=True)
+            self._combined_re = re.compile(r"\b(?:" + "|".join(map(re.escape, alternatives)) + r")(?=\s*\()")
+        return self._combined_re.sub(self._replace_match, s)
+
 
 class ReplacementsCache:
     """
     Store replacements gathered from the code base:
         for example, enum member names, static class members, function names, for which a conversion from
         CamelCase to snake_case might have been applied
+
+    replacement_list is the reference (ordered) list of replacements. apply() uses steps compiled from it,
+    where consecutive function names replacements are grouped into a single pass with a dictionary lookup
+    (namespaces may contain thousands of functions). The steps are recompiled lazily, when the list grew.
+    Note: replacement_list.replacements shall only be appended to (store_replacement(), store_replacements()
+    or +=).
     """
 
+    _MAX_MEMO_SIZE = 16384
+
     replacement_list: RegexReplacementList
 
+    _steps: list[_Replacement]
+    # the list and its length, for which _steps were compiled
+    _steps_source: tuple[list[RegexReplacement], int] | None
+    _memo: dict[str, str]
+
     def __init__(self) -> None:
         self.replacement_list = RegexReplacementList()
+        self._steps = []
+        self._steps_source = None
+        self._memo = {}
 
     def store_replacements(self, replacements: RegexReplacementList) -> None:
         self.replacement_list.merge_replacements(replacements)
@@ -20,5 +86,67 @@ class ReplacementsCache:
     def store_replacement(self, replacement: RegexReplacement) -> None:
         self.replacement_list.replacements.append(replacement)
 
+    def store_function_name_replacement(self, cpp_name: str, py_name: str) -> None:
+        """Replace cpp_name by py_name, when it is followed by a parenthesis (i.e. a function call)"""
+        self.store_replacement(RegexReplacement(_function_name_pattern(cpp_name), py_name))
+
+    def _compile_steps(self) -> None:
+        replacements = self.replacement_list.replacements
+        steps: list[_Replacement] = []
+        function_names: _FunctionNamesReplacement | None = None
+        for replacement in replacements:
+            function_name_match = _FUNCTION_NAME_PATTERN_RE.fullmatch(replacement.replace_what_re.pattern)
+            can_group = (
+                function_name_match is not None
+                and _IDENTIFIER_RE.fullmatch(replacement.by_what) is not None
+                and replacement.replace_what_re.flags == re.UNICODE
+            )
+            if not can_group:
+                function_names = None
+                steps.append(replacement)
+                continue
+            assert function_name_match is not None
+            cpp_name = function_name_match.group(1)
+            py_name = replacement.by_what
+            if function_names is not None and (
+                cpp_name in function_names.py_names or function_names.names.get(cpp_name, py_name) != py_name
+            ):
+                # applied one after the other, these replacements would be chained (or the second one would
+                # have no effect): they shall be applied in separate passes
+                function_names = None
+            if function_names is None:
+                function_names = _FunctionNamesReplacement()
+                steps.append(function_names)
+            function_names.add(cpp_name, py_name)
+        self._steps = steps
+        self._steps_source = (replacements, len(replacements))
+        self._memo = {}
+
     def apply(self, s: str) -> str:
-        return self.replacement_list.apply(s)
+        """Same as self.replacement_list.apply(s)"""
+        replacements = self.replacement_list.replacements
+        if (
+            self._steps_source is None
+            or self._steps_source[0] is not replacements
+            or self._steps_source[1] != len(replacements)
+        ):
+            self._compile_steps()
+
+        r = self._memo.get(s)
+        if r is not None:
+            return r
+
+        previous_s = None
+        r = s
+        max_iterations = 3
+        iteration = 0
+        while previous_s != r and iteration < max_iterations:
+            previous_s = r
+            for step in self._steps:
+                r = step.apply(r)
+            iteration += 1
+
+        if len(self._memo) >= self._MAX_MEMO_SIZE:
+            self._memo.clear()
+        self._memo[s] = r
+        return r
@@ -0,0 +1,52 @@
+from __future__ import annotations
+from typing import Any
+
+
+class TypeToPythonCache:
+    """A memo cache for cpp_to_python.type_to_python(), keyed by the C++ type string.
+
+    The conversion also depends on some options and on the stub namespaces encountered so far.
+    The caller passes a stamp of those (see LitgenContext.validated_type_to_python_cache()): when it changes,
+    the cache is cleared and its generation is incremented.
+    """
+
+    generation: int
+    nb_hits: int
+    nb_misses: int
+    _cache: dict[str, str]
+    _stamp: tuple[Any, ...] | None
+
+    def __init__(self) -> None:
+        self.generation = 0
+        self.nb_hits = 0
+        self.nb_misses = 0
+        self._cache = {}
+        self._stamp = None
+
+    def validate(self, stamp: tuple[Any, ...]) -> None:
+        """Clears the cache if stamp differs from the one of the cached values"""
+        if stamp != self._stamp:
+            if self._stamp is not None:
+                self.generation += 1
+            self._cache = {}
+            self._stamp = stamp
+
+    def get(self, cpp_type_str: str) -> str | None:
+        r = self._cache.get(cpp_type_str)
+        if r is None:
+            self.nb_misses += 1
+        else:
+            self.nb_hits += 1
+        return r
+
+    def store(self, cpp_type_str: str, python_type_str: str) -> None:
+        self._cache[cpp_type_str] = python_type_str
+
+    def stats_string(self) -> str:
+        nb_lookups = self.nb_hits + self.nb_misses
+        if nb_lookups == 0:
+            return ""
+        return (
+            f"type_to_python cache: hits: {self.nb_hits} misses: {self.nb_misses}"
+            f" hit rate: {self.nb_hits / nb_lookups * 100:.0f}% generation: {self.generation}"
+        )
@@ -12,6 +12,7 @@ from srcmlcpp.cpp_types.template.cpp_i_template_host import CppITemplateHost
 
 from litgen import LitgenOptions
 from litgen.internal import LitgenContext
+from litgen.internal.option_matchers import does_match_option
 
 """
 Code utilities for transcription from C++ to Python
@@ -153,6 +154,15 @@ def _strip_callable_param_names(python_type: str) -> str:
 
 
 def type_to_python(lg_context: LitgenContext, cpp_type_str: str) -> str:
+    cache = lg_context.validated_type_to_python_cache()
+    r = cache.get(cpp_type_str)
+    if r is None:
+        r = _type_to_python_impl(lg_context, cpp_type_str)
+        cache.store(cpp_type_str, r)
+    return r
+
+
+def _type_to_python_impl(lg_context: LitgenContext, cpp_type_str: str) -> str:
     options = lg_context.options
     specialized_type_python_name = options.class_template_options.specialized_type_python_name_str(
         cpp_type_str, options.type_replacements
@@ -307,7 +317,7 @@ def qualify_sibling_in_scope(
         if cpp_name in lg_context.options.namespaces_root:
             continue
 
-        scope_entry = lg_context.scope_members.get(cpp_name)
+        scope_entry = lg_context.get_scope_members(cpp_name)
         if not scope_entry:
             continue
         python_prefix = scope_entry.python_scope_name
@@ -644,7 +654,7 @@ def enum_element_is_count(options: LitgenOptions, enum: CppEnum, enum_element: C
     is_class_enum = enum.enum_type == "class"
     value_name = enum_element.decl_name
 
-    if not code_utils.does_match_regex_or_matcher(options.fn_params_buffer_size_names__regex, value_name):
+    if not does_match_option(options, "fn_params_buffer_size_names__regex", value_name):
         return False
 
     if is_class_enum:
@@ -655,7 +665,7 @@ def enum_element_is_count(options: LitgenOptions, enum: CppEnum, enum_element: C
 
 
 def looks_like_size_param(options: LitgenOptions, param_c: CppParameter) -> bool:
-    r = code_utils.does_match_regex_or_matcher(options.fn_params_buffer_size_names__regex, param_c.decl.decl_name)
+    r = does_match_option(options, "fn_params_buffer_size_names__regex", param_c.decl.decl_name)
     return r
 
 
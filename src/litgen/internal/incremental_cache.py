@@ -0,0 +1,296 @@
+"""
+A persistent cache for incremental regeneration (see LitgenOptions.incremental_cache_directory).
+
+For each input header (and each set of options), it stores the code generated for this header, together with
+* its fingerprint: a hash of the header content, of the options and of litgen version
+  (the cached code is only reused if the fingerprint did not change)
+* its contributions to the LitgenContext state which is shared between headers (boxed types, glue code, enums, ...)
+* the reads it made on this shared state (to check whether the previous headers have an influence on it)
+
+Entries are computed by processing the header in a fresh LitgenContext (see LitgenGenerator.process_cpp_files).
+They are stored as json (plain data only), so that reading a cache directory cannot execute code.
+"""
+
+from __future__ import annotations
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import types
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, TYPE_CHECKING
+
+from codemanip.code_replacements import RegexReplacement
+from srcmlcpp.cpp_types.scope.cpp_scope import CppScope, CppScopePart, CppScopeType
+
+from litgen.internal.context.litgen_context import ContextContributions, ContextReads, ScopeMembers
+
+if TYPE_CHECKING:
+    from litgen.litgen_generator import _GeneratedCode
+    from litgen.options import LitgenOptions
+
+_ENTRY_EXTENSION = ".litgen_cache"
+
+
+@dataclass
+class IncrementalCacheEntry:
+    fingerprint: str
+    generated_code: _GeneratedCode
+    contributions: ContextContributions
+    reads: ContextReads
+
+    def to_json_data(self) -> dict[str, Any]:
+        contributions = self.contributions
+        reads = self.reads
+        return {
+            "fingerprint": self.fingerprint,
+            "generated_code": {
+                "source_filename": self.generated_code.source_filename,
+                "pydef_code": self.generated_code.pydef_code,
+                "stub_code": self.generated_code.stub_code,
+            },
+            "contributions": {
+                "encountered_cpp_boxed_types": sorted(contributions.encountered_cpp_boxed_types),
+                "encountered_cpp_enums_qualified_names": contributions.encountered_cpp_enums_qualified_names,
+                "scoped_replacements": {
+                    scope: [[r.replace_what_re.pattern, r.by_what] for r in replacements]
+                    for scope, replacements in contributions.scoped_replacements.items()
+                },
+                "scope_members": {
+                    scope: [members.python_scope_name, sorted(members.member_names)]
+                    for scope, members in contributions.scope_members.items()
+                },
+                "protected_methods_glue_code": contributions.protected_methods_glue_code,
+                "virtual_methods_glue_code": contributions.virtual_methods_glue_code,
+                "matched_options_rules": sorted(contributions.matched_options_rules),
+            },
+            "reads": {
+                "scope_members_misses": sorted(reads.scope_members_misses),
+                "enum_types_misses": [
+                    [[[part.scope_type.value, part.scope_name] for part in scope.scope_parts], type_str]
+                    for scope, type_str in reads.enum_types_misses
+                ],
+                "replaced_values": reads.replaced_values,
+            },
+        }
+
+    @staticmethod
+    def from_json_data(data: dict[str, Any]) -> IncrementalCacheEntry:
+        from litgen.litgen_generator import _GeneratedCode
+
+        contributions = data["contributions"]
+        reads = data["reads"]
+        return IncrementalCacheEntry(
+            fingerprint=data["fingerprint"],
+            generated_code=_GeneratedCode(**data["generated_code"]),
+            contributions=ContextContributions(
+                encountered_cpp_boxed_types=set(contributions["encountered_cpp_boxed_types"]),
+                encountered_cpp_enums_qualified_names=contributions["encountered_cpp_enums_qualified_names"],
+                scoped_replacements={
+                    scope: [RegexReplacement(replace_what, by_what) for replace_what, by_what in replacements]
+                    for scope, replacements in contributions["scoped_replacements"].items()
+                },
+                scope_members={
+                    scope: ScopeMembers(python_scope_name, set(member_names))
+                    for scope, (python_scope_name, member_names) in contributions["scope_members"].items()
+                },
+                protected_methods_glue_code=contributions["protected_methods_glue_code"],
+                virtual_methods_glue_code=contributions["virtual_methods_glue_code"],
+                matched_options_rules=set(contributions["matched_options_rules"]),
+            ),
+            reads=ContextReads(
+                scope_members_misses=set(reads["scope_members_misses"]),
+                enum_types_misses=[
+                    (CppScope([CppScopePart(CppScopeType(scope_type), name) for scope_type, name in parts]), type_str)
+                    for parts, type_str in reads["enum_types_misses"]
+                ],
+                replaced_values=[tuple(replaced_value) for replaced_value in reads["replaced_values"]],  # type: ignore
+            ),
+        )
+
+
+def _code_global_names(code: types.CodeType) -> set[str]:
+    """The names used by a code object and by its nested functions (some of them are globals)"""
+    r = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            r |= _code_global_names(const)
+    return r
+
+
+def _update_digest(h: Any, value: Any, seen: set[int]) -> None:
+    """Updates the hash h with a representation of value which is stable across runs
+    (i.e. it does not depend on memory addresses)"""
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        h.update(repr(value).encode("utf-8", errors="surrogatepass"))
+        return
+    if isinstance(value, Enum):
+        h.update(str(value).encode("utf-8"))
+        return
+    if isinstance(value, re.Pattern):
+        h.update(b"re:" + repr((value.pattern, value.flags)).encode("utf-8", errors="surrogatepass"))
+        return
+
+    if id(value) in seen:
+        h.update(b"<cycle>")
+        return
+    seen.add(id(value))
+
+    if isinstance(value, (list, tuple)):
+        h.update(f"{type(value).__name__}[{len(value)}]".encode("utf-8"))
+        for item in value:
+            _update_digest(h, item, seen)
+    elif isinstance(value, (set, frozenset)):
+        h.update(f"set[{len(value)}]".encode("utf-8"))
+        for item in sorted(value, key=repr):
+            _update_digest(h, item, seen)
+    elif isinstance(value, dict):
+        _update_digest_dict_items(h, value, seen)
+    elif isinstance(value, types.MethodType):
+        _update_digest(h, value.__func__, seen)
+        _update_digest(h, value.__self__, seen)
+    elif isinstance(value, types.FunctionType):
+        h.update(f"function:{value.__module__}.{value.__qualname__}".encode("utf-8"))
+        _update_digest(h, value.__code__, seen)
+        _update_digest(h, value.__defaults__, seen)
+        if value.__closure__ is not None:
+            for cell in value.__closure__:
+                try:
+                    cell_contents = cell.cell_contents
+                except ValueError:  # empty cell
+                    cell_contents = None
+                _update_digest(h, cell_contents, seen)
+        # the values of the globals used by the function (e.g. a module level list of names)
+        global_names = sorted(name for name in _code_global_names(value.__code__) if name in value.__globals__)
+        _update_digest_dict_items(h, {name: value.__globals__[name] for name in global_names}, seen)
+    elif isinstance(value, types.CodeType):
+        h.update(value.co_code)
+        _update_digest(h, value.co_consts, seen)
+        _update_digest(h, value.co_names, seen)
+    elif isinstance(value, (types.BuiltinFunctionType, type, types.ModuleType)):
+        h.update(f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', value.__name__)}".encode("utf-8"))
+    elif hasattr(value, "__dict__") or hasattr(type(value), "__slots__"):
+        h.update(f"object:{type(value).__module__}.{type(value).__qualname__}".encode("utf-8"))
+        members = dict(getattr(value, "__dict__", {}))
+        for cls in type(value).__mro__:
+            slots = cls.__dict__.get("__slots__", ())
+            for slot in [slots] if isinstance(slots, str) else slots:
+                if slot not in ("__dict__", "__weakref__") and hasattr(value, slot):
+                    members[slot] = getattr(value, slot)
+        _update_digest_dict_items(h, members, seen)
+    else:
+        # (other objects, e.g. implemented in C, are identified by their type only)
+        h.update(f"{type(value).__module__}.{type(value).__qualname__}".encode("utf-8"))
+
+
+def _update_digest_dict_items(h: Any, value: dict[Any, Any], seen: set[int]) -> None:
+    # (value may be a temporary dict: it is not added to seen, since its id may be reused by another temporary)
+    h.update(f"dict[{len(value)}]".encode("utf-8"))
+    for key in sorted(value.keys(), key=repr):
+        _update_digest(h, key, seen)
+        _update_digest(h, value[key], seen)
+
+
+def options_digest(options: LitgenOptions) -> str:
+    """A digest of the options, which is stable across runs.
+    Callables (regex matchers, callbacks, ...) are identified by their name, their code, and the values
+    of their defaults, closure cells and referenced globals. Objects implemented in C without attributes
+    are only identified by their type."""
+    options_values = dict(vars(options))
+    options_values.pop("incremental_cache_directory", None)
+    h = hashlib.sha256()
+    _update_digest(h, options_values, set())
+    return h.hexdigest()
+
+
+_LITGEN_VERSION_FINGERPRINT: str | None = None
+
+
+def litgen_version_fingerprint() -> str:
+    """The version of litgen, completed by a hash of the sources of litgen, srcmlcpp and codemanip
+    (so that the cache is invalidated when working on a development version)"""
+    global _LITGEN_VERSION_FINGERPRINT
+    if _LITGEN_VERSION_FINGERPRINT is None:
+        from importlib import metadata
+
+        try:
+            version = metadata.version("litgen")
+        except metadata.PackageNotFoundError:
+            version = "dev"
+
+        h = hashlib.sha256()
+        src_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+        for package in ("litgen", "srcmlcpp", "codemanip"):
+            for root, dirs, files in os.walk(os.path.join(src_dir, package)):
+                dirs[:] = sorted(d for d in dirs if d not in ("tests", "integration_tests", "__pycache__"))
+                for filename in sorted(files):
+                    if filename.endswith(".py"):
+                        with open(os.path.join(root, filename), "rb") as f:
+                            h.update(filename.encode("utf-8"))
+                            h.update(f.read())
+        _LITGEN_VERSION_FINGERPRINT = version + "-" + h.hexdigest()[:16]
+    return _LITGEN_VERSION_FINGERPRINT
+
+
+class IncrementalCache:
+    directory: str
+    nb_hits: int = 0
+    nb_misses: int = 0
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def fingerprint(options_digest_str: str, filename: str, code: str) -> str:
+        h = hashlib.sha256()
+        for part in (litgen_version_fingerprint(), options_digest_str, os.path.realpath(filename)):
+            h.update(part.encode("utf-8", errors="surrogatepass"))
+            h.update(b"\0")
+        h.update(code.encode("utf-8", errors="surrogatepass"))
+        return h.hexdigest()
+
+    def _entry_path(self, options_digest_str: str, filename: str) -> str:
+        """One entry per header and per set of options (so that several sets of options,
+        e.g. for pybind11 and nanobind, can share a cache directory without overwriting each other's entries)"""
+        h = hashlib.sha256()
+        h.update(options_digest_str.encode("utf-8"))
+        h.update(b"\0")
+        h.update(os.path.realpath(filename).encode("utf-8", errors="surrogatepass"))
+        return os.path.join(self.directory, h.hexdigest() + _ENTRY_EXTENSION)
+
+    def get(self, options_digest_str: str, filename: str, fingerprint: str) -> IncrementalCacheEntry | None:
+        """Returns the cached entry for this header, if its fingerprint did not change"""
+        try:
+            with open(self._entry_path(options_digest_str, filename), encoding="utf-8") as f:
+                entry = IncrementalCacheEntry.from_json_data(json.load(f))
+        except Exception:  # missing or corrupted entry, or entry from an incompatible version
+            self.nb_misses += 1
+            return None
+        if entry.fingerprint != fingerprint:
+            self.nb_misses += 1
+            return None
+        self.nb_hits += 1
+        return entry
+
+    def store(self, options_digest_str: str, filename: str, entry: IncrementalCacheEntry) -> None:
+        # write to a temporary file, then rename, so that concurrent runs never read a partial entry
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError as e:
+            logging.warning(f"IncrementalCache: could not store entry for {filename} in {self.directory} ({e})")
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry.to_json_data(), f)
+            os.replace(tmp_path, self._entry_path(options_digest_str, filename))
+        except (OSError, TypeError, ValueError) as e:
+            logging.warning(f"IncrementalCache: could not store entry for {filename} in {self.directory} ({e})")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def stats_string(self) -> str:
+        return f"litgen incremental cache: hits: {self.nb_hits} misses: {self.nb_misses}"
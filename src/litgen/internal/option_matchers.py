@@ -0,0 +1,192 @@
+"""
+A registry of the matching rules of LitgenOptions (i.e. the options whose name ends with "__regex",
+such as fn_exclude_by_name__regex), which memoizes their results.
+
+The same rules are evaluated over and over against the same names (function names, types, class names, ...):
+each (rule, word) pair is evaluated only once. The registry also counts the matches of each rule,
+so that the rules which never matched anything can be reported (they may be obsolete, or contain a typo).
+
+The rules are passed by name (e.g. `does_match_option(options, "fn_exclude_by_name__regex", word)`):
+the names are typed as OptionRuleName, so that a misspelled rule is detected by the type checker.
+
+Note: callable rules are also memoized: they are expected to return the same result for the same word.
+"""
+
+from __future__ import annotations
+import weakref
+from collections.abc import Hashable
+from typing import TYPE_CHECKING, Literal, get_args
+
+from codemanip import code_utils
+from codemanip.code_utils import RegexOrMatcher
+
+if TYPE_CHECKING:
+    from litgen.options import LitgenOptions
+
+
+# The names of the rules of LitgenOptions
+OptionRuleName = Literal[
+    "class_copy__regex",
+    "class_create_default_named_ctor__regex",
+    "class_deep_copy__regex",
+    "class_dynamic_attributes__regex",
+    "class_exclude_by_name__regex",
+    "class_expose_protected_methods__regex",
+    "class_held_as_shared__regex",
+    "class_override_virtual_methods_in_python__regex",
+    "enum_exclude_by_name__regex",
+    "enum_make_arithmetic__regex",
+    "enum_make_flag__regex",
+    "fn_add_gil_scoped_release_guard__regex",
+    "fn_exclude_by_name__regex",
+    "fn_exclude_by_param_type__regex",
+    "fn_force_lambda__regex",
+    "fn_force_overload__regex",
+    "fn_namespace_vectorize__regex",
+    "fn_params_adapt_mutable_param_with_default_value__regex",
+    "fn_params_buffer_size_names__regex",
+    "fn_params_exclude_names__regex",
+    "fn_params_exclude_types__regex",
+    "fn_params_output_modifiable_immutable_to_return__regex",
+    "fn_params_replace_buffer_by_array__regex",
+    "fn_params_replace_c_array_const_by_std_array__regex",
+    "fn_params_replace_c_array_modifiable_by_boxed__regex",
+    "fn_params_replace_c_string_list__regex",
+    "fn_params_replace_modifiable_immutable_by_boxed__regex",
+    "fn_return_force_policy_reference_for_pointers__regex",
+    "fn_return_force_policy_reference_for_references__regex",
+    "fn_vectorize__regex",
+    "globals_vars_include_by_name__regex",
+    "macro_define_include_by_name__regex",
+    "member_exclude_by_name__regex",
+    "member_exclude_by_type__regex",
+    "member_numeric_c_array_replace__regex",
+    "member_readonly_by_name__regex",
+    "member_readonly_by_type__regex",
+    "namespace_exclude__regex",
+    "struct_create_default_named_ctor__regex",
+]
+
+
+def option_rule_names() -> list[str]:
+    """The names of the rules of LitgenOptions (see OptionRuleName)"""
+    return list(get_args(OptionRuleName))
+
+
+def _rule_key(rule: RegexOrMatcher) -> Hashable:
+    """The memos are indexed by the rules themselves (unhashable callables are indexed by their id:
+    the memo keeps a reference to them, so that their id cannot be reused)"""
+    if isinstance(rule, Hashable):
+        return rule
+    return ("id", id(rule))
+
+
+class OptionMatchers:
+    """The matchers for the rules of a LitgenOptions (see option_matchers())
+
+    The results are memoized by rule value (so that a modified rule is evaluated again,
+    and rules with the same value share their results), while the matches are counted by rule name.
+    """
+
+    nb_hits: int
+    nb_misses: int
+    _options: LitgenOptions
+    # rule key -> (rule, {word: result})
+    _memos: dict[Hashable, tuple[RegexOrMatcher, dict[str, bool]]]
+    _nb_matches: dict[str, int]  # rule name -> number of matches
+    # The names of the rules which matched in another process, or in a header reused from the incremental cache
+    _matched_rules_elsewhere: set[str]
+
+    def __init__(self, options: LitgenOptions) -> None:
+        self.nb_hits = 0
+        self.nb_misses = 0
+        self._options = options
+        self._memos = {}
+        self._nb_matches = {}
+        self._matched_rules_elsewhere = set()
+
+    def does_match(self, rule_name: OptionRuleName, word: str) -> bool:
+        """Same as code_utils.does_match_regex_or_matcher(options.<rule_name>, word)"""
+        rule = getattr(self._options, rule_name)
+        key = _rule_key(rule)
+        rule_memo = self._memos.get(key)
+        if rule_memo is None:
+            rule_memo = (rule, {})
+            self._memos[key] = rule_memo
+        memo = rule_memo[1]
+
+        r = memo.get(word)
+        if r is not None:
+            self.nb_hits += 1
+        else:
+            self.nb_misses += 1
+            r = code_utils.does_match_regex_or_matcher(rule, word)
+            memo[word] = r
+        if r:
+            self._nb_matches[rule_name] = self._nb_matches.get(rule_name, 0) + 1
+        return r
+
+    def matches_counts(self) -> dict[str, int]:
+        """The number of matches of each rule (by rule name), in this process"""
+        return dict(self._nb_matches)
+
+    def add_matched_rules_elsewhere(self, rule_names: set[str]) -> None:
+        """Records the rules which matched in another process, or in a header reused from the incremental cache"""
+        self._matched_rules_elsewhere |= rule_names
+
+    def never_matched_rules(self) -> list[str]:
+        """The names of the rules which were set (i.e. which differ from their default value, and are not "")
+        but never matched anything"""
+        default_options = _default_options()
+        r = []
+        for rule_name in option_rule_names():
+            rule = getattr(self._options, rule_name)
+            if isinstance(rule, str) and len(rule) == 0:
+                continue
+            if rule == getattr(default_options, rule_name):
+                continue
+            if rule_name not in self._nb_matches and rule_name not in self._matched_rules_elsewhere:
+                r.append(rule_name)
+        return r
+
+    def stats_string(self) -> str:
+        nb_lookups = self.nb_hits + self.nb_misses
+        if nb_lookups == 0:
+            return ""
+        return (
+            f"options rules matchers: hits: {self.nb_hits} misses: {self.nb_misses}"
+            f" hit rate: {self.nb_hits / nb_lookups * 100:.0f}%"
+        )
+
+
+_DEFAULT_OPTIONS: LitgenOptions | None = None
+
+
+def _default_options() -> LitgenOptions:
+    global _DEFAULT_OPTIONS
+    if _DEFAULT_OPTIONS is None:
+        from litgen.options import LitgenOptions
+
+        _DEFAULT_OPTIONS = LitgenOptions()
+    return _DEFAULT_OPTIONS
+
+
+# The matchers of the LitgenOptions instances.
+# They are stored outside the instances, so that they are not copied, pickled or hashed with them
+_OPTION_MATCHERS: weakref.WeakKeyDictionary[LitgenOptions, OptionMatchers] = weakref.WeakKeyDictionary()
+
+
+def option_matchers(options: LitgenOptions) -> OptionMatchers:
+    """The matchers registry for these options (created on first use)"""
+    r = _OPTION_MATCHERS.get(options)
+    if r is None:
+        r = OptionMatchers(options)
+        _OPTION_MATCHERS[options] = r
+    return r
+
+
+def does_match_option(options: LitgenOptions, rule_name: OptionRuleName, word: str) -> bool:
+    """Returns True if word matches the rule options.<rule_name> (with memoization)
+    Example: does_match_option(options, "fn_exclude_by_name__regex", "foo")
+    """
+    return option_matchers(options).does_match(rule_name, word)
@@ -11,7 +11,7 @@ from dataclasses import dataclass
 
 def _cpp_types_list_str_to_cpp_types(cpp_types_list_str: list[str]) -> list[CppType]:
     options = srcmlcpp.SrcmlcppOptions()
-    cpp_types_list = [srcmlcpp.code_to_cpp_type(options, cpp_type_str) for cpp_type_str in cpp_types_list_str]
+    cpp_types_list = srcmlcpp.code_to_cpp_types(options, cpp_types_list_str)
     return cpp_types_list
 
 
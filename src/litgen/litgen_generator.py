@@ -1,18 +1,23 @@
 from __future__ import annotations
 import logging
+import multiprocessing
 import os
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 
 from codemanip import code_utils
 
 from srcmlcpp.internal.code_to_srcml import _SRCML_CALLER
+from srcmlcpp.srcmlcpp_main import _CPP_TYPE_PARSE_CACHE, clear_parse_caches
 
 from litgen import LitgenOptions, BindLibraryType
 from litgen.code_to_adapted_unit import code_to_adapted_unit_in_context
 from litgen.internal import boxed_python_type, cpp_to_python
-from litgen.internal.context.litgen_context import LitgenContext
+from litgen.internal.incremental_cache import IncrementalCache, IncrementalCacheEntry, options_digest
+from litgen.internal.option_matchers import option_matchers
+from litgen.internal.context.litgen_context import LitgenContext, ContextContributions, ContextReads
 
 CppFilename = str
 CppCode = str
@@ -74,10 +79,17 @@ class _GeneratedCode:
     stub_code: PythonCode
 
 
+# boxed types, cpp_indent_size, cpp_indent_with_tabs, bind_library
+_BoxedTypesCacheKey = tuple[frozenset[str], int, bool, BindLibraryType]
+
+
 class LitgenGenerator:
     lg_context: LitgenContext
     _generated_codes: list[_GeneratedCode]
     omit_boxed_types: bool
+    _incremental_cache_: IncrementalCache | None = None
+    # (key, generated code) for the boxed types (see _boxed_types_generated_code)
+    _boxed_types_generated_code_cache: tuple[_BoxedTypesCacheKey, _GeneratedCode] | None = None
 
     def __init__(self, options: LitgenOptions, omit_boxed_types: bool = False) -> None:
         self.lg_context = LitgenContext(options)
@@ -85,9 +97,88 @@ class LitgenGenerator:
         self._generated_codes = []
 
     def process_cpp_file(self, filename: str) -> None:
+        if self.options().incremental_cache_directory is not None:
+            self.process_cpp_files([filename])
+        else:
+            self._process_cpp_file_sequentially(filename)
+
+    def _process_cpp_file_sequentially(self, filename: str) -> None:
         code = _read_code(self.lg_context.options, filename)
         self.process_cpp_code(code, filename)
 
+    def process_cpp_files(self, filenames: list[str], jobs: int = 1) -> None:
+        """Processes several headers; the result is identical to calling process_cpp_file for each of them.
+
+        If jobs > 1 (or jobs <= 0: one job per cpu), the headers are first processed in parallel
+        (in a pool of processes), each in a fresh context. Then, the results are merged in the order of filenames:
+        a header whose processing read some state that was modified by the previous headers
+        (for example an enum defined in a previous header) is processed again, sequentially.
+
+        If options.incremental_cache_directory is set, the results of the processing of each header
+        in a fresh context are stored in this directory, and reused when the header did not change.
+        """
+        if jobs <= 0:
+            jobs = os.cpu_count() or 1
+        incremental_cache = self._incremental_cache()
+        if incremental_cache is None and (min(jobs, len(filenames)) <= 1 or not _can_fork()):
+            for filename in filenames:
+                self._process_cpp_file_sequentially(filename)
+            return
+
+        results: list[_FreshContextResult | None] = [None for _ in filenames]
+        fingerprints = ["" for _ in filenames]
+        digest = ""
+        if incremental_cache is not None:
+            digest = options_digest(self.options())
+            for i, filename in enumerate(filenames):
+                code = _read_code(self.options(), filename)
+                fingerprints[i] = IncrementalCache.fingerprint(digest, filename, code)
+                entry = incremental_cache.get(digest, filename, fingerprints[i])
+                if entry is not None:
+                    results[i] = (entry.generated_code, entry.contributions, entry.reads)
+
+        missing_indexes = [i for i, result in enumerate(results) if result is None]
+        missing_results = self._process_cpp_files_in_fresh_contexts([filenames[i] for i in missing_indexes], jobs)
+        for i, missing_result in zip(missing_indexes, missing_results):
+            results[i] = missing_result
+            if incremental_cache is not None:
+                incremental_cache.store(digest, filenames[i], IncrementalCacheEntry(fingerprints[i], *missing_result))
+
+        for filename, result in zip(filenames, results):
+            assert result is not None
+            generated_code, contributions, reads = result
+            if self.lg_context.would_read_the_same(reads, contributions):
+                self._generated_codes.append(generated_code)
+                self.lg_context.apply_contributions(contributions)
+            else:
+                self._process_cpp_file_sequentially(filename)
+
+    def _process_cpp_files_in_fresh_contexts(self, filenames: list[str], jobs: int) -> list[_FreshContextResult]:
+        if min(jobs, len(filenames)) <= 1 or not _can_fork():
+            return [
+                _process_cpp_file_in_fresh_context(self.options(), self.omit_boxed_types, filename)
+                for filename in filenames
+            ]
+
+        global _PARALLEL_WORKER_GENERATOR
+        _PARALLEL_WORKER_GENERATOR = self
+        try:
+            # The workers inherit the options by forking: options may contain callables, which cannot be pickled
+            with ProcessPoolExecutor(
+                max_workers=min(jobs, len(filenames)), mp_context=multiprocessing.get_context("fork")
+            ) as executor:
+                return list(executor.map(_process_cpp_file_in_worker, filenames))
+        finally:
+            _PARALLEL_WORKER_GENERATOR = None
+
+    def _incremental_cache(self) -> IncrementalCache | None:
+        directory = self.options().incremental_cache_directory
+        if directory is None:
+            return None
+        if self._incremental_cache_ is None or self._incremental_cache_.directory != directory:
+            self._incremental_cache_ = IncrementalCache(directory)
+        return self._incremental_cache_
+
     def write_generated_code(
         self, output_cpp_pydef_file: str, output_stub_pyi_file: str, output_cpp_glue_code_file: str = ""
     ) -> None:
@@ -125,6 +216,16 @@ class LitgenGenerator:
     def options(self) -> LitgenOptions:
         return self.lg_context.options
 
+    def never_matched_options_rules(self) -> list[str]:
+        """The names of the options rules (e.g. "fn_exclude_by_name__regex") which were set (i.e. which differ
+        from their default value), but never matched anything in the headers processed so far
+        (they may be obsolete, or contain a typo).
+
+        Note: the rules matched by the headers processed by parallel workers, or reused from the incremental cache,
+        are merged with their contributions (see ContextContributions.matched_options_rules).
+        """
+        return option_matchers(self.options()).never_matched_rules()
+
     def has_boxed_types(self) -> bool:
         return len(self.lg_context.encountered_cpp_boxed_types) > 0
 
@@ -200,6 +301,19 @@ class LitgenGenerator:
             return None
         if not self.has_boxed_types():
             return None
+
+        # The generation of the boxed types code is memoized: it is only redone when the boxed types change
+        cache_key = (
+            frozenset(self.lg_context.encountered_cpp_boxed_types),
+            self.options().cpp_indent_size,
+            self.options().cpp_indent_with_tabs,
+            self.options().bind_library,
+        )
+        if self._boxed_types_generated_code_cache is not None:
+            cached_key, cached_generated_code = self._boxed_types_generated_code_cache
+            if cached_key == cache_key:
+                return cached_generated_code
+
         boxed_types_cpp_code = self._boxed_types_cpp_code()
 
         standalone_options = LitgenOptions()
@@ -212,6 +326,7 @@ class LitgenGenerator:
         stub_code = adapted_unit.str_stub()
         pydef_code = adapted_unit.str_pydef()
         generated_code = _GeneratedCode("BoxedTypes", stub_code=stub_code, pydef_code=pydef_code)
+        self._boxed_types_generated_code_cache = (cache_key, generated_code)
         return generated_code
 
     def _generated_codes_with_boxed_types(self) -> list[_GeneratedCode]:
@@ -223,6 +338,44 @@ class LitgenGenerator:
             return r
 
 
+# The result of the processing of a header in a fresh context
+_FreshContextResult = tuple[_GeneratedCode, ContextContributions, ContextReads]
+
+
+def _process_cpp_file_in_fresh_context(
+    options: LitgenOptions, omit_boxed_types: bool, filename: str
+) -> _FreshContextResult:
+    generator = LitgenGenerator(options, omit_boxed_types)
+    lg_context = generator.lg_context
+    lg_context.recorded_reads = ContextReads()
+    snapshot = lg_context.state_snapshot()
+    matchers = option_matchers(options)
+    matches_counts_before = matchers.matches_counts()
+    generator._process_cpp_file_sequentially(filename)
+    contributions = lg_context.contributions_since(snapshot)
+    contributions.matched_options_rules = {
+        rule_name
+        for rule_name, nb_matches in matchers.matches_counts().items()
+        if nb_matches > matches_counts_before.get(rule_name, 0)
+    }
+    return generator._generated_codes[0], contributions, lg_context.recorded_reads
+
+
+def _can_fork() -> bool:
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+# The generator used by the workers of LitgenGenerator.process_cpp_files (inherited when forking)
+_PARALLEL_WORKER_GENERATOR: LitgenGenerator | None = None
+
+
+def _process_cpp_file_in_worker(filename: str) -> _FreshContextResult:
+    assert _PARALLEL_WORKER_GENERATOR is not None
+    return _process_cpp_file_in_fresh_context(
+        _PARALLEL_WORKER_GENERATOR.options(), _PARALLEL_WORKER_GENERATOR.omit_boxed_types, filename
+    )
+
+
 def write_generated_code_for_files(
     options: LitgenOptions,
     input_cpp_header_files: list[str],
@@ -230,14 +383,38 @@ def write_generated_code_for_files(
     output_stub_pyi_file: str = "",
     output_cpp_glue_code_file: str = "",
     omit_boxed_types: bool = False,
+    jobs: int = 1,
+    checkpoint_every_nb_files: int = 0,
 ) -> None:
+    """Generates the code for all the headers, and writes each output file once, at the end.
+
+    jobs: number of headers processed in parallel (see LitgenGenerator.process_cpp_files)
+    checkpoint_every_nb_files: if > 0, the output files are also written after each group of
+        checkpoint_every_nb_files headers (so that the work done is not lost if a later header fails)
+    """
+    if len(input_cpp_header_files) == 0:
+        return
+    clear_parse_caches()
     generator = LitgenGenerator(options, omit_boxed_types)
-    for cpp_header in input_cpp_header_files:
-        generator.process_cpp_file(cpp_header)
-        generator.write_generated_code(output_cpp_pydef_file, output_stub_pyi_file, output_cpp_glue_code_file)
+    if checkpoint_every_nb_files > 0:
+        headers_groups = [
+            input_cpp_header_files[i : i + checkpoint_every_nb_files]
+            for i in range(0, len(input_cpp_header_files), checkpoint_every_nb_files)
+        ]
+    else:
+        headers_groups = [input_cpp_header_files]
+    for i, headers_group in enumerate(headers_groups):
+        generator.process_cpp_files(headers_group, jobs)
+        is_last_group = i == len(headers_groups) - 1
+        if not is_last_group:
+            generator.write_generated_code(output_cpp_pydef_file, output_stub_pyi_file, output_cpp_glue_code_file)
+    generator.write_generated_code(output_cpp_pydef_file, output_stub_pyi_file, output_cpp_glue_code_file)
 
     if _SRCML_CALLER.total_time() > 3.0 and options.srcmlcpp_options.flag_show_progress:
         print(_SRCML_CALLER.profiling_stats())
+        print(_CPP_TYPE_PARSE_CACHE.stats_string())
+        print(generator.lg_context.type_to_python_cache.stats_string())
+        print(option_matchers(options).stats_string())
 
 
 def write_generated_code_for_file(
@@ -266,6 +443,7 @@ class GeneratedCodes:
 
 
 def generate_code(options: LitgenOptions, code: CppCode, omit_boxed_types: bool = False) -> GeneratedCodes:
+    clear_parse_caches()
     generator = LitgenGenerator(options, omit_boxed_types)
     generator.process_cpp_code(code, "")
     r = GeneratedCodes(
@@ -277,6 +455,7 @@ def generate_code(options: LitgenOptions, code: CppCode, omit_boxed_types: bool
 
 
 def generate_code_for_file(options: LitgenOptions, filename: str, omit_boxed_types: bool = False) -> GeneratedCodes:
+    clear_parse_caches()
     generator = LitgenGenerator(options, omit_boxed_types)
     generator.process_cpp_file(filename)
     r = GeneratedCodes(
@@ -673,6 +673,16 @@ class LitgenOptions:
     postprocess_stub_function: Callable[[str], str] | None = None  # run at the very end
     postprocess_pydef_function: Callable[[str], str] | None = None
 
+    ################################################################################
+    #    <Incremental regeneration>
+    ################################################################################
+    # If not None, the code generated for each header is stored in this directory, together with a fingerprint
+    # of the header (its content, the options and litgen version). When regenerating, the headers whose fingerprint
+    # did not change are not processed again (see LitgenGenerator.process_cpp_files).
+    # Note: the callables in the options (regex matchers, callbacks) are fingerprinted by their code, and by the values
+    # of their defaults, closures and referenced globals (not by the state of the objects they may call).
+    incremental_cache_directory: str | None = None
+
     ################################################################################
     #    <custom binding code>
     #  inject custom binding code which you write yourself
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass
+import importlib
 from typing import Optional
 
 from codemanip import code_utils
@@ -19,7 +20,9 @@ class AdaptedFunction2(CppFunctionDecl):
     lambda_to_call: Optional[str] = None
 
     def __init__(self, function_infos: CppFunctionDecl, parent_struct_name: str):
-        self.__dict__ = {**function_infos.__dict__, **self.__dict__}
+        # CppFunctionDecl uses __slots__: copy its members one by one
+        for name, value in function_infos._members().items():
+            setattr(self, name, value)
         self.function_infos = function_infos
         self.parent_struct_name = parent_struct_name
         self.cpp_adapter_code = None
@@ -76,3 +79,70 @@ def test_lambda_correctly_returns_reference():
             ;
     """,
     )
+
+
+def test_prefetch_constructors_wrappers(monkeypatch) -> None:  # type: ignore
+    from litgen.internal.adapt_function_params.apply_all_adapters import prefetch_constructors_wrappers
+
+    prefetched_codes: list[str] = []
+    monkeypatch.setattr(srcmlcpp_main, "prefetch_code_snippets", lambda _options, codes: prefetched_codes.extend(codes))
+
+    code = """
+    struct A { A(int a); A(double a); private: A(const char* s); };
+    struct Excluded { Excluded(int a); Excluded(double a); };
+    namespace { struct B { B(int b); B(double b); }; }
+    """
+    options = litgen.LitgenOptions()
+    options.class_exclude_by_name__regex = "^Excluded$"
+    cpp_unit = srcmlcpp.code_to_cpp_unit(options.srcmlcpp_options, code)
+    prefetch_constructors_wrappers(options, cpp_unit)
+    # Only the constructors that will be adapted are prefetched
+    assert prefetched_codes == [
+        "std::unique_ptr<A> ctor_wrapper(int a);",
+        "std::unique_ptr<A> ctor_wrapper(double a);",
+    ]
+
+
+def test_prefetch_constructors_wrappers_matches_adaptation(monkeypatch) -> None:  # type: ignore
+    # The prefetched constructors shall be exactly those that are adapted
+    # (litgen.internal.adapt_function_params.apply_all_adapters is shadowed by the function of the same name)
+    apply_all_adapters_module = importlib.import_module("litgen.internal.adapt_function_params.apply_all_adapters")
+
+    prefetched_codes: list[str] = []
+    monkeypatch.setattr(srcmlcpp_main, "prefetch_code_snippets", lambda _options, codes: prefetched_codes.extend(codes))
+
+    adapted_codes: list[str] = []
+    apply_on_constructor = apply_all_adapters_module._apply_all_adapters_on_constructor
+
+    def record_adapted_constructor(adapted_function):  # type: ignore
+        signature_code, _ = apply_all_adapters_module._ctor_wrapper_codes(
+            adapted_function.options, adapted_function.cpp_element()
+        )
+        adapted_codes.append(signature_code)
+        apply_on_constructor(adapted_function)
+
+    monkeypatch.setattr(apply_all_adapters_module, "_apply_all_adapters_on_constructor", record_adapted_constructor)
+
+    code = """
+    struct A { A(int a); A(double a); private: A(const char* s); };
+    struct Excluded { Excluded(int a); Excluded(double a); };
+    namespace { struct B { B(int b); B(double b); }; }
+    namespace ExcludedNs { struct C { C(int c); C(double c); }; }
+    struct D { D(int d); D(double d); D(float d); };
+    struct P { protected: P(int p); P(double p); };
+    struct Q { protected: Q(int q); Q(double q); };
+    struct Outer {
+        struct Inner { Inner(int i); Inner(double i); };
+    private:
+        struct Hidden { Hidden(int h); Hidden(double h); };
+    };
+    """
+    options = litgen.LitgenOptions()
+    options.class_exclude_by_name__regex = "^Excluded$"
+    options.namespace_exclude__regex = "^ExcludedNs$"
+    options.member_exclude_by_name_and_class__regex = {"D": "^D$"}
+    options.class_expose_protected_methods__regex = "^P$"
+    litgen.code_to_adapted_unit(options, code)
+
+    assert len(adapted_codes) == 6
+    assert sorted(prefetched_codes) == sorted(adapted_codes)
@@ -172,3 +172,30 @@ def test_enum_int():
             b = enum.auto() # (= 1)
         """,
     )
+
+
+def test_enum_replacements_cache():
+    options = litgen.LitgenOptions()
+    lg_context = LitgenContext(options)
+    code = """
+    enum Foo
+    {
+        Foo_a,
+        Foo_b,
+        Foo_ab = Foo_a | Foo_b,
+        Other = Foo_ab + 1,
+    };
+    """
+    enum = srcmlcpp_main.code_first_enum(options.srcmlcpp_options, code)
+    adapted_enum = AdaptedEnum(lg_context, enum)
+
+    # The replacement tables are computed once
+    replacements = adapted_enum.cpp_to_python_replacements(from_inside_block=True)
+    assert adapted_enum.cpp_to_python_replacements(from_inside_block=True) is replacements
+    assert len(replacements.replacements) == 4
+    assert len(adapted_enum.cpp_to_python_replacements().replacements) == 3  # Other is only replaced inside the enum
+
+    # And applied in a single pass, with the same result as applying them one after the other
+    for value in ["Foo_a | Foo_b", "Foo_ab + Other", "Foo_abc", "(Other)"]:
+        assert adapted_enum.apply_cpp_to_python_replacements(value, from_inside_block=True) == replacements.apply(value)
+    assert adapted_enum.apply_cpp_to_python_replacements("Foo_ab + Other", True) == "Foo.ab + Foo.other"
@@ -105,3 +105,22 @@ def test_const_vs_non_const():
         ////////////////////    </generated_from:file.h>    ////////////////////
     """,
     )
+
+
+def test_boxed_types_generated_code_memoized():
+    options = litgen.LitgenOptions()
+    options.fn_params_replace_modifiable_immutable_by_boxed__regex = ".*"
+    generator = LitgenGenerator(options)
+    generator.process_cpp_code("void foo(std::string& s);", "file1.h")
+
+    boxed_code = generator._boxed_types_generated_code()
+    assert boxed_code is not None
+    _ = generator.pydef_code()
+    _ = generator.stub_code()
+    assert generator._boxed_types_generated_code() is boxed_code
+
+    # A new boxed type invalidates the memoized code
+    generator.process_cpp_code("void bar(int& v);", "file2.h")
+    new_boxed_code = generator._boxed_types_generated_code()
+    assert new_boxed_code is not None and new_boxed_code is not boxed_code
+    assert "BoxedInt" in new_boxed_code.pydef_code
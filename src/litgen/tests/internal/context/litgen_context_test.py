@@ -136,3 +136,52 @@ def test_context_replacements():
         # </submodule inner>
         """,
     )
+
+
+def test_replacements_cache_function_names():
+    from codemanip.code_replacements import RegexReplacement
+    from litgen.internal.context.replacements_cache import ReplacementsCache, _FunctionNamesReplacement
+
+    cache = ReplacementsCache()
+    cache.store_function_name_replacement("DefaultValue", "default_value")
+    cache.store_function_name_replacement("MakeFoo", "make_foo")
+    cache.store_replacement(RegexReplacement(r"\bMode::Start\b", "Mode.start"))
+    cache.store_function_name_replacement("Start", "start")
+    cache.store_function_name_replacement("Start", "start")  # an overload
+
+    # consecutive function names replacements are grouped in a single step
+    values = ["MakeFoo(DefaultValue(), Mode::Start)", "Start ()", "DefaultValue", "MyMakeFoo()", "Start(MakeFoo())"]
+    for value in values:
+        assert cache.apply(value) == cache.replacement_list._apply_without_engine(value)
+    assert cache.apply(values[0]) == "make_foo(default_value(), Mode.start)"
+    assert len(cache._steps) == 3
+    assert isinstance(cache._steps[0], _FunctionNamesReplacement)
+
+    # chained replacements are not grouped
+    cache.store_function_name_replacement("start", "start_")
+    assert cache.apply("Start()") == cache.replacement_list._apply_without_engine("Start()") == "start_()"
+    assert len(cache._steps) == 4
+
+
+def test_type_to_python_cache():
+    from litgen.internal import cpp_to_python
+    from litgen.internal.context.litgen_context import LitgenContext
+
+    options = LitgenOptions()
+    lg_context = LitgenContext(options)
+    cache = lg_context.type_to_python_cache
+
+    assert cpp_to_python.type_to_python(lg_context, "Inner::Foo") == "Inner.Foo"
+    assert cpp_to_python.type_to_python(lg_context, "Inner::Foo") == "Inner.Foo"
+    assert (cache.nb_hits, cache.nb_misses, cache.generation) == (1, 1, 0)
+
+    # The cache is invalidated when the stub namespaces change
+    lg_context.namespaces_stub.register_namespace_creation("Inner")
+    assert cpp_to_python.type_to_python(lg_context, "Inner::Foo") == "inner.Foo"
+    assert (cache.nb_hits, cache.nb_misses, cache.generation) == (1, 2, 1)
+
+    # or when the options change
+    options.type_replacements.add_last_replacement(r"\bFoo\b", "Bar")
+    assert cpp_to_python.type_to_python(lg_context, "Inner::Foo") == "inner.Bar"
+    assert cache.generation == 2
+    assert "hit rate: 25%" in cache.stats_string()
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import litgen
+from litgen.internal.option_matchers import does_match_option, option_matchers, option_rule_names
+
+
+def test_option_matchers():
+    options = litgen.LitgenOptions()
+    options.fn_exclude_by_name__regex = r"^Private"
+    options.class_exclude_by_name__regex = lambda name: name.endswith("Impl")
+    matchers = option_matchers(options)
+    assert option_matchers(options) is matchers
+
+    assert does_match_option(options, "fn_exclude_by_name__regex", "PrivateFoo")
+    assert does_match_option(options, "fn_exclude_by_name__regex", "PrivateFoo")
+    assert not does_match_option(options, "fn_exclude_by_name__regex", "Foo")
+    assert not does_match_option(options, "class_exclude_by_name__regex", "Foo")
+    assert (matchers.nb_hits, matchers.nb_misses) == (1, 3)
+
+    # The empty regex matches nothing
+    assert not does_match_option(options, "fn_force_lambda__regex", "Foo")
+
+    # Modified rules are taken into account
+    options.fn_exclude_by_name__regex = r"^Foo$"
+    assert does_match_option(options, "fn_exclude_by_name__regex", "Foo")
+    assert not does_match_option(options, "fn_exclude_by_name__regex", "PrivateFoo")
+
+    # Rules that are set, but never matched anything
+    never_matched = matchers.never_matched_rules()
+    assert "class_exclude_by_name__regex" in never_matched
+    assert "fn_exclude_by_name__regex" not in never_matched
+    assert "fn_force_lambda__regex" not in never_matched  # not set
+    assert "namespace_exclude__regex" not in never_matched  # default value
+
+
+def test_option_rule_names():
+    # OptionRuleName lists all the rules of LitgenOptions
+    options = litgen.LitgenOptions()
+    rule_names = [
+        name
+        for name in dir(options)
+        if name.endswith("__regex") and (isinstance(getattr(options, name), str) or callable(getattr(options, name)))
+    ]
+    assert sorted(option_rule_names()) == sorted(rule_names)
+
+
+def test_rules_with_the_same_value_are_counted_separately():
+    options = litgen.LitgenOptions()
+    options.fn_exclude_by_name__regex = "^Foo"
+    options.class_exclude_by_name__regex = "^Foo"
+    assert does_match_option(options, "fn_exclude_by_name__regex", "Foo")
+    never_matched = option_matchers(options).never_matched_rules()
+    assert "class_exclude_by_name__regex" in never_matched
+    assert "fn_exclude_by_name__regex" not in never_matched
+    # (the result is shared)
+    assert does_match_option(options, "class_exclude_by_name__regex", "Foo")
+    assert option_matchers(options).nb_hits == 1
+
+
+def test_default_rules_are_not_reported():
+    assert option_matchers(litgen.LitgenOptions()).never_matched_rules() == []
+
+
+def test_never_matched_options_rules():
+    options = litgen.LitgenOptions()
+    options.fn_exclude_by_name__regex = r"^Private"
+    options.class_exclude_by_name__regex = r"^Internal"
+    generator = litgen.LitgenGenerator(options)
+    generator.process_cpp_code("void PrivateFoo(); struct Bar {};", "file.h")
+    never_matched = generator.never_matched_options_rules()
+    assert "class_exclude_by_name__regex" in never_matched
+    assert "fn_exclude_by_name__regex" not in never_matched
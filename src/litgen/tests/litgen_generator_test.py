@@ -1,5 +1,9 @@
 from __future__ import annotations
+import json
+import sys
+from pathlib import Path
 
+import pytest
 
 from codemanip import code_utils
 
@@ -187,3 +191,232 @@ def test_namespace_adapt_in_stub() -> None:
         # </submodule camel_case>
         ''',
     )
+
+
+def test_process_cpp_files_parallel(tmp_path: Path) -> None:
+    # b.h and c.h depend on the enum defined in a.h (its values are renamed in python)
+    headers_codes = {
+        "a.h": "enum class Color { Red = 0, DarkBlue };",
+        "b.h": "void UseColor(Color c = Color::DarkBlue);",
+        "c.h": "struct Foo { Color c = Color::Red; };\nvoid UseFoo(const Foo& f = Foo());",
+        "d.h": "int Add(int a, int b = 1);\nvoid ToggleBool(bool & v);",
+    }
+    filenames = []
+    for header_name, header_code in headers_codes.items():
+        filename = str(tmp_path / header_name)
+        with open(filename, "w") as f:
+            f.write(header_code)
+        filenames.append(filename)
+
+    options = litgen.LitgenOptions()
+    options.fn_params_adapt_mutable_param_with_default_value__regex = r".*"
+    options.fn_params_replace_modifiable_immutable_by_boxed__regex = r"^Toggle"
+
+    generator_sequential = litgen.LitgenGenerator(options)
+    for filename in filenames:
+        generator_sequential.process_cpp_file(filename)
+
+    generator_parallel = litgen.LitgenGenerator(options)
+    generator_parallel.process_cpp_files(filenames, jobs=2)
+
+    assert "Color.dark_blue" in generator_sequential.stub_code()
+    assert generator_parallel.pydef_code() == generator_sequential.pydef_code()
+    assert generator_parallel.stub_code() == generator_sequential.stub_code()
+    assert generator_parallel.glue_code() == generator_sequential.glue_code()
+
+
+def test_incremental_cache(tmp_path: Path) -> None:
+    headers_codes = {
+        "a.h": "enum class Color { Red = 0, DarkBlue };",
+        "b.h": "void UseColor(Color c = Color::DarkBlue);",
+        "c.h": "int Add(int a, int b = 1);\nvoid ToggleBool(bool & v);",
+    }
+    filenames = []
+    for header_name, header_code in headers_codes.items():
+        filename = str(tmp_path / header_name)
+        with open(filename, "w") as f:
+            f.write(header_code)
+        filenames.append(filename)
+
+    def make_options(incremental: bool) -> litgen.LitgenOptions:
+        options = litgen.LitgenOptions()
+        options.fn_params_replace_modifiable_immutable_by_boxed__regex = lambda name: name.startswith("Toggle")
+        if incremental:
+            options.incremental_cache_directory = str(tmp_path / "cache")
+        return options
+
+    def generate(incremental: bool) -> tuple[litgen.LitgenGenerator, list[str]]:
+        generator = litgen.LitgenGenerator(make_options(incremental))
+        generator.process_cpp_files(filenames)
+        codes = [generator.pydef_code(), generator.stub_code(), generator.glue_code()]
+        return generator, codes
+
+    _, expected_codes = generate(incremental=False)
+
+    generator, codes = generate(incremental=True)
+    assert codes == expected_codes
+    assert generator._incremental_cache_ is not None
+    assert generator._incremental_cache_.nb_misses == 3
+
+    generator, codes = generate(incremental=True)
+    assert codes == expected_codes
+    assert generator._incremental_cache_ is not None
+    assert generator._incremental_cache_.nb_hits == 3
+
+    # Modify a header: only this one is processed again
+    with open(filenames[2], "w") as f:
+        f.write("int Sub(int a, int b = 1);")
+    _, expected_codes = generate(incremental=False)
+    generator, codes = generate(incremental=True)
+    assert codes == expected_codes
+    assert generator._incremental_cache_ is not None
+    assert generator._incremental_cache_.nb_hits == 2
+    assert generator._incremental_cache_.nb_misses == 1
+
+
+def test_never_matched_options_rules_with_jobs_and_incremental_cache(tmp_path: Path) -> None:
+    filenames = []
+    for i in range(2):
+        filename = str(tmp_path / f"header_{i}.h")
+        with open(filename, "w") as f:
+            f.write(f"void PrivateFoo{i}();")
+        filenames.append(filename)
+
+    def never_matched_options_rules(jobs: int) -> list[str]:
+        options = litgen.LitgenOptions()
+        options.fn_exclude_by_name__regex = r"^Private"
+        options.class_exclude_by_name__regex = r"^Internal"
+        options.incremental_cache_directory = str(tmp_path / "cache")
+        generator = litgen.LitgenGenerator(options)
+        generator.process_cpp_files(filenames, jobs=jobs)
+        return generator.never_matched_options_rules()
+
+    # headers processed by the workers, then reused from the incremental cache
+    for _ in range(2):
+        never_matched = never_matched_options_rules(jobs=2)
+        assert "class_exclude_by_name__regex" in never_matched
+        assert "fn_exclude_by_name__regex" not in never_matched
+
+
+def test_incremental_cache_shared_by_several_options(tmp_path: Path) -> None:
+    filename = str(tmp_path / "a.h")
+    with open(filename, "w") as f:
+        f.write("int Add(int a, int b = 1);")
+
+    def generate(bind_library: litgen.BindLibraryType) -> litgen.LitgenGenerator:
+        options = litgen.LitgenOptions()
+        options.bind_library = bind_library
+        options.incremental_cache_directory = str(tmp_path / "cache")
+        generator = litgen.LitgenGenerator(options)
+        generator.process_cpp_files([filename])
+        return generator
+
+    # Each set of options keeps its own entry for the header
+    for nb_run in range(2):
+        for bind_library in (litgen.BindLibraryType.pybind11, litgen.BindLibraryType.nanobind):
+            incremental_cache = generate(bind_library)._incremental_cache_
+            assert incremental_cache is not None
+            assert incremental_cache.nb_hits == nb_run
+
+
+_EXCLUDED_NAMES = ["Foo"]
+
+
+def test_incremental_cache_options_digest(monkeypatch: pytest.MonkeyPatch) -> None:
+    from litgen.internal.incremental_cache import options_digest
+
+    options = litgen.LitgenOptions()
+    options.fn_exclude_by_name__regex = lambda name: name in _EXCLUDED_NAMES
+    digest = options_digest(options)
+    assert options_digest(options) == digest
+    # the values of the globals referenced by a callable are a part of the digest
+    monkeypatch.setattr(sys.modules[__name__], "_EXCLUDED_NAMES", ["Foo", "Bar"])
+    assert options_digest(options) != digest
+
+
+def test_incremental_cache_entries_are_json(tmp_path: Path) -> None:
+    filename = str(tmp_path / "a.h")
+    with open(filename, "w") as f:
+        f.write("enum class Color { Red = 0 };\nvoid ToggleBool(bool & v);")
+    options = litgen.LitgenOptions()
+    options.fn_params_replace_modifiable_immutable_by_boxed__regex = r"^Toggle"
+    options.incremental_cache_directory = str(tmp_path / "cache")
+    litgen.LitgenGenerator(options).process_cpp_files([filename])
+
+    (entry_file,) = (tmp_path / "cache").iterdir()
+    with open(entry_file) as f:
+        data = json.load(f)
+    assert data["contributions"]["encountered_cpp_boxed_types"] == ["bool"]
+
+
+def test_write_generated_code_for_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from litgen import litgen_generator
+
+    filenames = []
+    for i in range(3):
+        filename = str(tmp_path / f"header_{i}.h")
+        with open(filename, "w") as f:
+            f.write(f"int Foo{i}();")
+        filenames.append(filename)
+
+    pydef_file = str(tmp_path / "pydef.cpp")
+    stub_file = str(tmp_path / "stub.pyi")
+    with open(pydef_file, "w") as f:
+        f.write(litgen_generator._typical_pybind_file(litgen.BindLibraryType.pybind11))
+    with open(stub_file, "w") as f:
+        f.write(litgen_generator._typical_stub_file())
+
+    nb_writes = 0
+    write_generated_code = litgen.LitgenGenerator.write_generated_code
+
+    def counting_write_generated_code(self: litgen.LitgenGenerator, *args: str) -> None:
+        nonlocal nb_writes
+        nb_writes += 1
+        write_generated_code(self, *args)
+
+    monkeypatch.setattr(litgen.LitgenGenerator, "write_generated_code", counting_write_generated_code)
+
+    options = litgen.LitgenOptions()
+    litgen.write_generated_code_for_files(options, filenames, pydef_file, stub_file)
+    assert nb_writes == 1
+    with open(stub_file) as f:
+        stub_code = f.read()
+    assert "def foo0()" in stub_code and "def foo2()" in stub_code
+
+    nb_writes = 0
+    litgen.write_generated_code_for_files(options, filenames, pydef_file, stub_file, checkpoint_every_nb_files=2)
+    assert nb_writes == 2
+    with open(stub_file) as f:
+        assert f.read() == stub_code
+
+
+def test_parse_caches_are_cleared_once_per_run(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from srcmlcpp import srcmlcpp_main
+
+    filenames = []
+    for i in range(3):
+        filename = str(tmp_path / f"header_{i}.h")
+        with open(filename, "w") as f:
+            f.write(f"int Foo{i}();")
+        filenames.append(filename)
+
+    nb_clears = 0
+    clear = srcmlcpp_main._CPP_TYPE_PARSE_CACHE.clear
+
+    def counting_clear() -> None:
+        nonlocal nb_clears
+        nb_clears += 1
+        clear()
+
+    monkeypatch.setattr(srcmlcpp_main._CPP_TYPE_PARSE_CACHE, "clear", counting_clear)
+
+    options = litgen.LitgenOptions()
+    litgen.generate_code(options, "int Foo();")
+    assert nb_clears == 1
+
+    # The headers are processed in fresh contexts (incremental cache misses): the caches are not cleared for each one
+    options.incremental_cache_directory = str(tmp_path / "cache")
+    generator = litgen.LitgenGenerator(options)
+    generator.process_cpp_files(filenames)
+    assert generator._incremental_cache_ is not None and generator._incremental_cache_.nb_misses == 3
+    assert nb_clears == 1
@@ -73,7 +73,10 @@ from srcmlcpp.srcml_wrapper import SrcmlWrapper
 from srcmlcpp.srcmlcpp_main import code_to_cpp_unit
 
 # code_to_srcml_xml_wrapper is a lower level utility, that returns a wrapped version of the srcML tree
-from srcmlcpp.srcmlcpp_main import code_to_srcml_wrapper, code_to_cpp_type
+from srcmlcpp.srcmlcpp_main import code_to_srcml_wrapper, code_to_cpp_type, code_to_cpp_types
+
+# code_snippets_to_cpp_units parses several independent snippets with a single call to srcML
+from srcmlcpp.srcmlcpp_main import code_snippets_to_cpp_units
 
 from srcmlcpp.scrml_warning_settings import WarningType
 
@@ -81,6 +84,8 @@ __all__ = [
     # Functions
     "code_to_cpp_unit",
     "code_to_cpp_type",
+    "code_to_cpp_types",
+    "code_snippets_to_cpp_units",
     "code_to_srcml_wrapper",
     "SrcmlcppOptions",
     "SrcmlcppException",
@@ -1,7 +1,7 @@
 from __future__ import annotations
 import copy
 from enum import Enum
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, Sequence, TypeVar
 
 from srcmlcpp.cpp_types.scope.cpp_scope import CppScope, CppScopePart, CppScopeType
 from srcmlcpp.srcml_wrapper import SrcmlWrapper
@@ -15,6 +15,10 @@ __all__ = ["CppElement", "CppElementsVisitorFunction", "CppElementsVisitorEvent"
 
 # members that are always copied as shallow members (this is intentionally a static list)
 _CppElement__deep_copy_force_shallow_ = ["parent"]
+# caches that are not copied (they are reset to None in the copy)
+_CppElement__deep_copy_reset_ = ["_elements_index", "_symbol_table"]
+
+_CppElementT = TypeVar("_CppElementT", bound="CppElement")
 
 
 class CppElement(SrcmlWrapper):
@@ -25,15 +29,21 @@ class CppElement(SrcmlWrapper):
     # It will be filled later by CppBlock.fill_parents() (with a tree traversal)
     parent: CppElement | None
 
-    # The scope of this element (i.e. the namespace or class it belongs to)
-    # This is a cached value, and is filled by self.cpp_scope()
-    # (it may be absent if not yet filled)
-    _cached_cpp_scope: CppScope
-    _cached_cpp_scope_include_self: CppScope
+    # The scope of this element (i.e. the namespace or class it belongs to), and its depth.
+    # These are cached values: they are filled top-down for the whole tree by CppUnit.fill_children_parents(),
+    # or lazily by self.cpp_scope() and self.depth() (they are None if not yet filled)
+    _cached_cpp_scope: CppScope | None
+    _cached_cpp_scope_include_self: CppScope | None
+    _cached_depth: int | None
+
+    __slots__ = ("parent", "_cached_cpp_scope", "_cached_cpp_scope_include_self", "_cached_depth")
 
     def __init__(self, element: SrcmlWrapper) -> None:
         super().__init__(element.options, element.srcml_xml, element.filename)
         # self.parent is intentionally not filled!
+        self._cached_cpp_scope = None
+        self._cached_cpp_scope_include_self = None
+        self._cached_depth = None
 
     def __deepcopy__(self, memo=None):
         """CppElement.__deepcopy__: force shallow copy of the parent
@@ -48,13 +58,65 @@ class CppElement(SrcmlWrapper):
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result  # type: ignore
-        for k, v in self.__dict__.items():
-            if k not in _CppElement__deep_copy_force_shallow_:
-                setattr(result, k, copy.deepcopy(v, memo))
+        for k, v in self._members().items():
+            if k in _CppElement__deep_copy_force_shallow_:
+                object.__setattr__(result, k, v)
+            elif k in _CppElement__deep_copy_reset_:
+                object.__setattr__(result, k, None)
             else:
-                setattr(result, k, v)
+                object.__setattr__(result, k, copy.deepcopy(v, memo))
         return result
 
+    def shallow_clone(self: _CppElementT) -> _CppElementT:
+        """Returns a copy of this element which shares its children with it (copy-on-write).
+
+        The attributes of the copy can be reassigned (and its lists modified) without altering this element.
+        However, the shared children shall not be modified in place: use clone_path() to also clone
+        the children that will be modified. Likewise, the children handed to a setter shall be cloned,
+        since the setter sets their parent (see _adopt_children()).
+        Caches that depend on the content of the element are not shared (see _on_cloned()).
+
+        Note: the parent of a shared child is still the element it was first attached to.
+        """
+        cls = self.__class__
+        result = cls.__new__(cls)
+        for k, v in self._members().items():
+            if k in _CppElement__deep_copy_reset_:
+                v = None
+            elif isinstance(v, list):
+                v = list(v)
+            object.__setattr__(result, k, v)
+        result._on_cloned()
+        return result
+
+    def clone_path(self: _CppElementT, *attributes_path: str) -> _CppElementT:
+        """Returns a copy-on-write clone of this element (see shallow_clone()), in which the children
+        along the given path of attributes are also cloned, so that they can be modified in place.
+        All the other children are shared with this element.
+
+        For example, `param.clone_path("decl", "cpp_type")` clones a CppParameter, its decl, and the decl type.
+
+        The parents of the cloned children are set to their cloned parents (the parent of the returned clone is unchanged).
+        """
+        r = self.shallow_clone()
+        current: CppElement = r
+        for attribute in attributes_path:
+            # children are often stored in a private member, behind a property (e.g. CppDecl.cpp_type)
+            members = current._members()
+            member_name = attribute if attribute in members else "_" + attribute
+            child = members[member_name]
+            assert isinstance(child, CppElement)
+            cloned_child = child.shallow_clone()
+            cloned_child.parent = current
+            object.__setattr__(current, member_name, cloned_child)
+            current = cloned_child
+        return r
+
+    def _on_cloned(self) -> None:
+        """Called on a new clone (see shallow_clone()).
+        Derived classes override it to reset the caches that depend on their content."""
+        pass
+
     def str_code(self) -> str:
         """Returns a C++ textual representation of the contained code element.
         By default, it returns an exact copy of the original code.
@@ -66,6 +128,8 @@ class CppElement(SrcmlWrapper):
 
     def depth(self) -> int:
         """The depth of this node, i.e how many parents it has"""
+        if self._cached_depth is not None:
+            return self._cached_depth
         depth = 0
         current = self
         if not hasattr(current, "parent"):
@@ -109,29 +173,38 @@ class CppElement(SrcmlWrapper):
         return None
 
     def _clear_scope_cache(self) -> None:
-        if hasattr(self, "_cached_cpp_scope"):
-            del self._cached_cpp_scope
-        if hasattr(self, "_cached_cpp_scope_include_self"):
-            del self._cached_cpp_scope_include_self
-        if hasattr(self, "_cached_cpp_scope_str"):
-            del self._cached_cpp_scope_str
-        if hasattr(self, "_cached_cpp_scope_include_self_str"):
-            del self._cached_cpp_scope_include_self_str
+        self._cached_cpp_scope = None
+        self._cached_cpp_scope_include_self = None
+        self._cached_depth = None
 
-    def cpp_scope_str(self, include_self: bool = False) -> str:
-        if include_self:
-            if hasattr(self, "_cached_cpp_scope_include_self_str"):
-                return self._cached_cpp_scope_include_self_str
-        else:
-            if hasattr(self, "_cached_cpp_scope_str"):
-                return self._cached_cpp_scope_str
+    def _fill_scope_cache_from_parent(self) -> None:
+        """Fills the scope and depth caches of this element from its parent's
+        (which must have been filled before, i.e. the tree is traversed top-down)"""
+        from srcmlcpp.cpp_types import CppDecl
 
-        if include_self:
-            self._cached_cpp_scope_include_self_str: str = self.cpp_scope(include_self).str_cpp
-            return self._cached_cpp_scope_include_self_str
+        parent = self.parent
+        if parent is None:
+            scope = CppScope([])
+            self._cached_depth = 0
         else:
-            self._cached_cpp_scope_str: str = self.cpp_scope(include_self).str_cpp
-            return self._cached_cpp_scope_str
+            assert parent._cached_cpp_scope_include_self is not None and parent._cached_depth is not None
+            scope = parent._cached_cpp_scope_include_self
+            self._cached_depth = parent._cached_depth + 1
+
+        if isinstance(self, CppDecl):
+            parent_enum = self.parent_enum_if_applicable()
+            if parent_enum is not None and not parent_enum.is_enum_class():
+                # C enum decl leak into the parent scope! (see cpp_scope())
+                self._cached_cpp_scope = parent_enum._cached_cpp_scope
+                self._cached_cpp_scope_include_self = parent_enum._cached_cpp_scope_include_self
+                return
+
+        self._cached_cpp_scope = scope
+        self_scope = self.self_scope()
+        self._cached_cpp_scope_include_self = scope if self_scope is None else scope.make_child_scope(self_scope)
+
+    def cpp_scope_str(self, include_self: bool = False) -> str:
+        return self.cpp_scope(include_self).str_cpp
 
     def cpp_scope(self, include_self: bool = False) -> CppScope:
         """Return this element cpp scope
@@ -143,12 +216,9 @@ class CppElement(SrcmlWrapper):
             }
         }
         """
-        if include_self:
-            if hasattr(self, "_cached_cpp_scope_include_self"):
-                return self._cached_cpp_scope_include_self
-        else:
-            if hasattr(self, "_cached_cpp_scope"):
-                return self._cached_cpp_scope
+        cached_scope = self._cached_cpp_scope_include_self if include_self else self._cached_cpp_scope
+        if cached_scope is not None:
+            return cached_scope
 
         ancestors = self.ancestors_list(include_self)
         ancestors.reverse()
@@ -166,12 +236,12 @@ class CppElement(SrcmlWrapper):
             if scope_part is not None:
                 scope_parts.append(scope_part)
 
+        scope = CppScope(scope_parts)
         if include_self:
-            self._cached_cpp_scope_include_self = CppScope(scope_parts)
-            return self._cached_cpp_scope_include_self
+            self._cached_cpp_scope_include_self = scope
         else:
-            self._cached_cpp_scope: CppScope = CppScope(scope_parts)
-            return self._cached_cpp_scope
+            self._cached_cpp_scope = scope
+        return scope
 
     def ancestors_list(self, include_self: bool = False) -> list[CppElement]:
         """
@@ -206,9 +276,17 @@ class CppElement(SrcmlWrapper):
         return CppUnit.find_root_cpp_unit(self)
 
     def fill_children_parents(self) -> None:
+        """Fills the parent of all the elements in this sub-tree.
+
+        When called on a CppUnit, the scope and depth caches of all the elements are also filled (top-down),
+        so that later calls to cpp_scope() and depth() are simple attribute reads.
+        When called on a sub-tree, its caches are cleared (the sub-tree may have been moved),
+        and the caches of the unit which contains it are invalidated (see _on_tree_mutated()).
+        """
         from srcmlcpp.cpp_types.blocks.cpp_unit import CppUnit
 
-        if isinstance(self, CppUnit):
+        is_unit = isinstance(self, CppUnit)
+        if is_unit:
             top_parent = None
         else:
             top_parent = self.parent
@@ -224,17 +302,73 @@ class CppElement(SrcmlWrapper):
                     assert last_parent is not None
 
                 cpp_element.parent = last_parent
+                if is_unit:
+                    cpp_element._fill_scope_cache_from_parent()
+                else:
+                    cpp_element._clear_scope_cache()
             elif event == CppElementsVisitorEvent.OnBeforeChildren:
                 parents_stack.append(cpp_element)
             elif event == CppElementsVisitorEvent.OnAfterChildren:
                 parents_stack.pop()
 
         self.visit_cpp_breadth_first(visitor_fill_parent)
+        if isinstance(self, CppUnit):
+            self.invalidate_caches()
+        else:
+            self._on_tree_mutated()
+
+    def _adopt_children(self, children: Sequence[CppElement]) -> None:
+        """Sets the parent of these direct children to this element (called by the setters of the children).
+
+        Only the direct children are re-parented: their descendants keep their parents, so that the sub-trees
+        which are shared with other elements (see shallow_clone()) are not altered. The children themselves
+        shall not be shared with another element.
+        If a child is moved to another scope, the scope caches of its sub-tree are cleared.
+        The caches of the unit which contains this element are invalidated.
+        """
+        for child in children:
+            previous_parent = getattr(child, "parent", None)
+            child.parent = self
+            if not self._has_same_scope_caches(previous_parent):
+                child.visit_cpp_breadth_first(_clear_scope_cache_visitor)
+        self._on_tree_mutated()
+
+    def _has_same_scope_caches(self, other: CppElement | None) -> bool:
+        """True if other has the same (filled) scope and depth caches as this element
+        (e.g. when this element is a clone of other)"""
+        return (
+            other is not None
+            and self._cached_cpp_scope_include_self is not None
+            and self._cached_cpp_scope_include_self == other._cached_cpp_scope_include_self
+            and self._cached_depth == other._cached_depth
+        )
+
+    def _root_cpp_unit_if_any(self) -> CppUnit | None:
+        """The unit which contains this element, or None if it is not (yet) attached to a unit"""
+        from srcmlcpp.cpp_types.blocks.cpp_unit import CppUnit
+
+        root: CppElement = self
+        while getattr(root, "parent", None) is not None:
+            assert root.parent is not None
+            root = root.parent
+        return root if isinstance(root, CppUnit) else None
+
+    def _on_tree_mutated(self) -> None:
+        """Invalidates the caches of the unit which contains this element (see CppUnit.invalidate_caches).
+        Called when the children of an element are changed."""
+        root_unit = self._root_cpp_unit_if_any()
+        if root_unit is not None:
+            root_unit.invalidate_caches()
 
     def __str__(self) -> str:
         return self._str_simplified_yaml()
 
 
+def _clear_scope_cache_visitor(cpp_element: CppElement, event: CppElementsVisitorEvent, _depth: int) -> None:
+    if event == CppElementsVisitorEvent.OnElement:
+        cpp_element._clear_scope_cache()
+
+
 class CppElementsVisitorEvent(Enum):
     OnElement = 1  # We are visiting this element (will be raised for all elements, incl Blocks)
     OnBeforeChildren = 2  # We are about to visit a block's children
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import copy
 from dataclasses import dataclass
 
 from srcmlcpp.cpp_types.base.cpp_element import CppElement
@@ -14,10 +15,16 @@ class CppElementAndComment(CppElement):
 
     cpp_element_comments: CppElementComments
 
+    __slots__ = ("cpp_element_comments",)
+
     def __init__(self, element: SrcmlWrapper, cpp_element_comments: CppElementComments) -> None:
         super().__init__(element)
         self.cpp_element_comments = cpp_element_comments
 
+    def _on_cloned(self) -> None:
+        # comments are often edited in place (by litgen): they are not shared with the clone
+        self.cpp_element_comments = copy.copy(self.cpp_element_comments)
+
     def str_commented(self, is_enum: bool = False, is_decl_stmt: bool = False) -> str:
         result = self.cpp_element_comments.top_comment_code()
         result += self.str_code()
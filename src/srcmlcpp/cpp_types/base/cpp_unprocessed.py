@@ -13,6 +13,8 @@ class CppEmptyLine(CppElementAndComment):
     in order to better keep track of function and classes comments.
     """
 
+    __slots__ = ()
+
     def __init__(self, element: SrcmlWrapper) -> None:
         dummy_comments = CppElementComments()
         super().__init__(element, dummy_comments)
@@ -35,6 +37,8 @@ class CppUnprocessed(CppElementAndComment):
     The original source can be accessed via self.str_code_verbatim()
     """
 
+    __slots__ = ("code",)
+
     def __init__(self, element: SrcmlWrapper, cpp_element_comments: CppElementComments) -> None:
         super().__init__(element, cpp_element_comments)
         self.code = ""
@@ -55,6 +59,8 @@ class CppComment(CppElementAndComment):
 
     comment: str
 
+    __slots__ = ("comment",)
+
     def __init__(self, element: SrcmlWrapper, cpp_element_comments: CppElementComments) -> None:
         super().__init__(element, cpp_element_comments)
 
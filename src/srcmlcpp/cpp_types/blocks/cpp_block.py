@@ -44,11 +44,16 @@ class CppBlock(CppElementAndComment):
     """
 
     _block_children: list[CppElementAndComment]
+    # Cache for all_cpp_elements_recursive: (wanted type -> elements, mutation counter of the unit when it was built)
+    _elements_index: tuple[dict[type | None, list[CppElement]], int] | None
+
+    __slots__ = ("_block_children", "_elements_index")
 
     def __init__(self, element: SrcmlWrapper) -> None:
         dummy_cpp_comments = CppElementComments()
         super().__init__(element, dummy_cpp_comments)
         self._block_children: list[CppElementAndComment] = []
+        self._elements_index = None
 
     @property
     def block_children(self) -> list[CppElementAndComment]:
@@ -57,7 +62,7 @@ class CppBlock(CppElementAndComment):
     @block_children.setter
     def block_children(self, value: list[CppElementAndComment]) -> None:
         self._block_children = value
-        self.fill_children_parents()
+        self._adopt_children(value)
 
     def str_block(self, is_enum: bool = False) -> str:
         result = ""
@@ -178,6 +183,24 @@ class CppBlock(CppElementAndComment):
         cpp_visitor_function(self, CppElementsVisitorEvent.OnAfterChildren, depth)
 
     def all_cpp_elements_recursive(self, wanted_type: type | None = None) -> list[CppElement]:
+        """Gathers all the elements in this block (*recursive*, including itself), in the order of a visit.
+
+        When this block belongs to a CppUnit, the result is cached in an index (type -> elements),
+        which is rebuilt only if the unit was mutated.
+        """
+        root_unit = self._root_cpp_unit_if_any()
+        if root_unit is None:
+            return self._visit_all_cpp_elements(wanted_type)
+        mutation_counter = root_unit._mutation_counter
+
+        if self._elements_index is None or self._elements_index[1] != mutation_counter:
+            self._elements_index = ({None: self._visit_all_cpp_elements(None)}, mutation_counter)
+        index = self._elements_index[0]
+        if wanted_type not in index:
+            index[wanted_type] = [element for element in index[None] if isinstance(element, wanted_type)]  # type: ignore
+        return list(index[wanted_type])
+
+    def _visit_all_cpp_elements(self, wanted_type: type | None) -> list[CppElement]:
         _all_cpp_elements = []
 
         def visitor_add_cpp_element(cpp_element: CppElement, event: CppElementsVisitorEvent, _depth: int) -> None:
@@ -194,6 +217,7 @@ class CppBlock(CppElementAndComment):
     def add_element(self, element: CppElementAndComment) -> None:
         element.parent = self
         self.block_children.append(element)
+        self._on_tree_mutated()
 
     def __str__(self) -> str:
         return self.str_block()
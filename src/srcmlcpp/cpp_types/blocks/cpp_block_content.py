@@ -13,6 +13,8 @@ class CppBlockContent(CppBlock):
     This can be viewed as a sub-block with a different name
     """
 
+    __slots__ = ()
+
     def __init__(self, element: SrcmlWrapper):
         super().__init__(element)
 
@@ -16,8 +16,10 @@ class CppPublicProtectedPrivate(CppBlock):  # Also a CppElementAndComment
     Note: this is not a direct adaptation. Here we merge the different access types, and we derive from CppBlockContent
     """
 
-    access_type: CppAccessType = CppAccessType.public  # "public", "private", or "protected"
-    default_or_explicit: str = ""  # "default" or "" ("default" means it was added automatically)
+    access_type: CppAccessType  # "public", "private", or "protected"
+    default_or_explicit: str  # "default" or "" ("default" means it was added automatically)
+
+    __slots__ = ("access_type", "default_or_explicit")
 
     def __init__(self, element: SrcmlWrapper, access_type: CppAccessType, default_or_explicit: str | None) -> None:
         super().__init__(element)
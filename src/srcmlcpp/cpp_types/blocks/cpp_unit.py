@@ -1,11 +1,17 @@
 from __future__ import annotations
 import re
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from srcmlcpp.cpp_types.base.cpp_element import CppElement
 from srcmlcpp.cpp_types.blocks.cpp_block import CppBlock
 from srcmlcpp.srcml_wrapper import SrcmlWrapper
+from srcmlcpp.cpp_types.scope.cpp_scope import CppScope
 from srcmlcpp.cpp_types.scope.cpp_scope_identifiers import CppScopeIdentifiers
+from srcmlcpp.cpp_types.scope.cpp_symbol_table import CppSymbolTable
+
+if TYPE_CHECKING:
+    from srcmlcpp.cpp_types.classes.cpp_struct import CppStruct
 
 __all__ = ["CppUnit"]
 
@@ -30,11 +36,19 @@ class CppUnit(CppBlock):
 
     _scope_identifiers: CppScopeIdentifiers
     _int_defines_cache: dict[str, int] | None
+    # Incremented each time the tree is mutated (see CppBlock), in order to invalidate the caches below
+    _mutation_counter: int
+    # (symbol table, value of _mutation_counter when it was built)
+    _symbol_table: tuple[CppSymbolTable, int] | None
+
+    __slots__ = ("_scope_identifiers", "_int_defines_cache", "_mutation_counter", "_symbol_table")
 
     def __init__(self, element: SrcmlWrapper) -> None:
         super().__init__(element)
         self._scope_identifiers = CppScopeIdentifiers()
         self._int_defines_cache = None
+        self._mutation_counter = 0
+        self._symbol_table = None
 
     def __str__(self) -> str:
         return self.str_block()
@@ -62,6 +76,29 @@ class CppUnit(CppBlock):
         assert isinstance(root, CppUnit)
         return root
 
+    def invalidate_caches(self) -> None:
+        """Invalidates the caches of this unit (symbol table, elements index, int defines).
+        This is done automatically when using the children setters (e.g. CppBlock.block_children,
+        CppParameterList.parameters, or `decl.cpp_type = ...`) or CppBlock.add_element; it shall be called
+        explicitly when an element of the tree is mutated in place in another way (e.g. `decl.decl_name = ...`)
+        """
+        self._mutation_counter += 1
+        self._int_defines_cache = None
+
+    def symbol_table(self) -> CppSymbolTable:
+        """The structs, enums and functions of this unit, indexed by qualified name (built once, and rebuilt
+        if the tree was mutated)"""
+        if self._symbol_table is None or self._symbol_table[1] != self._mutation_counter:
+            self._symbol_table = (CppSymbolTable(self.all_cpp_elements_recursive()), self._mutation_counter)
+        return self._symbol_table[0]
+
+    def find_struct_or_class(
+        self, class_name_with_scope: str, current_scope: CppScope | None = None
+    ) -> CppStruct | None:
+        if current_scope is None:
+            current_scope = self.cpp_scope()
+        return self.symbol_table().find_struct_or_class(class_name_with_scope, current_scope)
+
     def fill_scope_identifiers_cache(self) -> None:
         all_elements = self.all_cpp_elements_recursive()
         self._scope_identifiers.fill_cache(all_elements)
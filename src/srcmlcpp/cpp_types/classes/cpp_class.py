@@ -14,6 +14,8 @@ class CppClass(CppStruct):
     https://www.srcml.org/doc/cpp_srcML.html#class-definition
     """
 
+    __slots__ = ()
+
     def __init__(self, element: SrcmlWrapper, cpp_element_comments: CppElementComments):
         super().__init__(element, cpp_element_comments)
 
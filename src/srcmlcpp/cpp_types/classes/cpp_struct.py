@@ -1,7 +1,6 @@
 # pyright: reportAttributeAccessIssue=false
 
 from __future__ import annotations
-import copy
 from dataclasses import dataclass
 
 import codemanip.code_utils
@@ -40,6 +39,16 @@ class CppStruct(CppElementAndComment, CppITemplateHost):
     specifier: str  # "final" for final classes, empty otherwise
     macro: str  # used in rare cases, such as `struct MY_API Foo { };` where macro will be "MY_API"
 
+    __slots__ = (
+        "class_name",
+        "_super_list",
+        "_block",
+        "specifier",
+        "macro",
+        "_template",
+        "specialized_template_params",
+    )
+
     def __init__(self, element: SrcmlWrapper, cpp_element_comments: CppElementComments) -> None:
         super().__init__(element, cpp_element_comments)
         self._init_template_host()
@@ -53,7 +62,7 @@ class CppStruct(CppElementAndComment, CppITemplateHost):
     @super_list.setter
     def super_list(self, value: CppSuperList) -> None:
         self._super_list = value
-        self.fill_children_parents()
+        self._adopt_children([value])
 
     @property
     def block(self) -> CppBlock:
@@ -62,7 +71,7 @@ class CppStruct(CppElementAndComment, CppITemplateHost):
     @block.setter
     def block(self, value: CppBlock) -> None:
         self._block = value
-        self.fill_children_parents()
+        self._adopt_children([value])
 
     def name(self) -> str:
         return self.class_name
@@ -333,26 +342,22 @@ class CppStruct(CppElementAndComment, CppITemplateHost):
 
         return virtual_methods
 
-    def _fill_children_parents(self) -> None:
-        self.block.parent = self
-        for ppp_block in self.block.block_children:
-            assert isinstance(ppp_block, CppPublicProtectedPrivate)
-            ppp_block.fill_children_parents()
-            ppp_block.parent = self.block
-
     def with_specialized_template(self, template_specs: CppTemplateSpecialization) -> CppStruct | None:
         """Returns a new partially or fully specialized class, implemented for the given type
         Will return None if the application of the template changes nothing
         """
-        new_class = copy.deepcopy(self)
+        # Copy-on-write: only the class, its block, its public/protected/private blocks and their members
+        # are cloned (the children of the members that are not changed by the template specialization are shared)
+        new_class = self.shallow_clone()
         new_class._store_template_specs(template_specs)
 
         was_changed = False
 
-        for ppp_new_block in new_class.block.block_children:
-            if isinstance(ppp_new_block, CppPublicProtectedPrivate):
+        new_block_children: list[CppElementAndComment] = []
+        for ppp_block in self.block.block_children:
+            if isinstance(ppp_block, CppPublicProtectedPrivate):
                 ppp_new_block_children: list[CppElementAndComment] = []
-                for ppp_child in ppp_new_block.block_children:
+                for ppp_child in ppp_block.block_children:
                     new_ppp_child: CppElementAndComment | None = None
                     if isinstance(ppp_child, (CppFunctionDecl, CppStruct, CppDeclStatement)):
                         new_ppp_child = ppp_child.with_specialized_template(template_specs)
@@ -360,15 +365,21 @@ class CppStruct(CppElementAndComment, CppITemplateHost):
                         ppp_new_block_children.append(new_ppp_child)
                         was_changed = True
                     else:
-                        ppp_new_block_children.append(ppp_child)
+                        ppp_new_block_children.append(ppp_child.shallow_clone())
+                ppp_new_block = ppp_block.shallow_clone()
                 ppp_new_block.block_children = ppp_new_block_children
+                new_block_children.append(ppp_new_block)
+            else:
+                new_block_children.append(ppp_block.shallow_clone())
 
-        if was_changed:
-            new_class._fill_children_parents()
-            return new_class
-        else:
+        if not was_changed:
             return None
 
+        new_block = self.block.shallow_clone()
+        new_block.block_children = new_block_children
+        new_class.block = new_block
+        return new_class
+
     def visit_cpp_breadth_first(self, cpp_visitor_function: CppElementsVisitorFunction, depth: int = 0) -> None:
         cpp_visitor_function(self, CppElementsVisitorEvent.OnElement, depth)
         cpp_visitor_function(self, CppElementsVisitorEvent.OnBeforeChildren, depth)
@@ -14,11 +14,15 @@ class CppSuper(CppElement):
     https://www.srcml.org/doc/cpp_srcML.html#struct-definition
     """
 
-    specifier: str = ""  # public, private or protected inheritance
-    superclass_name: str = ""  # name of the super class
+    specifier: str  # public, private or protected inheritance
+    superclass_name: str  # name of the super class
+
+    __slots__ = ("specifier", "superclass_name")
 
     def __init__(self, element: SrcmlWrapper):
         super().__init__(element)
+        self.specifier = ""
+        self.superclass_name = ""
 
     def str_code(self) -> str:
         if len(self.specifier) > 0:
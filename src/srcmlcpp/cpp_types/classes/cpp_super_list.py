@@ -24,6 +24,8 @@ class CppSuperList(CppElementAndComment):
 
     _super_list: list[CppSuper]
 
+    __slots__ = ("_super_list",)
+
     def __init__(self, element: SrcmlWrapper):
         empty_comments = CppElementComments()
         super().__init__(element, empty_comments)
@@ -36,7 +38,7 @@ class CppSuperList(CppElementAndComment):
     @super_list.setter
     def super_list(self, value: list[CppSuper]) -> None:
         self._super_list = value
-        self.fill_children_parents()
+        self._adopt_children(value)
 
     def str_code(self) -> str:
         strs = list(map(str, self.super_list))
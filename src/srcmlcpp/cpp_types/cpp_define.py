@@ -46,6 +46,8 @@ class CppDefine(CppElementAndComment):
     macro_parameters_str: str
     macro_value: str
 
+    __slots__ = ("macro_name", "macro_parameters_str", "macro_value")
+
     def __init__(self, element: SrcmlWrapper, cpp_element_comments: CppElementComments) -> None:
         super().__init__(element, cpp_element_comments)
 
@@ -73,6 +75,8 @@ class CppConditionMacro(CppElementAndComment):
 
     macro_code: str  # a verbatim copy of the C(++) code for this macro (including spaces and LF)
 
+    __slots__ = ("macro_code",)
+
     def __init__(self, element: SrcmlWrapper, cpp_element_comments: CppElementComments) -> None:
         super().__init__(element, cpp_element_comments)
 
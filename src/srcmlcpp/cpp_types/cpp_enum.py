@@ -1,5 +1,4 @@
 from __future__ import annotations
-import copy
 from dataclasses import dataclass
 from typing import Optional
 
@@ -27,13 +26,18 @@ class CppEnum(CppElementAndComment):
     """
 
     _block: CppBlock
-    enum_type: str = ""  # "class" or ""
-    enum_name: str = ""
+    enum_type: str  # "class" or ""
+    enum_name: str
     # enum_data_type is almost always empty, but can contain the inner data type, e.g. uint32_t
-    enum_data_type: str = ""
+    enum_data_type: str
+
+    __slots__ = ("_block", "enum_type", "enum_name", "enum_data_type")
 
     def __init__(self, element: SrcmlWrapper, cpp_element_comments: CppElementComments) -> None:
         super().__init__(element, cpp_element_comments)
+        self.enum_type = ""
+        self.enum_name = ""
+        self.enum_data_type = ""
 
     @property
     def block(self) -> CppBlock:
@@ -42,7 +46,7 @@ class CppEnum(CppElementAndComment):
     @block.setter
     def block(self, value: CppBlock) -> None:
         self._block = value
-        self.fill_children_parents()
+        self._adopt_children([value])
 
     def is_enum_class(self) -> bool:
         return self.enum_type == "class"
@@ -87,7 +91,7 @@ class CppEnum(CppElementAndComment):
                 children.append(child)
             else:
                 decl = child
-                decl_with_value = copy.copy(decl)
+                decl_with_value = decl.shallow_clone()
 
                 if len(decl_with_value.initial_value_code) > 0:
                     """
@@ -20,6 +20,8 @@ class CppNamespace(CppElementAndComment):
     ns_name: str
     _block: CppBlock
 
+    __slots__ = ("ns_name", "_block")
+
     def __init__(self, element: SrcmlWrapper, cpp_element_comments: CppElementComments) -> None:
         super().__init__(element, cpp_element_comments)
         self.ns_name = ""
@@ -31,7 +33,7 @@ class CppNamespace(CppElementAndComment):
     @block.setter
     def block(self, value: CppBlock) -> None:
         self._block = value
-        self.fill_children_parents()
+        self._adopt_children([value])
 
     def str_code(self) -> str:
         r = f"namespace {self.ns_name}\n"
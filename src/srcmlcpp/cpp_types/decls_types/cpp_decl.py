@@ -1,5 +1,4 @@
 from __future__ import annotations
-import copy
 from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING
@@ -44,10 +43,11 @@ class CppDecl(CppElementAndComment):
 
     _cpp_type: CppType
 
-    _cpp_decl_with_qualified_types: CppDecl
+    # cache for with_qualified_types() (None if not computed yet)
+    _cpp_decl_with_qualified_types: CppDecl | None
 
     # decl_name, i.e. the variable name
-    decl_name: str = ""
+    decl_name: str
 
     # c_array_code will only be filled if this decl looks like:
     #   *  `int a[]:`      <-- in this case, c_array_code="[]"
@@ -55,7 +55,7 @@ class CppDecl(CppElementAndComment):
     #   *  `int a[10]:`      <-- in this case, c_array_code="[10]"
     #
     # In other cases, it will be an empty string
-    c_array_code: str = ""
+    c_array_code: str
 
     # * init represent the initial aka default value.
     # With srcML, it is inside an <init><expr> node in srcML.
@@ -74,15 +74,35 @@ class CppDecl(CppElementAndComment):
     #         </decl_stmt>
     #
     # And `<init>= <expr> <literal type="number">5</literal> </expr> </init>` is transcribed as "5"
-    initial_value_code: str = ""  # initial or default value
+    initial_value_code: str  # initial or default value
 
     # indicates whether the initial value was obtained via an initializer list
-    initial_value_via_initializer_list: bool = False
+    initial_value_via_initializer_list: bool
 
-    bitfield_range: str = ""  # Will be filled for bitfield members
+    bitfield_range: str  # Will be filled for bitfield members
+
+    __slots__ = (
+        "_cpp_type",
+        "_cpp_decl_with_qualified_types",
+        "decl_name",
+        "c_array_code",
+        "initial_value_code",
+        "initial_value_via_initializer_list",
+        "bitfield_range",
+    )
 
     def __init__(self, element: SrcmlWrapper, cpp_element_comments: CppElementComments) -> None:
         super().__init__(element, cpp_element_comments)
+        self._cpp_decl_with_qualified_types = None
+        self.decl_name = ""
+        self.c_array_code = ""
+        self.initial_value_code = ""
+        self.initial_value_via_initializer_list = False
+        self.bitfield_range = ""
+
+    def _on_cloned(self) -> None:
+        super()._on_cloned()
+        self._cpp_decl_with_qualified_types = None
 
     def name(self) -> str:
         return self.decl_name
@@ -94,7 +114,7 @@ class CppDecl(CppElementAndComment):
     @cpp_type.setter
     def cpp_type(self, value: CppType) -> None:
         self._cpp_type = value
-        self.fill_children_parents()
+        self._adopt_children([value])
 
     def str_code(self) -> str:
         r = ""
@@ -299,7 +319,7 @@ class CppDecl(CppElementAndComment):
                             int _f3 = N1::N3::f3()
                             int other = N1::N4::f4()
         """
-        if hasattr(self, "_cpp_decl_with_qualified_types"):
+        if self._cpp_decl_with_qualified_types is not None:
             return self._cpp_decl_with_qualified_types
 
         if current_scope is None:
@@ -316,7 +336,10 @@ class CppDecl(CppElementAndComment):
             was_changed = True
 
         if was_changed:
-            new_decl = copy.deepcopy(self)
+            new_decl = self.shallow_clone()
+            if new_decl_cpp_type is self._cpp_type:
+                # (cloned, since the cpp_type setter sets its parent)
+                new_decl_cpp_type = new_decl_cpp_type.shallow_clone()
             new_decl.cpp_type = new_decl_cpp_type
             new_decl.initial_value_code = new_initial_value_code
             self._cpp_decl_with_qualified_types = new_decl
@@ -368,7 +391,10 @@ class CppDecl(CppElementAndComment):
             was_changed = True
 
         if was_changed:
-            new_decl = copy.deepcopy(self)
+            new_decl = self.shallow_clone()
+            if new_cpp_type is self._cpp_type:
+                # (cloned, since the cpp_type setter sets its parent)
+                new_cpp_type = new_cpp_type.shallow_clone()
             new_decl.cpp_type = new_cpp_type
             new_decl.initial_value_code = new_initial_value_code
             return new_decl
@@ -383,7 +409,7 @@ class CppDecl(CppElementAndComment):
         if new_type is None:
             return None
         else:
-            new_decl = copy.deepcopy(self)
+            new_decl = self.shallow_clone()
             new_decl.cpp_type = new_type
             return new_decl
 
@@ -1,5 +1,4 @@
 from __future__ import annotations
-import copy
 from dataclasses import dataclass
 
 from codemanip import code_utils
@@ -25,6 +24,8 @@ class CppDeclStatement(CppElementAndComment):
 
     _cpp_decls: list[CppDecl]  # A CppDeclStatement can initialize several variables
 
+    __slots__ = ("_cpp_decls",)
+
     def __init__(self, element: SrcmlWrapper, cpp_element_comments: CppElementComments) -> None:
         super().__init__(element, cpp_element_comments)
         self._cpp_decls: list[CppDecl] = []
@@ -36,7 +37,7 @@ class CppDeclStatement(CppElementAndComment):
     @cpp_decls.setter
     def cpp_decls(self, value):
         self._cpp_decls = value
-        self.fill_children_parents()
+        self._adopt_children(value)
 
     def str_code(self) -> str:
         str_decls = list(
@@ -61,19 +62,20 @@ class CppDeclStatement(CppElementAndComment):
         """
         was_changed = False
 
-        new_decl_statement = copy.deepcopy(self)
         new_cpp_decls: list[CppDecl] = []
-        for cpp_decl in new_decl_statement.cpp_decls:
+        for cpp_decl in self.cpp_decls:
             new_cpp_decl = cpp_decl.with_specialized_template(template_specs)
             if new_cpp_decl is not None:
                 was_changed = True
                 new_cpp_decls.append(new_cpp_decl)
             else:
-                new_cpp_decls.append(cpp_decl)
+                # (cloned, since the new statement will become its parent)
+                new_cpp_decls.append(cpp_decl.shallow_clone())
 
         if not was_changed:
             return None
         else:
+            new_decl_statement = self.shallow_clone()
             new_decl_statement.cpp_decls = new_cpp_decls
             return new_decl_statement
 
@@ -56,6 +56,8 @@ class CppType(CppElementAndComment):
     # (this will not be filled: see note about composed types)
     # argument_list: List[str]
 
+    __slots__ = ("typenames", "specifiers", "modifiers")
+
     def __init__(self, element: SrcmlWrapper) -> None:
         empty_comments = CppElementComments()
         super().__init__(element, empty_comments)
@@ -201,7 +203,7 @@ class CppType(CppElementAndComment):
         import re
 
         was_changed = False
-        new_type = copy.deepcopy(self)
+        new_type = self.shallow_clone()
         for i in range(len(new_type.typenames)):
             for template_spec in template_specs.specializations:
                 assert len(template_spec.cpp_type.typenames) == 1
@@ -243,7 +245,7 @@ class CppType(CppElementAndComment):
         cpp_unit = self.root_cpp_unit()
         new_typename = cpp_unit._scope_identifiers.qualify_cpp_code(typename, current_scope)
         if new_typename != typename:
-            new_type = copy.deepcopy(self)
+            new_type = self.shallow_clone()
             new_type.typenames = new_typename.split(" ")
             return new_type
         else:
@@ -260,7 +262,7 @@ class CppType(CppElementAndComment):
 
         new_type_name = make_terse_code(type_name_qualified, current_scope.str_cpp_prefix)
         if new_type_name != " ".join(self.typenames):
-            new_cpp_type = copy.deepcopy(self)
+            new_cpp_type = self.shallow_clone()
             new_cpp_type.typenames = new_type_name.split(" ")
             return new_cpp_type
         else:
@@ -18,6 +18,8 @@ class CppConstructor(CppConstructorDecl):
     _block: CppUnprocessed
     _member_init_list: CppUnprocessed
 
+    __slots__ = ("_block", "_member_init_list")
+
     def __init__(self, element: SrcmlWrapper, cpp_element_comments: CppElementComments) -> None:
         super().__init__(element, cpp_element_comments)
 
@@ -28,7 +30,7 @@ class CppConstructor(CppConstructorDecl):
     @block.setter
     def block(self, value: CppUnprocessed) -> None:
         self._block = value
-        self.fill_children_parents()
+        self._adopt_children([value])
 
     @property
     def member_init_list(self) -> CppUnprocessed:
@@ -37,7 +39,7 @@ class CppConstructor(CppConstructorDecl):
     @member_init_list.setter
     def member_init_list(self, value: CppUnprocessed) -> None:
         self._member_init_list = value
-        self.fill_children_parents()
+        self._adopt_children([value])
 
     def str_code(self) -> str:
         r = self._str_signature()
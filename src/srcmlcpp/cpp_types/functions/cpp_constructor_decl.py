@@ -1,9 +1,16 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from srcmlcpp.cpp_types.base import CppElementComments
+from srcmlcpp.cpp_types.base import CppAccessType, CppElementComments
+from srcmlcpp.cpp_types.decls_types.cpp_decl import CppDecl
 from srcmlcpp.cpp_types.functions.cpp_function_decl import CppFunctionDecl
-from srcmlcpp.srcml_wrapper import SrcmlWrapper
+from srcmlcpp.cpp_types.functions.cpp_parameter import CppParameter
+from srcmlcpp.cpp_types.functions.cpp_parameter_list import CppParameterList
+from srcmlcpp.srcml_wrapper import SrcmlWrapper, make_synthetic_srcml_wrapper
+
+if TYPE_CHECKING:
+    from srcmlcpp.cpp_types.classes.cpp_struct import CppStruct
 
 __all__ = ["CppConstructorDecl"]
 
@@ -14,11 +21,40 @@ class CppConstructorDecl(CppFunctionDecl):
     https://www.srcml.org/doc/cpp_srcML.html#constructor-declaration
     """
 
+    __slots__ = ()
+
     def __init__(self, element: SrcmlWrapper, cpp_element_comments: CppElementComments) -> None:
         super().__init__(element, cpp_element_comments)
         self.specifiers: list[str] = []
         self.function_name = ""
 
+    @staticmethod
+    def from_decls(parent_struct: CppStruct, parameters_decls: list[CppDecl]) -> CppConstructorDecl:
+        """Builds a constructor of parent_struct, whose parameters are copies of the given decls
+        (typically some members of the struct), without calling srcML.
+
+        The constructor is attached (as a child of a public zone) to parent_struct, so that its scope is correct.
+        However, it is not added to the struct's children.
+        """
+        from srcmlcpp.cpp_types.blocks.cpp_public_protected_private import CppPublicProtectedPrivate
+
+        options = parent_struct.options
+
+        public_zone = CppPublicProtectedPrivate(
+            make_synthetic_srcml_wrapper(options, "public", parent_struct), CppAccessType.public, "default"
+        )
+        public_zone.parent = parent_struct.block
+
+        r = CppConstructorDecl(
+            make_synthetic_srcml_wrapper(options, "constructor_decl", parent_struct), CppElementComments()
+        )
+        r.function_name = parent_struct.class_name
+        r.parent = public_zone
+
+        r.parameter_list = CppParameterList(make_synthetic_srcml_wrapper(options, "parameter_list", parent_struct))
+        r.parameter_list.parameters = [CppParameter.from_decl(decl) for decl in parameters_decls]
+        return r
+
     def _str_signature(self) -> str:
         r = f"{self.function_name}({self.parameter_list})"
         if len(self.specifiers) > 0:
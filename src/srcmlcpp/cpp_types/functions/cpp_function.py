@@ -17,6 +17,8 @@ class CppFunction(CppFunctionDecl):
 
     _block: CppUnprocessed
 
+    __slots__ = ("_block",)
+
     def __init__(self, element: SrcmlWrapper, cpp_element_comments: CppElementComments) -> None:
         super().__init__(element, cpp_element_comments)
 
@@ -27,7 +29,7 @@ class CppFunction(CppFunctionDecl):
     @block.setter
     def block(self, value: CppUnprocessed) -> None:
         self._block = value
-        self.fill_children_parents()
+        self._adopt_children([value])
 
     def str_code(self) -> str:
         r = self._str_signature()
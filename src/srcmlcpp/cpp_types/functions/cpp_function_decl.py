@@ -1,5 +1,4 @@
 from __future__ import annotations
-import copy
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -54,6 +53,19 @@ class CppFunctionDecl(CppElementAndComment, CppITemplateHost):
     _cache_with_qualified_types: ScopedElementCache
     _cache_with_terse_types: ScopedElementCache
 
+    __slots__ = (
+        "specifiers",
+        "_return_type",
+        "_parameter_list",
+        "function_name",
+        "is_pure_virtual",
+        "_noexcept",
+        "_cache_with_qualified_types",
+        "_cache_with_terse_types",
+        "_template",
+        "specialized_template_params",
+    )
+
     def __init__(self, element: SrcmlWrapper, cpp_element_comments: CppElementComments) -> None:
         super().__init__(element, cpp_element_comments)
         self._init_template_host()
@@ -64,6 +76,11 @@ class CppFunctionDecl(CppElementAndComment, CppITemplateHost):
         self._cache_with_terse_types = ScopedElementCache()
         self._noexcept = None
 
+    def _on_cloned(self) -> None:
+        super()._on_cloned()
+        self._cache_with_qualified_types = ScopedElementCache()
+        self._cache_with_terse_types = ScopedElementCache()
+
     def has_return_type(self) -> bool:
         return hasattr(self, "_return_type")
 
@@ -74,7 +91,7 @@ class CppFunctionDecl(CppElementAndComment, CppITemplateHost):
     @return_type.setter
     def return_type(self, new_return_type: CppType) -> None:
         self._return_type = new_return_type
-        self._return_type.parent = self
+        self._adopt_children([new_return_type])
 
     @property
     def parameter_list(self) -> CppParameterList:
@@ -83,9 +100,7 @@ class CppFunctionDecl(CppElementAndComment, CppITemplateHost):
     @parameter_list.setter
     def parameter_list(self, new_parameter_list: CppParameterList) -> None:
         self._parameter_list = new_parameter_list
-        self._parameter_list.parent = self
-        for param in self._parameter_list.parameters:
-            param.parent = self._parameter_list
+        self._adopt_children([new_parameter_list])
 
     @property
     def noexcept(self):
@@ -132,7 +147,7 @@ class CppFunctionDecl(CppElementAndComment, CppITemplateHost):
         """Returns a new partially or fully specialized template function, implemented for the given type
         Returns None if the type(s) provided by template_specs is not used by this function.
         """
-        new_function = copy.deepcopy(self)
+        new_function = self.clone_path("parameter_list")
         new_function._store_template_specs(template_specs)
 
         was_changed = False
@@ -147,12 +162,13 @@ class CppFunctionDecl(CppElementAndComment, CppITemplateHost):
         for parameter in new_function.parameter_list.parameters:
             new_decl = parameter.decl.with_specialized_template(template_specs)
             if new_decl is not None:
-                new_parameter = copy.deepcopy(parameter)
+                new_parameter = parameter.shallow_clone()
                 new_parameter.decl = new_decl
                 new_parameters.append(new_parameter)
                 was_changed = True
             else:
-                new_parameters.append(parameter)
+                # (cloned, since the parameters setter sets its parent)
+                new_parameters.append(parameter.shallow_clone())
 
         new_function.parameter_list.parameters = new_parameters
 
@@ -198,10 +214,17 @@ class CppFunctionDecl(CppElementAndComment, CppITemplateHost):
 
         r = self
         if was_changed:
-            r = copy.deepcopy(self)
+            r = self.shallow_clone()
+            # (the unchanged children are cloned, since the setters set their parents)
             if new_return_type is not None:
-                r.return_type = new_return_type
-            r.parameter_list = new_parameter_list
+                r.return_type = (
+                    new_return_type if new_return_type is not self.return_type else new_return_type.shallow_clone()
+                )
+            r.parameter_list = (
+                new_parameter_list
+                if new_parameter_list is not self.parameter_list
+                else new_parameter_list.shallow_clone()
+            )
 
         self._cache_with_qualified_types.store(current_scope, r)
         return r
@@ -246,10 +269,17 @@ class CppFunctionDecl(CppElementAndComment, CppITemplateHost):
 
         r = self
         if was_changed:
-            r = copy.deepcopy(self)
+            r = self.shallow_clone()
+            # (the unchanged children are cloned, since the setters set their parents)
             if new_return_type is not None:
-                r.return_type = new_return_type
-            r.parameter_list = new_parameter_list
+                r.return_type = (
+                    new_return_type if new_return_type is not self.return_type else new_return_type.shallow_clone()
+                )
+            r.parameter_list = (
+                new_parameter_list
+                if new_parameter_list is not self.parameter_list
+                else new_parameter_list.shallow_clone()
+            )
         self._cache_with_terse_types.store(current_scope, r)
         return r
 
@@ -177,12 +177,33 @@ class CppParameter(CppElementAndComment):
     _decl: CppDecl
 
     template_type: str  # This is only for template's CppParameterList (will be "typename" or "class")
-    template_name: str = ""  # This is only for template's CppParameterList (name of the template type, e.g. "T")
-    template_init: str = ""  # For templates with default int value, e.g. `template<int N=1> void f()`
+    template_name: str  # This is only for template's CppParameterList (name of the template type, e.g. "T")
+    template_init: str  # For templates with default int value, e.g. `template<int N=1> void f()`
+
+    __slots__ = ("_decl", "template_type", "template_name", "template_init")
 
     def __init__(self, element: SrcmlWrapper) -> None:
         dummy_cpp_element_comments = CppElementComments()
         super().__init__(element, dummy_cpp_element_comments)
+        self.template_name = ""
+        self.template_init = ""
+
+    @staticmethod
+    def from_decl(decl: CppDecl) -> CppParameter:
+        """Creates a parameter from a copy of a decl, without calling srcML.
+        The copy does not keep the decl comments, and its initial value is written as a default value
+        (`int a{5}` gives the parameter `int a = {5}`)
+        """
+        from srcmlcpp.srcml_wrapper import make_synthetic_srcml_wrapper
+
+        new_decl = decl.shallow_clone()
+        new_decl.cpp_element_comments = CppElementComments()
+        new_decl.initial_value_via_initializer_list = False
+        new_decl._clear_scope_cache()
+
+        r = CppParameter(make_synthetic_srcml_wrapper(decl.options, "parameter", decl))
+        r.decl = new_decl
+        return r
 
     @property
     def decl(self) -> CppDecl:
@@ -191,7 +212,7 @@ class CppParameter(CppElementAndComment):
     @decl.setter
     def decl(self, new_decl: CppDecl) -> None:
         self._decl = new_decl
-        self._decl.parent = self
+        self._adopt_children([new_decl])
 
     def type_name_default_for_signature(self) -> str:
         assert hasattr(self, "decl")
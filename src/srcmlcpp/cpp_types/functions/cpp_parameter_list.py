@@ -1,6 +1,5 @@
 from __future__ import annotations
 from dataclasses import dataclass
-import copy
 
 from srcmlcpp.cpp_types.base import (
     CppElementAndComment,
@@ -24,6 +23,8 @@ class CppParameterList(CppElementAndComment):
 
     _parameters: list[CppParameter]
 
+    __slots__ = ("_parameters",)
+
     def __init__(self, element: SrcmlWrapper) -> None:
         empty_comments = CppElementComments()
         super().__init__(element, empty_comments)
@@ -36,7 +37,7 @@ class CppParameterList(CppElementAndComment):
     @parameters.setter
     def parameters(self, new_parameters: list[CppParameter]) -> None:
         self._parameters = new_parameters
-        self.fill_children_parents()
+        self._adopt_children(new_parameters)
 
     def list_types_names_only(self) -> list[str]:
         """Returns a list like ["int", "bool"]"""
@@ -97,7 +98,6 @@ class CppParameterList(CppElementAndComment):
         if current_scope is None:
             current_scope = self.cpp_scope()
         was_changed = False
-        # new_parameter_list = copy.deepcopy(self)
         new_parameters: list[CppParameter] = []
 
         # handle void instead of empty param:
@@ -107,19 +107,19 @@ class CppParameterList(CppElementAndComment):
             was_changed = True
         else:
             for i in range(len(self.parameters)):
-                # new_param = new_parameter_list.parameters[i]
                 self_param = self.parameters[i]
                 new_param_decl = self_param.decl.with_qualified_types(current_scope)
                 if new_param_decl is not self_param.decl:
-                    new_param = copy.deepcopy(self.parameters[i])
+                    new_param = self_param.shallow_clone()
                     new_param.decl = new_param_decl
                     new_parameters.append(new_param)
                     was_changed = True
                 else:
-                    new_parameters.append(self_param)
+                    # (cloned, since the parameters setter sets its parent)
+                    new_parameters.append(self_param.shallow_clone())
 
         if was_changed:
-            r = copy.deepcopy(self)
+            r = self.shallow_clone()
             r.parameters = new_parameters
             return r
         else:
@@ -129,21 +129,21 @@ class CppParameterList(CppElementAndComment):
         if current_scope is None:
             current_scope = self.cpp_scope()
         was_changed = False
-        # new_parameter_list = copy.deepcopy(self)
         new_parameters: list[CppParameter] = []
         for i in range(len(self.parameters)):
             self_param = self.parameters[i]
             new_decl = self_param.decl.with_terse_types(current_scope)
             if new_decl is not self_param.decl:
                 was_changed = True
-                new_parameter = copy.deepcopy(self_param)
+                new_parameter = self_param.shallow_clone()
                 new_parameter.decl = new_decl
                 new_parameters.append(new_parameter)
             else:
-                new_parameters.append(self_param)
+                # (cloned, since the parameters setter sets its parent)
+                new_parameters.append(self_param.shallow_clone())
 
         if was_changed:
-            new_parameter_list = copy.deepcopy(self)
+            new_parameter_list = self.shallow_clone()
             new_parameter_list.parameters = new_parameters
             return new_parameter_list
         else:
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Final, Optional
+from typing import ClassVar, Final, Optional, Sequence
 
 
 class CppScopeType(Enum):
@@ -12,22 +12,40 @@ class CppScopeType(Enum):
     _Unknown = "_Unknown"
 
 
-@dataclass
+@dataclass(frozen=True)
 class CppScopePart:
     scope_type: CppScopeType
     scope_name: str
 
 
 class CppScope:
-    scope_parts: Final[list[CppScopePart]]
+    """A C++ scope, e.g. "A::B::C".
+
+    Scopes are interned: CppScope(parts) returns the same (immutable) instance for the same parts,
+    so that each scope (and its parent scopes and hierarchy lists) is built only once.
+    Do not modify scope_parts, scope_hierarchy_list or scope_hierarchy_prefix_list: they are shared.
+    """
+
+    scope_parts: Final[tuple[CppScopePart, ...]]
     str_cpp_prefix: Final[str]
     str_cpp: Final[str]
     parent_scope: Final[Optional[CppScope]]
     scope_hierarchy_list: Final[list[CppScope]]
     scope_hierarchy_prefix_list: Final[list[str]]
 
-    def __init__(self, scopes: list[CppScopePart]) -> None:
-        self.scope_parts = scopes
+    _interned_scopes: ClassVar[dict[tuple[CppScopePart, ...], CppScope]] = {}
+
+    def __new__(cls, scopes: Sequence[CppScopePart]) -> CppScope:
+        interned = cls._interned_scopes.get(tuple(scopes))
+        if interned is not None:
+            return interned
+        return super().__new__(cls)
+
+    def __init__(self, scopes: Sequence[CppScopePart]) -> None:
+        if hasattr(self, "str_cpp"):
+            return  # this is an interned scope, which was already initialized
+
+        self.scope_parts = tuple(scopes)
 
         # Fill static final members
         if len(self.scope_parts) == 0:
@@ -40,17 +58,27 @@ class CppScope:
         self.str_cpp = str_cpp
         self.str_cpp_prefix = str_cpp_prefix
 
-        self.parent_scope = self.parent_scope = CppScope(self.scope_parts[:-1]) if len(self.scope_parts) > 0 else None
+        self.parent_scope = CppScope(self.scope_parts[:-1]) if len(self.scope_parts) > 0 else None
         self.scope_hierarchy_list = self._make_scope_hierarchy_list()
         self.scope_hierarchy_prefix_list = [scope.str_cpp_prefix for scope in self.scope_hierarchy_list]
 
+        CppScope._interned_scopes[self.scope_parts] = self
+
+    def __reduce__(self) -> tuple[type[CppScope], tuple[tuple[CppScopePart, ...]]]:
+        # unpickled scopes are interned as well
+        return CppScope, (self.scope_parts,)
+
+    def __copy__(self) -> CppScope:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, object]) -> CppScope:
+        return self
+
     def _make_scope_hierarchy_list(self) -> list[CppScope]:
         """Given "A::B::C", return ["A::B::C", "A::B", "A", ""]"""
-        r = []
-        current_scope: Optional[CppScope] = self
-        while current_scope is not None:
-            r.append(current_scope)
-            current_scope = current_scope.parent_scope
+        r: list[CppScope] = [self]
+        if self.parent_scope is not None:
+            r += self.parent_scope.scope_hierarchy_list  # (parent scopes are interned and already built)
         return r
 
     @staticmethod
@@ -74,7 +102,7 @@ class CppScope:
         return False
 
     def make_child_scope(self, child_scope: CppScopePart) -> CppScope:
-        return CppScope(self.scope_parts + [child_scope])
+        return CppScope(self.scope_parts + (child_scope,))
 
     def qualified_name(self, name: str) -> str:
         return self.str_cpp_prefix + name
@@ -1,18 +1,26 @@
+from __future__ import annotations
 from srcmlcpp.cpp_types.scope import CppScope
 from srcmlcpp.cpp_types.base.cpp_element import CppElement
-from srcmlcpp.cpp_types.scope.cpp_scope_process import apply_scoped_identifiers_to_code
+from srcmlcpp.cpp_types.scope.cpp_scope_process import (
+    ScopedIdentifiersIndex,
+    apply_scoped_identifiers_index_to_code,
+)
 
 
 class CppScopeIdentifiers:
     _scoped_identifiers: list[str]
+    # lookup structure for _scoped_identifiers (built lazily, reset by fill_cache)
+    _scoped_identifiers_index: ScopedIdentifiersIndex | None
 
     def __init__(self) -> None:
         self._scoped_identifiers = []
+        self._scoped_identifiers_index = None
 
     def fill_cache(self, all_elements: list[CppElement]) -> None:
         from srcmlcpp.cpp_types import CppStruct, CppFunctionDecl, CppEnum
         from srcmlcpp.cpp_types.decls_types.cpp_decl import CppDecl, CppDeclContext
 
+        self._scoped_identifiers_index = None
         for element in all_elements:
             element_scope = element.cpp_scope()
             shall_add = False
@@ -60,7 +68,9 @@ class CppScopeIdentifiers:
         # scope = A::ClassNoDefaultCtor
         # scoped_identifier = N::Foo
         # => can access
-        new_code = apply_scoped_identifiers_to_code(
-            new_code, current_scope.scope_hierarchy_prefix_list, self._scoped_identifiers
+        if self._scoped_identifiers_index is None:
+            self._scoped_identifiers_index = ScopedIdentifiersIndex(self._scoped_identifiers)
+        new_code = apply_scoped_identifiers_index_to_code(
+            new_code, current_scope.scope_hierarchy_prefix_list, self._scoped_identifiers_index
         )
         return new_code
@@ -1,5 +1,9 @@
 # Heart of the scoping mechanism. Those functions depend on no other module,
 # so that a possible improvement via Cython can be done.
+import bisect
+import re
+from functools import lru_cache
+from typing import Callable
 
 
 def current_token_matches_scoped_identifier(
@@ -30,63 +34,78 @@ def current_token_matches_scoped_identifier(
     return False
 
 
+class ScopedIdentifiersIndex:
+    """A lookup structure for the scoped identifiers of a unit, used to qualify code.
+
+    It maps each qualified name to its positions in the list of scoped identifiers, so that matching
+    a token is done via a few dict lookups (one per scope prefix), instead of a loop on all identifiers.
+    """
+
+    _positions: dict[str, list[int]]
+
+    def __init__(self, scoped_identifier_qualified_names: list[str]) -> None:
+        self._positions = {}
+        for position, qualified_name in enumerate(scoped_identifier_qualified_names):
+            self._positions.setdefault(qualified_name, []).append(position)
+
+    def qualify_token(self, current_token: str, current_scope_hierarchy: list[str]) -> str:
+        """Returns the same result as successively trying to match current_token with each
+        scoped identifier (in the order of the list), replacing it on each match
+        (see current_token_matches_scoped_identifier)"""
+        if current_token.startswith("::"):
+            return current_token
+        last_position = -1
+        while True:
+            # find the next scoped identifier (in the list order) which matches the current token
+            next_position = -1
+            next_qualified_name = ""
+            for current_scope_prefix in current_scope_hierarchy:
+                candidate = current_scope_prefix + current_token
+                positions = self._positions.get(candidate)
+                if positions is None:
+                    continue
+                idx = bisect.bisect_right(positions, last_position)
+                if idx < len(positions) and (next_position < 0 or positions[idx] < next_position):
+                    next_position = positions[idx]
+                    next_qualified_name = candidate
+            if next_position < 0:
+                return current_token
+            current_token = next_qualified_name
+            last_position = next_position
+
+
+# Tokens of C++ code: string literals and comments (which are left untouched), or identifiers (possibly scoped)
+_LITERAL_OR_IDENTIFIER_RE = re.compile(r'"[^"]*"?|//[^\n]*\n?|(?P<identifier>(?:\w|::)+)')
+
+
+def transform_cpp_identifiers(cpp_code: str, transform: Callable[[str], str]) -> str:
+    """Applies transform to each identifier (possibly scoped, e.g. "A::B::foo") of cpp_code.
+    String literals and comments are left untouched.
+    This is the tokenizer shared by the qualify and terse transforms: it works in a single pass, via a compiled regex.
+    """
+
+    def transform_match(match: re.Match[str]) -> str:
+        token = match.group("identifier")
+        if token is None:
+            return match.group(0)
+        return transform(token)
+
+    return _LITERAL_OR_IDENTIFIER_RE.sub(transform_match, cpp_code)
+
+
+def apply_scoped_identifiers_index_to_code(
+    cpp_code: str, current_scope_hierarchy: list[str], scoped_identifiers_index: ScopedIdentifiersIndex
+) -> str:
+    return transform_cpp_identifiers(
+        cpp_code, lambda token: scoped_identifiers_index.qualify_token(token, current_scope_hierarchy)
+    )
+
+
 def apply_scoped_identifiers_to_code(
     cpp_code: str, current_scope_hierarchy: list[str], scoped_identifier_qualified_names: list[str]
 ) -> str:
-    new_code = ""
-    current_token = ""
-    i = 0
-    in_string = False
-    in_comment = False
-
-    while i < len(cpp_code):
-        char = cpp_code[i]
-
-        # Check for string literal start/end
-        if char == '"' and not in_comment:
-            in_string = not in_string
-
-        # Check for comment start
-        if char == "/" and i + 1 < len(cpp_code) and cpp_code[i + 1] == "/" and not in_string:
-            in_comment = True
-
-        # Process characters outside strings and comments
-        if not in_string and not in_comment:
-            if char.isalnum() or char == "_":
-                current_token += char
-            elif char == ":" and i + 1 < len(cpp_code) and cpp_code[i + 1] == ":":
-                current_token += "::"
-                i += 1
-            else:
-                if current_token:
-                    for scoped_identifier_qualified_name in scoped_identifier_qualified_names:
-                        if current_token_matches_scoped_identifier(
-                            scoped_identifier_qualified_name, current_scope_hierarchy, current_token
-                        ):
-                            current_token = scoped_identifier_qualified_name
-                    new_code += current_token
-                    current_token = ""
-                new_code += char
-        else:
-            new_code += char
-
-        # Reset in_comment at the end of the line
-        if char == "\n":
-            in_comment = False
-
-        i += 1
-
-    # Add the last token if it exists
-    if current_token:
-        for scoped_identifier_qualified_name in scoped_identifier_qualified_names:
-            if current_token_matches_scoped_identifier(
-                scoped_identifier_qualified_name, current_scope_hierarchy, current_token
-            ):
-                current_token = scoped_identifier_qualified_name
-
-        new_code += current_token
-
-    return new_code
+    scoped_identifiers_index = ScopedIdentifiersIndex(scoped_identifier_qualified_names)
+    return apply_scoped_identifiers_index_to_code(cpp_code, current_scope_hierarchy, scoped_identifiers_index)
 
 
 def _make_terse_scoped_identifier(scoped_identifier: str, current_scope: str) -> str:
@@ -121,49 +140,7 @@ def _make_terse_scoped_identifier(scoped_identifier: str, current_scope: str) ->
     return scoped_identifier
 
 
+@lru_cache(maxsize=8192)
 def make_terse_code(cpp_code: str, current_scope_prefix: str) -> str:
-    new_code = ""
-    current_token = ""
-    i = 0
-    in_string = False
-    in_comment = False
-
-    while i < len(cpp_code):
-        char = cpp_code[i]
-
-        # Check for string literal start/end
-        if char == '"' and not in_comment:
-            in_string = not in_string
-
-        # Check for comment start
-        if char == "/" and i + 1 < len(cpp_code) and cpp_code[i + 1] == "/" and not in_string:
-            in_comment = True
-
-        # Process characters outside strings and comments
-        if not in_string and not in_comment:
-            if char.isalnum() or char == "_":
-                current_token += char
-            elif char == ":" and i + 1 < len(cpp_code) and cpp_code[i + 1] == ":":
-                current_token += "::"
-                i += 1
-            else:
-                if current_token:
-                    current_token = _make_terse_scoped_identifier(current_token, current_scope_prefix)
-                    new_code += current_token
-                    current_token = ""
-                new_code += char
-        else:
-            new_code += char
-
-        # Reset in_comment at the end of the line
-        if char == "\n":
-            in_comment = False
-
-        i += 1
-
-    # Add the last token if it exists
-    if current_token:
-        current_token = _make_terse_scoped_identifier(current_token, current_scope_prefix)
-        new_code += current_token
-
-    return new_code
+    # Note: the same types and values are made terse many times in the same scope, hence the cache
+    return transform_cpp_identifiers(cpp_code, lambda token: _make_terse_scoped_identifier(token, current_scope_prefix))
@@ -0,0 +1,107 @@
+"""A symbol table for a CppUnit: the structs, enums and functions defined in it, indexed by their qualified name"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from srcmlcpp.cpp_types.scope.cpp_scope import CppScope
+
+if TYPE_CHECKING:
+    from srcmlcpp.cpp_types.base.cpp_element import CppElement
+    from srcmlcpp.cpp_types.classes.cpp_struct import CppStruct
+
+QualifiedName = str
+CppScopeName = str
+
+
+class CppSymbolTable:
+    """Indexes the structs, enums and functions of a unit:
+    * by qualified name (e.g. "A::B::Foo")
+    * by scope (e.g. "A::B" -> {"Foo": [...]}), i.e. the names declared directly inside each scope
+
+    Several elements can share the same qualified name (e.g. function overloads): they are stored
+    in the order of the code.
+
+    The table is built once (see CppUnit.symbol_table()), and rebuilt when the unit is mutated.
+    """
+
+    _by_qualified_name: dict[QualifiedName, list[CppElement]]
+    _by_scope: dict[CppScopeName, dict[str, list[CppElement]]]
+    _structs_by_name: dict[str, list[CppStruct]]
+
+    def __init__(self, all_elements: list[CppElement]) -> None:
+        from srcmlcpp.cpp_types.classes.cpp_struct import CppStruct
+        from srcmlcpp.cpp_types.cpp_enum import CppEnum
+        from srcmlcpp.cpp_types.functions.cpp_function_decl import CppFunctionDecl
+
+        self._by_qualified_name = {}
+        self._by_scope = {}
+        self._structs_by_name = {}
+        for element in all_elements:
+            if not isinstance(element, (CppStruct, CppEnum, CppFunctionDecl)):
+                continue
+            name = element.name()
+            if len(name) == 0:
+                continue  # anonymous struct or enum
+            scope_str = element.cpp_scope_str(include_self=False)
+            qualified_name = scope_str + "::" + name if len(scope_str) > 0 else name
+            self._by_qualified_name.setdefault(qualified_name, []).append(element)
+            self._by_scope.setdefault(scope_str, {}).setdefault(name, []).append(element)
+            if isinstance(element, CppStruct):
+                self._structs_by_name.setdefault(name, []).append(element)
+
+    def find(self, qualified_name: QualifiedName) -> list[CppElement]:
+        """The elements with this exact qualified name"""
+        return self._by_qualified_name.get(qualified_name.lstrip(":"), [])
+
+    def names_in_scope(self, scope: CppScope) -> dict[str, list[CppElement]]:
+        """The names declared directly inside a scope"""
+        return self._by_scope.get(scope.str_cpp, {})
+
+    def lookup(
+        self, name_with_scope: str, current_scope: CppScope, wanted_type: type | None = None
+    ) -> CppElement | None:
+        """Look up a (possibly partially qualified) name from a scope, like C++ does:
+        the innermost scopes are searched first"""
+        if name_with_scope.startswith("::"):
+            searched_scopes = [CppScope([])]
+        else:
+            searched_scopes = current_scope.scope_hierarchy_list
+        for scope in searched_scopes:
+            for element in self._by_qualified_name.get(scope.qualified_name(name_with_scope.lstrip(":")), []):
+                if wanted_type is None or isinstance(element, wanted_type):
+                    return element
+        return None
+
+    def find_struct_or_class(self, class_name_with_scope: str, current_scope: CppScope) -> CppStruct | None:
+        """Given a current scope, look for an existing matching class
+        class_name_with_scope is a name that could include additional scopes
+        """
+        from srcmlcpp.cpp_types.classes.cpp_struct import CppStruct
+
+        r = self.lookup(class_name_with_scope, current_scope, CppStruct)
+        if r is not None:
+            assert isinstance(r, CppStruct)
+            return r
+        return self._find_struct_or_class_lenient(class_name_with_scope, current_scope)
+
+    def _find_struct_or_class_lenient(self, class_name_with_scope: str, current_scope: CppScope) -> CppStruct | None:
+        """Fallback when the C++ lookup fails: accepts a struct with the same name, whose scope is a prefix
+        of the searched scopes (this was the historical behavior of CppBlock.find_struct_or_class)"""
+        if "::" in class_name_with_scope:
+            items = class_name_with_scope.split("::")
+            class_name = items[-1]
+            class_scope_str = "::".join(items[:-1])
+        else:
+            class_name = class_name_with_scope
+            class_scope_str = ""
+
+        searched_scopes_strs = [class_scope_str]
+        if len(current_scope.str_cpp) > 0:
+            searched_scopes_strs.append(current_scope.str_cpp + "::" + class_scope_str)
+
+        for struct in self._structs_by_name.get(class_name, []):
+            struct_scope_str = struct.cpp_scope_str(include_self=False)
+            for searched_scope_str in searched_scopes_strs:
+                if searched_scope_str.startswith(struct_scope_str):
+                    return struct
+        return None
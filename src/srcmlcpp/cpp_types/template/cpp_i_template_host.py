@@ -17,6 +17,9 @@ class CppITemplateHost:
     _template: CppTemplate
     specialized_template_params: list[CppType]  # Will only be filled after calling with_specialized_template
 
+    # The members above are declared in the __slots__ of the derived classes
+    __slots__ = ()
+
     def __init__(self, _element: SrcmlWrapper, _cpp_element_comments: CppElementComments) -> None:
         self._init_template_host()
 
@@ -27,11 +30,11 @@ class CppITemplateHost:
     @template.setter
     def template(self, value: CppTemplate) -> None:
         # We can't call self.fill_children_parents() from here !
-        self._template = value
+        self._template = value  # type: ignore[misc]  # (slot declared by the derived classes)
 
     def _init_template_host(self) -> None:
         # self.template is not set by default. This denotes that the class of function is not a template
-        self.specialized_template_params = []
+        self.specialized_template_params = []  # type: ignore[misc]
 
     def is_template(self) -> bool:
         return hasattr(self, "template")
@@ -26,6 +26,8 @@ class CppTemplate(CppElementAndComment):
 
     _parameter_list: CppParameterList
 
+    __slots__ = ("_parameter_list",)
+
     def __init__(self, element: SrcmlWrapper) -> None:
         from srcmlcpp.cpp_types.functions.cpp_parameter_list import CppParameterList
 
@@ -40,7 +42,7 @@ class CppTemplate(CppElementAndComment):
     @parameter_list.setter
     def parameter_list(self, value: CppParameterList) -> None:
         self._parameter_list = value
-        self.fill_children_parents()
+        self._adopt_children([value])
 
     def str_code(self) -> str:
         typelist = [param.str_template_type() for param in self.parameter_list.parameters]
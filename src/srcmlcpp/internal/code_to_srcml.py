@@ -9,13 +9,13 @@ import sys
 # mypy: warn_unused_ignores=False
 from typing import Optional
 import logging
-import os
-import random
+import shutil
 import subprocess
-import tempfile
 import time
 from xml.etree import ElementTree as ET
 
+from srcmlcpp.internal.srcml_disk_cache import SrcmlDiskCache
+
 # srcML can be used either via the python module srcml_caller or via the executable srcml
 try:
     import srcml_caller as srcml_nativecaller  # type: ignore # noqa
@@ -28,6 +28,9 @@ except ImportError:
 # Count the total time used by call to the exe srcml
 _FLAG_PROFILE_SRCML_CALLS: bool = True
 
+# srcml_to_code reconstructs the code in python from the xml tree (set to False to call srcML instead)
+_FLAG_SRCML_TO_CODE_IN_PYTHON: bool = True
+
 
 def _embed_element_into_unit(element: ET.Element) -> ET.Element:
     if element.tag.endswith("unit"):
@@ -38,9 +41,41 @@ def _embed_element_into_unit(element: ET.Element) -> ET.Element:
         return new_element
 
 
+def _is_escape_tag(tag: str) -> bool:
+    return tag == "escape" or tag.endswith("}escape")
+
+
+def srcml_to_code_in_python(element: ET.Element) -> str:
+    """Reconstructs the code corresponding to a srcML xml element, without calling srcML.
+
+    srcML is lossless: the code is the concatenation of the texts and tails inside the tree.
+    Like srcml_to_code, the tail of the element itself is included (unless it is a unit)
+    """
+    parts: list[str] = []
+
+    def visit(e: ET.Element) -> None:
+        if _is_escape_tag(e.tag):
+            # srcML represents some control chars (e.g. form feed) as <escape char="0x0c"/>
+            char = e.attrib.get("char")
+            if char is not None:
+                parts.append(chr(int(char, 16)))
+        elif e.text is not None:
+            parts.append(e.text)
+        for child in e:
+            visit(child)
+            if child.tail is not None:
+                parts.append(child.tail)
+
+    visit(element)
+    if not element.tag.endswith("unit") and element.tail is not None:
+        parts.append(element.tail)
+    return "".join(parts)
+
+
 class _TimeStats:
     nb_calls: int = 0
     total_time: float = 0.0
+    max_time: float = 0.0
     _last_start_time: float = 0.0
 
     def start(self) -> None:
@@ -48,82 +83,111 @@ class _TimeStats:
         self._last_start_time = time.time()
 
     def stop(self) -> None:
-        self.total_time += time.time() - self._last_start_time
+        elapsed = time.time() - self._last_start_time
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
 
     def stats_string(self) -> str:
         if self.nb_calls == 0:
             return ""
-        return f"calls: {self.nb_calls} total time: {self.total_time:.3f}s average: {self.total_time / self.nb_calls * 1000:.0f}ms"
-
-
-class _SrcmlCaller:
-    _stats_code_to_srcml: _TimeStats = _TimeStats()
-    _stats_srcml_to_code: _TimeStats = _TimeStats()
+        return (
+            f"calls: {self.nb_calls} total time: {self.total_time:.3f}s"
+            f" average: {self.total_time / self.nb_calls * 1000:.0f}ms max: {self.max_time * 1000:.0f}ms"
+        )
 
-    def _call_subprocess(self, encoding: str, input_filename: str, output_filename: str, dump_positions: bool) -> None:
-        position_arg = "--position" if dump_positions else ""
 
-        shell_command = f"srcml -l C++ {input_filename} {position_arg} --xml-encoding {encoding} --src-encoding {encoding} -o {output_filename}"
-        logging.debug(f"_SrcmlCaller.call: {shell_command}")
+class _SrcmlExecutable:
+    """Calls the srcml executable: each request spawns a srcml process (via subprocess.run).
+
+    The executable is located once, and the requests are exchanged with the process through pipes
+    (stdin / stdout): no temporary file is written, and no shell is spawned.
+    """
+
+    _executable: str | None = None
+    _version: str | None = None
+    # latency of each request handled by the srcml executable (excluding xml parsing)
+    stats_requests: _TimeStats
+
+    def __init__(self) -> None:
+        self.stats_requests = _TimeStats()
+
+    def _find_executable(self) -> str:
+        if self._executable is None:
+            executable = shutil.which("srcml")
+            if executable is None:
+                logging.error("""
+                srcmlcpp requires the installation of srcML ( https://www.srcml.org )
+                (the command "srcml" needs to be available in your PATH)
+                Did you install it?
+                See install instructions at:
+                    https://pthom.github.io/litgen/litgen_book/01_05_10_install.html
+                """)
+                sys.exit(1)
+            self._executable = executable
+        return self._executable
+
+    def _request(self, args: list[str], input_bytes: bytes) -> bytes:
+        command = [self._find_executable()] + args
+        logging.debug(f"_SrcmlExecutable.request: {command}")
+        self.stats_requests.start()
         try:
-            subprocess.check_call(shell_command, shell=True)
+            completed = subprocess.run(command, input=input_bytes, stdout=subprocess.PIPE, check=True)
         except subprocess.CalledProcessError as e:
-            logging.error(f"_SrcmlCaller.call, error {e}")
-            logging.error("""
-            srcmlcpp requires the installation of srcML ( https://www.srcml.org )
-            (the command "srcml" needs to be available in your PATH)
-            Did you install it?
-            See install instructions at:
-                https://pthom.github.io/litgen/litgen_book/01_05_10_install.html
-            """)
+            logging.error(f"_SrcmlExecutable.request, error {e}")
             sys.exit(1)
+        finally:
+            self.stats_requests.stop()
+        return completed.stdout
 
-    def _random_filename(self) -> str:
-        characters = "abcdefghijklmnopqrstuvwxyz0123456789_"
-        r = "".join(random.choices(characters, k=14))
-        r = tempfile.gettempdir() + "/" + r
-        return r
+    def code_to_xml_str(self, input_str: str, encoding: str, dump_positions: bool) -> str:
+        args = ["--language", "C++", "--xml-encoding", encoding, "--src-encoding", encoding]
+        if dump_positions:
+            args.append("--position")
+        output_bytes = self._request(args, input_str.encode(encoding))
+        return output_bytes.decode(encoding)
 
-    def _make_xml_str_by_subprocess(self, encoding: str, input_str: str, dump_positions: bool = False) -> str:
-        input_header_filename = self._random_filename() + ".h"
-        output_xml_filename = self._random_filename() + ".xml"
-
-        with open(input_header_filename, "wb") as input_header_file:
-            input_header_file.write(input_str.encode(encoding))
-            input_header_file.close()
-
-        self._call_subprocess(
-            encoding,
-            input_header_filename,
-            output_xml_filename,
-            dump_positions,
-        )
+    def version(self) -> str:
+        if self._version is None:
+            self._version = self._request(["--version"], b"").decode("utf-8", errors="replace").strip()
+        return self._version
 
-        with open(output_xml_filename, "rb") as output_xml_file:
-            output_bytes = output_xml_file.read()
-            output_xml_file.close()
+    def xml_to_code_str(self, xml_bytes: bytes, encoding: str) -> str:
+        args = ["--output-src", "--src-encoding", encoding]
+        output_bytes = self._request(args, xml_bytes)
+        return output_bytes.decode(encoding)
 
-        os.remove(input_header_file.name)
-        os.remove(output_xml_file.name)
-        output_str = output_bytes.decode(encoding)
-        return output_str
+
+class _SrcmlCaller:
+    _stats_code_to_srcml: _TimeStats = _TimeStats()
+    _stats_srcml_to_code: _TimeStats = _TimeStats()
+    _stats_srcml_to_code_in_python: _TimeStats = _TimeStats()
+    _srcml_executable: _SrcmlExecutable = _SrcmlExecutable()
+    # optional persistent cache for code_to_srcml results (see SrcmlcppOptions.srcml_cache_directory)
+    _disk_cache: SrcmlDiskCache | None = None
+    # all the disk caches used during this run, by directory (so that their stats are kept)
+    _disk_caches: dict[str, SrcmlDiskCache] = {}
+
+    def set_disk_cache(self, directory: str | None, max_size_mb: float) -> None:
+        """Enables (or disables if directory is None) the persistent cache of code_to_srcml results"""
+        if directory is None:
+            self._disk_cache = None
+            return
+        if directory not in self._disk_caches:
+            self._disk_caches[directory] = SrcmlDiskCache(directory, max_size_mb)
+        self._disk_cache = self._disk_caches[directory]
+        self._disk_cache.max_size_bytes = int(max_size_mb * 1024 * 1024)
+
+    def _srcml_version(self) -> str:
+        if _USE_PYTHON_SRCML_CALLER_MODULE:
+            return "srcml_caller " + str(srcml_nativecaller.__version__)  # type: ignore
+        else:
+            return self._srcml_executable.version()
+
+    def _make_xml_str_by_subprocess(self, encoding: str, input_str: str, dump_positions: bool = False) -> str:
+        return self._srcml_executable.code_to_xml_str(input_str, encoding, dump_positions)
 
     def _make_cpp_str_by_subprocess(self, xml_bytes: bytes, encoding: str) -> str:
-        input_xml_filename = self._random_filename() + ".xml"
-        output_header_filename = self._random_filename() + ".h"
-        with open(input_xml_filename, "wb") as input_xml_file:
-            input_xml_file.write(xml_bytes)
-            input_xml_file.close()
-
-        self._call_subprocess(encoding, input_xml_filename, output_header_filename, False)
-
-        with open(output_header_filename, "rb") as output_header_file:
-            output_bytes = output_header_file.read()
-            output_header_file.close()
-        os.remove(input_xml_filename)
-        os.remove(output_header_filename)
-        code_str = output_bytes.decode(encoding)
-        return code_str
+        return self._srcml_executable.xml_to_code_str(xml_bytes, encoding)
 
     def _make_xml_str_by_module(self, input_str: str, encoding: str, dump_positions: bool = False) -> str:
         r = srcml_nativecaller.to_srcml(  # type: ignore
@@ -159,10 +223,19 @@ class _SrcmlCaller:
         """
         self._stats_code_to_srcml.start()
 
-        if _USE_PYTHON_SRCML_CALLER_MODULE:
-            output_str = self._make_xml_str_by_module(input_str, encoding, dump_positions)
-        else:
-            output_str = self._make_xml_str_by_subprocess(encoding, input_str, dump_positions)
+        output_str: str | None = None
+        cache_key = ""
+        if self._disk_cache is not None:
+            cache_key = SrcmlDiskCache.make_key(input_str, encoding, dump_positions, self._srcml_version())
+            output_str = self._disk_cache.get(cache_key)
+
+        if output_str is None:
+            if _USE_PYTHON_SRCML_CALLER_MODULE:
+                output_str = self._make_xml_str_by_module(input_str, encoding, dump_positions)
+            else:
+                output_str = self._make_xml_str_by_subprocess(encoding, input_str, dump_positions)
+            if self._disk_cache is not None:
+                self._disk_cache.store(cache_key, output_str)
 
         ET.register_namespace("pos", "http://www.srcML.org/srcML/position")
         ET.register_namespace("", "http://www.srcML.org/srcML/src")
@@ -195,6 +268,15 @@ class _SrcmlCaller:
         self._stats_srcml_to_code.stop()
         return code_str
 
+    def srcml_to_code_in_python(self, element: ET.Element) -> str:
+        """Reconstructs the code corresponding to a srcml xml element, without calling srcml"""
+        if element is None:
+            return "<srcml_to_code(None)>"
+        self._stats_srcml_to_code_in_python.start()
+        code_str = srcml_to_code_in_python(element)
+        self._stats_srcml_to_code_in_python.stop()
+        return code_str
+
     def total_time(self) -> float:
         total_time = self._stats_code_to_srcml.total_time + self._stats_srcml_to_code.total_time
         return total_time
@@ -202,15 +284,21 @@ class _SrcmlCaller:
     def profiling_stats(self) -> str:
         from codemanip import code_utils
 
+        exe_requests_stats = self._srcml_executable.stats_requests.stats_string()
         r = code_utils.unindent_code(
             f"""
         Time taken by calls to srcML:
             code_to_srcml {self._stats_code_to_srcml.stats_string()}
             srcml_to_code {self._stats_srcml_to_code.stats_string()}
+            srcml_to_code (in python) {self._stats_srcml_to_code_in_python.stats_string()}
             total time: {self.total_time():.3f}s
         """,
             flag_strip_empty_lines=True,
         )
+        if len(exe_requests_stats) > 0:
+            r += f"\n    (srcml executable requests: {exe_requests_stats})"
+        for directory, disk_cache in self._disk_caches.items():
+            r += f"\n    (srcml disk cache {directory}: {disk_cache.stats_string()})"
         return r
 
 
@@ -222,4 +310,7 @@ def code_to_srcml(code: str, dump_positions: bool = True, encoding: str = "utf-8
 
 
 def srcml_to_code(element: ET.Element, encoding: str = "utf-8") -> str:
-    return _SRCML_CALLER.srcml_to_code(encoding, element)
+    if _FLAG_SRCML_TO_CODE_IN_PYTHON:
+        return _SRCML_CALLER.srcml_to_code_in_python(element)
+    else:
+        return _SRCML_CALLER.srcml_to_code(encoding, element)
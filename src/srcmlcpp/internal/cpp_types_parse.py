@@ -155,7 +155,7 @@ def _parse_expr(element: SrcmlWrapper) -> str:
                 <ns0:operator><</ns0:operator>
                 <ns0:literal type="number">20</ns0:literal>
             </ns0:expr>
-    we will call srcml_to_code, which will invoke the executable srcml
+    we will call srcml_to_code, which will reconstruct the code from the xml tree
     """
 
     def expr_literal_value(expr_element: ET.Element) -> Optional[str]:
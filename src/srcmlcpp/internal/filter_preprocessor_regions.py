@@ -1,5 +1,4 @@
 from __future__ import annotations
-import copy
 from dataclasses import dataclass
 from typing import Optional
 from xml.etree import ElementTree as ET
@@ -235,16 +234,16 @@ class _SrcmlPreprocessorState:
 
 
 def filter_preprocessor_regions(unit: ET.Element, header_acceptable__regex: RegexOrMatcher) -> ET.Element:
-    filtered_unit = copy.deepcopy(unit)
+    """Returns a new element, with the same children as unit, except the ones that are in excluded regions.
+    The children are shared with unit (they are not copied), and unit is not modified."""
+    filtered_unit = ET.Element(unit.tag, unit.attrib)
+    filtered_unit.text = unit.text
+    filtered_unit.tail = unit.tail
     processor = _SrcmlPreprocessorState(header_acceptable__regex)
-    children_to_remove = []
 
-    for child in filtered_unit:
+    for child in unit:
         processor.process_tag(child)
-        if processor.shall_ignore():
-            children_to_remove.append(child)
-
-    for child_to_remove in children_to_remove:
-        filtered_unit.remove(child_to_remove)
+        if not processor.shall_ignore():
+            filtered_unit.append(child)
 
     return filtered_unit
@@ -103,7 +103,9 @@ def _rewrite_decl_if_suspicious_fn_decl(decl_stmt: CppDeclStatement) -> Optional
     if len(arg_lists) == 0:
         return None
 
+    # the xml is shared with the parent elements: work on a copy
     hacked_decl = copy.deepcopy(decl)
+    hacked_decl.srcml_xml = copy.deepcopy(decl.srcml_xml)
     arg_lists = hacked_decl.wrapped_children_with_tag("argument_list")
     if len(arg_lists) == 0:
         return None
@@ -14,7 +14,6 @@ from xml.etree import ElementTree as ET
 from codemanip import code_utils
 
 from srcmlcpp.cpp_types import CppElementAndComment, CppElementComments
-from srcmlcpp.internal import srcml_utils
 from srcmlcpp.internal.filter_preprocessor_regions import filter_preprocessor_regions
 from srcmlcpp.srcml_wrapper import SrcmlWrapper
 
@@ -119,9 +118,21 @@ def mark_empty_lines(code: str) -> str:
     return result
 
 
+def _copy_comment_xml(comment_xml: ET.Element) -> ET.Element:
+    """A copy of a comment node (which is a leaf), whose text and end position can be modified
+    without altering the xml tree produced by srcML"""
+    r = ET.Element(comment_xml.tag, dict(comment_xml.attrib))
+    r.text = comment_xml.text
+    r.tail = comment_xml.tail
+    r.extend(comment_xml)
+    return r
+
+
 def _group_consecutive_comments(srcml_code: SrcmlWrapper) -> SrcmlWrapper:
     # srcml_xml_grouped will contain an xml node in which we group the comments
-    # we will need to create a wrapper around it before returning
+    # we will need to create a wrapper around it before returning.
+    # Only the comments nodes are copied (since they will be modified), the other children are shared
+    # with srcml_code (copying them would duplicate the whole xml tree, once per nesting level)
     srcml_xml_grouped = ET.Element(srcml_code.srcml_xml.tag)
 
     previous_previous_child: Optional[SrcmlWrapper] = None
@@ -132,10 +143,13 @@ def _group_consecutive_comments(srcml_code: SrcmlWrapper) -> SrcmlWrapper:
         def add_child(child=child) -> None:  # type: ignore
             nonlocal previous_child, previous_previous_child
 
-            # In this low level case, we need to manually clone child.srcml_xml,
+            # In this low level case, we need to manually clone the xml of comments,
             # since SrcmlWrapper.__deepcopy__() forces a shallow copy of srcml_xml
-            child_copy = copy.copy(child)
-            child_copy.srcml_xml = copy.deepcopy(child.srcml_xml)
+            if child.tag() == "comment":
+                child_copy = copy.copy(child)
+                child_copy.srcml_xml = _copy_comment_xml(child.srcml_xml)
+            else:
+                child_copy = child
 
             srcml_xml_grouped.append(child_copy.srcml_xml)
             previous_previous_child = previous_child
@@ -151,7 +165,7 @@ def _group_consecutive_comments(srcml_code: SrcmlWrapper) -> SrcmlWrapper:
             current_comment_ = comment_raw
             assert previous_child.srcml_xml.text is not None
             previous_child.srcml_xml.text += COMMENT_NEW_LINE_TOKEN + current_comment_
-            srcml_utils.copy_element_end_position(child.srcml_xml, previous_child.srcml_xml)
+            previous_child.copy_end_position_from(child)
 
         shall_concat_comment = False
 
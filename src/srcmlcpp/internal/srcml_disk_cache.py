@@ -0,0 +1,128 @@
+"""
+An optional persistent (on disk) cache for the xml produced by srcML.
+
+Entries are content-addressed: their key is a hash of (code, encoding, dump_positions, srcML version),
+so that unchanged code is never sent twice to srcML, even across runs.
+Each entry is stored zlib-compressed in its own file. When the total size of the cache exceeds its maximum size,
+the least recently used entries are evicted (an entry's modification time is updated each time it is used).
+"""
+
+from __future__ import annotations
+import hashlib
+import logging
+import os
+import tempfile
+import zlib
+
+_ENTRY_EXTENSION = ".xml.z"
+
+
+class SrcmlDiskCache:
+    directory: str
+    max_size_bytes: int
+    nb_hits: int = 0
+    nb_misses: int = 0
+    nb_evictions: int = 0
+    # size of each entry on disk (lazily loaded from the directory content)
+    _entries_sizes: dict[str, int] | None = None
+
+    def __init__(self, directory: str, max_size_mb: float) -> None:
+        self.directory = directory
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(code: str, encoding: str, dump_positions: bool, srcml_version: str) -> str:
+        h = hashlib.sha256()
+        for part in (srcml_version, encoding, str(dump_positions)):
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+        h.update(code.encode(encoding, errors="surrogatepass"))
+        return h.hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + _ENTRY_EXTENSION)
+
+    def _sizes(self) -> dict[str, int]:
+        if self._entries_sizes is None:
+            self._entries_sizes = {}
+            for filename in os.listdir(self.directory):
+                if filename.endswith(_ENTRY_EXTENSION):
+                    key = filename[: -len(_ENTRY_EXTENSION)]
+                    self._entries_sizes[key] = os.path.getsize(os.path.join(self.directory, filename))
+        return self._entries_sizes
+
+    def total_size(self) -> int:
+        return sum(self._sizes().values())
+
+    def get(self, key: str) -> str | None:
+        """Returns the cached xml string for this key, or None"""
+        path = self._entry_path(key)
+        try:
+            with open(path, "rb") as f:
+                compressed = f.read()
+            xml_str = zlib.decompress(compressed).decode("utf-8")
+        except (OSError, zlib.error, UnicodeDecodeError):
+            self.nb_misses += 1
+            return None
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            pass
+        self.nb_hits += 1
+        return xml_str
+
+    def store(self, key: str, xml_str: str) -> None:
+        compressed = zlib.compress(xml_str.encode("utf-8"))
+        if len(compressed) > self.max_size_bytes:
+            return
+        # write to a temporary file, then rename, so that concurrent runs never read a partial entry
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(compressed)
+            os.replace(tmp_path, self._entry_path(key))
+        except OSError as e:
+            logging.warning(f"SrcmlDiskCache: could not store entry in {self.directory} ({e})")
+            return
+        self._sizes()[key] = len(compressed)
+        self._evict_if_needed()
+
+    def _evict_if_needed(self) -> None:
+        sizes = self._sizes()
+        total_size = sum(sizes.values())
+        if total_size <= self.max_size_bytes:
+            return
+
+        def last_use_time(key: str) -> float:
+            try:
+                return os.path.getmtime(self._entry_path(key))
+            except OSError:
+                return 0.0
+
+        for key in sorted(sizes.keys(), key=last_use_time):
+            if total_size <= self.max_size_bytes:
+                break
+            try:
+                os.remove(self._entry_path(key))
+            except OSError:
+                pass
+            total_size -= sizes.pop(key)
+            self.nb_evictions += 1
+
+    def clear(self) -> None:
+        for key in list(self._sizes().keys()):
+            try:
+                os.remove(self._entry_path(key))
+            except OSError:
+                pass
+        self._entries_sizes = {}
+
+    def stats_string(self) -> str:
+        nb_lookups = self.nb_hits + self.nb_misses
+        if nb_lookups == 0:
+            return ""
+        return (
+            f"hits: {self.nb_hits} misses: {self.nb_misses} hit rate: {self.nb_hits / nb_lookups * 100:.0f}%"
+            f" evictions: {self.nb_evictions} size: {self.total_size() / 1024:.0f}KB"
+        )
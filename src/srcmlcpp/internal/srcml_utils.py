@@ -7,6 +7,7 @@ This module *must* not depend on srcml_types!
 from __future__ import annotations
 import logging
 import os
+from functools import lru_cache
 from typing import Any, Optional
 from xml.dom import minidom
 from xml.etree import ElementTree as ET  # noqa
@@ -30,6 +31,18 @@ def element_end_position(element: ET.Element) -> Optional[CodePosition]:
     return _element_position(element, "end")
 
 
+def element_start_end_positions(element: ET.Element) -> tuple[Optional[CodePosition], Optional[CodePosition]]:
+    """The start and end positions of an element, read in a single pass over its attributes"""
+    start, end = None, None
+    for key, value in element.attrib.items():
+        attrib = clean_tag_or_attrib(key)
+        if attrib == "start":
+            start = CodePosition.from_string(value)
+        elif attrib == "end":
+            end = CodePosition.from_string(value)
+    return start, end
+
+
 def copy_element_end_position(element_src: ET.Element, element_dst: ET.Element) -> None:
     for key, value in element_src.attrib.items():
         if clean_tag_or_attrib(key) == "end":
@@ -76,6 +89,7 @@ def srcml_write_to_file(encoding: str, root: ET.Element, filename: str) -> None:
     element_tree.write(filename, encoding=encoding)
 
 
+@lru_cache(maxsize=1024)  # there are only a few distinct tags and attributes names
 def clean_tag_or_attrib(tag_name: str) -> str:
     if tag_name.startswith("{"):
         assert "}" in tag_name
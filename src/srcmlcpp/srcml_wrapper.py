@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 import copy
-from typing import Callable
+from typing import Any, Callable
 from xml.etree import ElementTree as ET
 
 from codemanip import code_utils
@@ -13,20 +13,47 @@ from srcmlcpp.srcmlcpp_options import SrcmlcppOptions
 from srcmlcpp.scrml_warning_settings import WarningType
 
 # members that are always copied as shallow members (this is intentionally a static list)
-_SrcmlWrapper__deep_copy_force_shallow_ = ["options", "srcml_xml"]
+_SrcmlWrapper__deep_copy_force_shallow_ = ["options", "srcml_xml", "_positions_cache"]
+
+
+# cache for _slots_descriptors()
+_SLOTS_DESCRIPTORS: dict[type, list[tuple[str, Any]]] = {}
+
+
+def _slots_descriptors(cls: type) -> list[tuple[str, Any]]:
+    """The (name, descriptor) of the slots declared by cls and its bases"""
+    r = _SLOTS_DESCRIPTORS.get(cls)
+    if r is None:
+        r = []
+        for klass in cls.__mro__:
+            for name in klass.__dict__.get("__slots__", ()):
+                if name not in ("__dict__", "__weakref__"):
+                    r.append((name, klass.__dict__[name]))
+        _SLOTS_DESCRIPTORS[cls] = r
+    return r
 
 
 class SrcmlWrapper:
-    """A wrapper around the nodes in the xml tree produced by srcml"""
+    """A wrapper around the nodes in the xml tree produced by srcml
+
+    Note: SrcmlWrapper and all the CppElement classes use __slots__, since there can be hundreds of thousands
+    of elements for big headers (a __dict__ per instance would be costly).
+    Derived classes shall declare their members in __slots__, and set their default values in __init__
+    (class attributes default values are not compatible with __slots__).
+    Use _members() to iterate over the members of an element.
+    """
+
+    __slots__ = ("options", "srcml_xml", "filename", "_positions_cache")
 
     # Misc options: in this class, we only use the encoding
     options: SrcmlcppOptions
     # the xml tree created by srcML
     srcml_xml: ET.Element
     # the filename from which this tree was parsed
-    filename: str | None = None
-    # debugging help: a string showing the start position of this element in the code
-    code_location: str
+    filename: str | None
+    # cache for start() and end(): (srcml_xml, start, end)
+    # It is filled on first access (the slot is unset before), and is only valid for this srcml_xml
+    _positions_cache: tuple[ET.Element, CodePosition, CodePosition]
 
     def __init__(self, options: SrcmlcppOptions, srcml_xml: ET.Element, filename: str | None) -> None:
         """Create a wrapper from a xml sub node
@@ -45,21 +72,21 @@ class SrcmlWrapper:
                 self.raise_exception("filename params must either be `None` or non empty!")
 
         self.filename = filename
+        # Note: the positions (and code_position_start) are computed lazily: many wrappers are transient
 
-        # fill code_location
-        def fill_code_location() -> str:
-            if filename is None:
-                filename_simple = ""
-            else:
-                filename_normalized = filename.replace("\\", "/")
-                items = filename_normalized.split("/")
-                items = items[-3:]
-                filename_simple = "/".join(items)
-            start_loc = self.start()
-            r = f"{filename_simple}:{start_loc.line}:{start_loc.column}"
-            return r
-
-        self.code_position_start = fill_code_location()
+    @property
+    def code_position_start(self) -> str:
+        """debugging help: a string showing the start position of this element in the code"""
+        if self.filename is None:
+            filename_simple = ""
+        else:
+            filename_normalized = self.filename.replace("\\", "/")
+            items = filename_normalized.split("/")
+            items = items[-3:]
+            filename_simple = "/".join(items)
+        start_loc = self.start()
+        r = f"{filename_simple}:{start_loc.line}:{start_loc.column}"
+        return r
 
     def __deepcopy__(self, memo=None):
         """SrcmlWrapper.__deepcopy__: force shallow copy of SrcmlcppOptions and srcml_xml (ET.Element)
@@ -77,13 +104,26 @@ class SrcmlWrapper:
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result  # type: ignore
-        for k, v in self.__dict__.items():
+        for k, v in self._members().items():
             if k not in _SrcmlWrapper__deep_copy_force_shallow_:
-                setattr(result, k, copy.deepcopy(v, memo))
+                object.__setattr__(result, k, copy.deepcopy(v, memo))
             else:
-                setattr(result, k, v)
+                object.__setattr__(result, k, v)
         return result
 
+    def _members(self) -> dict[str, Any]:
+        """The members which are set on this object: its slots (unset slots are skipped),
+        plus its __dict__ if it is an instance of a derived class which does not use __slots__"""
+        r = {}
+        for name, descriptor in _slots_descriptors(type(self)):
+            try:
+                r[name] = descriptor.__get__(self)
+            except AttributeError:
+                pass  # this member was not set
+        if hasattr(self, "__dict__"):
+            r.update(self.__dict__)
+        return r
+
     def tag(self) -> str:
         """The xml tag
         https://www.tutorialspoint.com/xml/xml_tags.htm"""
@@ -120,7 +160,7 @@ class SrcmlWrapper:
           The decl name node will look like
             <name>a</name>
 
-        * Sometimes, we will need to call srcml to reconstruct the code.
+        * Sometimes, we will need to reconstruct the code from the xml tree.
           For example, with the code:
             int* a[10];
           The decl name node will look like
@@ -149,18 +189,37 @@ class SrcmlWrapper:
         else:
             return None
 
+    def _positions(self) -> tuple[ET.Element, CodePosition, CodePosition]:
+        try:
+            cache = self._positions_cache
+            if cache[0] is self.srcml_xml:
+                return cache
+        except AttributeError:
+            pass
+        start, end = srcml_utils.element_start_end_positions(self.srcml_xml)
+        self._positions_cache = (
+            self.srcml_xml,
+            CodePosition(-1, -1) if start is None else start,
+            CodePosition(-1, -1) if end is None else end,
+        )
+        return self._positions_cache
+
     def start(self) -> CodePosition:
-        """Start position in the C++ code"""
-        start = srcml_utils.element_start_position(self.srcml_xml)
-        return CodePosition(-1, -1) if start is None else start
+        """Start position in the C++ code (cached: do not modify it)"""
+        return self._positions()[1]
 
     def end(self) -> CodePosition:
-        """End position in the C++ code"""
-        end = srcml_utils.element_end_position(self.srcml_xml)
-        return CodePosition(-1, -1) if end is None else end
+        """End position in the C++ code (cached: do not modify it)"""
+        return self._positions()[2]
+
+    def copy_end_position_from(self, other: SrcmlWrapper) -> None:
+        """Sets the end position of this element to the end position of another element"""
+        srcml_utils.copy_element_end_position(other.srcml_xml, self.srcml_xml)
+        if hasattr(self, "_positions_cache"):
+            del self._positions_cache
 
     def str_code_verbatim(self) -> str:
-        """Return the exact C++ code from which this xml node was constructed by calling the executable srcml"""
+        """Return the exact C++ code from which this xml node was constructed (reconstructed from the xml tree)"""
         # r = code_to_srcml.srcml_to_code(self.srcml_xml, encoding=self.options.encoding)
         from srcmlcpp import srcmlcpp_main
 
@@ -279,7 +338,7 @@ class SrcmlWrapper:
             end = self.end()
             if start.line >= 0 and end.line >= 0:
                 if end.line > start.line + max_lines:
-                    end.line = start.line + max_lines
+                    end = CodePosition(start.line + max_lines, end.column)
 
                 concerned_lines = full_code_lines[start.line : end.line + 1]
                 new_start = CodePosition(0, start.column)
@@ -313,3 +372,11 @@ class SrcmlWrapper:
 # * first parameter: current child
 # * second parameter: depth
 SrcmlXmVisitorFunction = Callable[[SrcmlWrapper, int], None]
+
+
+def make_synthetic_srcml_wrapper(options: SrcmlcppOptions, tag: str, model: SrcmlWrapper | None = None) -> SrcmlWrapper:
+    """Creates a wrapper around a new (childless) xml node, for elements that are built without calling srcML.
+    If model is given, its filename and code position are reused (so that warnings point to its location)"""
+    attrib = dict(model.srcml_xml.attrib) if model is not None else {}
+    filename = model.filename if model is not None else None
+    return SrcmlWrapper(options, ET.Element(tag, attrib), filename)
@@ -7,7 +7,8 @@ Main functions provided by this module
 """
 
 from __future__ import annotations
-from typing import cast
+from typing import Any, cast
+from xml.etree import ElementTree as ET
 
 from codemanip.parse_progress_bar import global_progress_bars
 
@@ -70,6 +71,7 @@ def code_to_srcml_wrapper(
     if options.preserve_empty_lines:
         code = srcml_comments.mark_empty_lines(code)
 
+    code_to_srcml._SRCML_CALLER.set_disk_cache(options.srcml_cache_directory, options.srcml_cache_max_size_mb)
     xml = code_to_srcml.code_to_srcml(code, dump_positions=options.flag_srcml_dump_positions, encoding=options.encoding)
 
     r = SrcmlWrapper(options, xml, filename)
@@ -130,10 +132,170 @@ def code_to_cpp_unit(
     return cpp_unit
 
 
+class _IdentityKey:
+    """A dict key for an unhashable object, compared by identity.
+    It keeps a reference to the object, so that its id cannot be reused by another object while the key is alive."""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any) -> None:
+        self.obj = obj
+
+    def __hash__(self) -> int:
+        return id(self.obj)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _IdentityKey) and other.obj is self.obj
+
+
+def _options_parse_fingerprint(options: SrcmlcppOptions) -> tuple[Any, ...]:
+    """The options values that may change the result of parsing a code snippet"""
+
+    def hashable(v: Any) -> Any:
+        # (the object itself is a part of the key: its id alone could be reused after it is garbage collected)
+        try:
+            hash(v)
+            return v
+        except TypeError:
+            return _IdentityKey(v)
+
+    r = (
+        options.functions_api_prefixes,
+        tuple(sorted(options.named_number_macros.items())),
+        options.header_filter_preprocessor_regions,
+        hashable(options.header_filter_acceptable__regex),
+        hashable(options.code_preprocess_function),
+        options.encoding,
+        options.preserve_empty_lines,
+        options.flag_srcml_dump_positions,
+        options.fix_brace_init_default_value,
+    )
+    return r
+
+
+# Marker placed between the snippets of a batch (on its own line)
+_SNIPPETS_BATCH_SEPARATOR = "// __srcmlcpp_snippets_batch_separator__"
+
+
+def _split_batch_unit_xml(unit_xml: ET.Element, nb_snippets: int) -> list[ET.Element] | None:
+    """Splits the xml of a batch unit at the separator comments. Returns None if the separators
+    are not found at the top level (e.g. if a snippet was incomplete and swallowed a separator)"""
+
+    def is_separator(child: ET.Element) -> bool:
+        return child.tag.endswith("comment") and child.text is not None and child.text == _SNIPPETS_BATCH_SEPARATOR
+
+    snippets_xml: list[ET.Element] = []
+    current = ET.Element(unit_xml.tag, unit_xml.attrib)
+    current.text = unit_xml.text
+    for child in unit_xml:
+        if is_separator(child):
+            snippets_xml.append(current)
+            current = ET.Element(unit_xml.tag, unit_xml.attrib)
+            current.text = child.tail
+        else:
+            current.append(child)
+    if len(snippets_xml) != nb_snippets or len(current) > 0:
+        return None
+    return snippets_xml
+
+
+def code_snippets_to_cpp_units(
+    options: SrcmlcppOptions, codes: list[str], fill_known_cache: bool = True
+) -> list[CppUnit]:
+    """Parses several independent code snippets, with a single call to srcML.
+
+    The snippets are concatenated (separated by marker comments), parsed once,
+    and the resulting xml tree is split back into one CppUnit per snippet.
+    Each snippet should be a sequence of complete declarations.
+    If the result cannot be split (e.g. if a snippet is incomplete), each snippet is parsed separately.
+    """
+    if len(codes) == 0:
+        return []
+    if len(codes) == 1:
+        return [_code_to_cpp_unit_impl(options, codes[0], fill_known_cache=fill_known_cache)]
+
+    raw_codes = []
+    marked_codes = []
+    for code in codes:
+        if options.code_preprocess_function is not None:
+            code = options.code_preprocess_function(code)
+        raw_codes.append(code)
+        marked_codes.append(srcml_comments.mark_empty_lines(code) if options.preserve_empty_lines else code)
+
+    def join_snippets(snippets: list[str]) -> str:
+        return "".join(snippet + "\n" + _SNIPPETS_BATCH_SEPARATOR + "\n" for snippet in snippets)
+
+    code_cache.store_cached_code(None, join_snippets(raw_codes))
+    code_to_srcml._SRCML_CALLER.set_disk_cache(options.srcml_cache_directory, options.srcml_cache_max_size_mb)
+    unit_xml = code_to_srcml.code_to_srcml(
+        join_snippets(marked_codes), dump_positions=options.flag_srcml_dump_positions, encoding=options.encoding
+    )
+
+    snippets_xml = _split_batch_unit_xml(unit_xml, len(codes))
+    if snippets_xml is None:
+        return [_code_to_cpp_unit_impl(options, code, fill_known_cache=fill_known_cache) for code in codes]
+
+    r = []
+    for snippet_xml in snippets_xml:
+        cpp_unit = cpp_types_parse.parse_unit(options, SrcmlWrapper(options, snippet_xml, None))
+        if fill_known_cache:
+            cpp_unit.fill_scope_identifiers_cache()
+        r.append(cpp_unit)
+    return r
+
+
+class _PrefetchedSnippets:
+    """Snippets that were parsed in advance (in a batch), and which are waiting to be used
+    by code_first_child_of_type(). Each prefetched CppUnit is used only once, since callers may modify it."""
+
+    _units: dict[tuple[tuple[Any, ...], str], list[CppUnit]]
+    nb_hits: int = 0
+
+    def __init__(self) -> None:
+        self._units = {}
+
+    def prefetch(self, options: SrcmlcppOptions, codes: list[str]) -> None:
+        fingerprint = _options_parse_fingerprint(options)
+        codes = list(dict.fromkeys(code for code in codes if (fingerprint, code) not in self._units))
+        cpp_units = code_snippets_to_cpp_units(options, codes)
+        for code, cpp_unit in zip(codes, cpp_units):
+            self._units[(fingerprint, code)] = [cpp_unit]
+
+    def pop(self, options: SrcmlcppOptions, code: str) -> CppUnit | None:
+        key = (_options_parse_fingerprint(options), code)
+        units = self._units.get(key)
+        if units is None:
+            return None
+        cpp_unit = units.pop()
+        if len(units) == 0:
+            del self._units[key]
+        self.nb_hits += 1
+        return cpp_unit
+
+    def clear(self) -> None:
+        self._units = {}
+
+
+_PREFETCHED_SNIPPETS = _PrefetchedSnippets()
+
+
+def prefetch_code_snippets(options: SrcmlcppOptions, codes: list[str]) -> None:
+    """Parses in advance (with a single call to srcML) some snippets that will later be passed to
+    code_first_child_of_type() and its variants (code_first_function_decl, code_first_decl, ...)"""
+    _PREFETCHED_SNIPPETS.prefetch(options, codes)
+
+
+def clear_prefetched_code_snippets() -> None:
+    """Forgets the prefetched snippets that were not used"""
+    _PREFETCHED_SNIPPETS.clear()
+
+
 def code_first_child_of_type(
     options: SrcmlcppOptions, type_of_cpp_element: type[CppElement], code: str
 ) -> CppElementAndComment:
-    cpp_unit = _code_to_cpp_unit_impl(options, code)
+    cpp_unit = _PREFETCHED_SNIPPETS.pop(options, code)
+    if cpp_unit is None:
+        cpp_unit = _code_to_cpp_unit_impl(options, code)
     for child in cpp_unit.block_children:
         if isinstance(child, type_of_cpp_element):
             return child
@@ -160,14 +322,91 @@ def code_first_struct(options: SrcmlcppOptions, code: str) -> CppStruct:
     return cast(CppStruct, code_first_child_of_type(options, CppStruct, code))
 
 
-def code_to_cpp_type(options: SrcmlcppOptions, code: str) -> CppType:
-    code_plus_dummy_var = code + " dummy;"
-    first_decl_statement = code_first_decl_statement(options, code_plus_dummy_var)
+class _CppTypeParseCache:
+    """A cache for code_to_cpp_type: each distinct type string is parsed at most once per run
+    (for a given set of options).
+
+    The cached CppType are never handed out: code_to_cpp_type returns copies of them,
+    so that callers may modify the result.
+    The cache is cleared at the start of each run (see clear_parse_caches()), and holds at most max_size types
+    (the oldest ones are forgotten first).
+    """
+
+    _cache: dict[tuple[tuple[Any, ...], str], CppType]
+    max_size: int = 20000
+    nb_hits: int = 0
+    nb_misses: int = 0
+
+    def __init__(self) -> None:
+        self._cache = {}
+
+    def get_or_parse(self, options: SrcmlcppOptions, code: str) -> CppType:
+        key = (_options_parse_fingerprint(options), code)
+        cached_type = self._cache.get(key)
+        if cached_type is None:
+            self.nb_misses += 1
+            cached_type = _parse_cpp_type(options, code)
+            if len(self._cache) >= self.max_size:
+                del self._cache[next(iter(self._cache))]
+            self._cache[key] = cached_type
+        else:
+            self.nb_hits += 1
+        r = cached_type.shallow_clone()
+        r.options = options
+        return r
+
+    def get_or_parse_many(self, options: SrcmlcppOptions, codes: list[str]) -> list[CppType]:
+        fingerprint = _options_parse_fingerprint(options)
+        missing_codes = list(dict.fromkeys(code for code in codes if (fingerprint, code) not in self._cache))
+        if len(missing_codes) > 1:
+            prefetch_code_snippets(options, [_cpp_type_snippet(code) for code in missing_codes])
+        return [self.get_or_parse(options, code) for code in codes]
+
+    def clear(self) -> None:
+        self._cache = {}
+        self.nb_hits = 0
+        self.nb_misses = 0
+
+    def stats_string(self) -> str:
+        nb_lookups = self.nb_hits + self.nb_misses
+        if nb_lookups == 0:
+            return ""
+        return f"code_to_cpp_type cache: hits: {self.nb_hits} misses: {self.nb_misses} hit rate: {self.nb_hits / nb_lookups * 100:.0f}%"
+
+
+_CPP_TYPE_PARSE_CACHE = _CppTypeParseCache()
+
+
+def clear_parse_caches() -> None:
+    """Clears the caches of the parsed types and snippets (called once at the start of each run,
+    e.g. by litgen.write_generated_code_for_files, so that they do not grow across runs,
+    nor keep the options of a previous run alive)"""
+    _CPP_TYPE_PARSE_CACHE.clear()
+    _PREFETCHED_SNIPPETS.clear()
+
+
+def _cpp_type_snippet(code: str) -> str:
+    return code + " dummy;"
+
+
+def _parse_cpp_type(options: SrcmlcppOptions, code: str) -> CppType:
+    first_decl_statement = code_first_decl_statement(options, _cpp_type_snippet(code))
     first_decl = first_decl_statement.cpp_decls[0]
     cpp_type = first_decl.cpp_type
     return cpp_type
 
 
+def code_to_cpp_type(options: SrcmlcppOptions, code: str) -> CppType:
+    """Parses a C++ type (e.g. "const std::vector<int> &").
+    Results are cached: the same type string is parsed only once per run"""
+    return _CPP_TYPE_PARSE_CACHE.get_or_parse(options, code)
+
+
+def code_to_cpp_types(options: SrcmlcppOptions, codes: list[str]) -> list[CppType]:
+    """Parses several C++ types (the types that were not yet cached are parsed with a single call to srcML)"""
+    return _CPP_TYPE_PARSE_CACHE.get_or_parse_many(options, codes)
+
+
 def _tests_only_get_only_child_with_tag(options: SrcmlcppOptions, code: str, tag: str) -> CppElementAndComment:
     from srcmlcpp.internal import srcml_comments
 
@@ -60,6 +60,17 @@ class SrcmlcppOptions:
     #
     code_preprocess_function: Optional[Callable[[str], str]] = None
 
+    ################################################################################
+    #    <Persistent cache for srcML results>
+    ################################################################################
+
+    # If not None, the xml produced by srcML is cached on disk in this directory (content-addressed:
+    # the key is a hash of the code, the encoding and the srcML version).
+    # Unchanged headers and snippets can then be regenerated without any srcML invocation.
+    srcml_cache_directory: Optional[str] = None
+    # Maximum size of the srcML cache on disk (in MB): the least recently used entries are evicted above it.
+    srcml_cache_max_size_mb: float = 256.0
+
     ################################################################################
     #    <Misc options>
     ################################################################################
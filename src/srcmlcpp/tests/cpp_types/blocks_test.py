@@ -58,3 +58,46 @@ def test_block():
     assert cpp_unit.is_function_overloaded(f0)
     assert cpp_unit.is_function_overloaded(f1)
     assert not cpp_unit.is_function_overloaded(g)
+
+
+def test_elements_index():
+    from srcmlcpp.cpp_types import CppStruct, CppFunctionDecl
+
+    options = srcmlcpp.SrcmlcppOptions()
+    code = """
+    namespace N { struct A { void f(); }; }
+    void g();
+    """
+    cpp_unit = srcmlcpp.code_to_cpp_unit(options, code)
+    all_elements = cpp_unit.all_cpp_elements_recursive()
+    assert cpp_unit._elements_index is not None
+    assert cpp_unit.all_cpp_elements_recursive() == all_elements
+    assert [f.function_name for f in cpp_unit.all_functions_recursive()] == ["f", "g"]
+    assert CppFunctionDecl in cpp_unit._elements_index[0]
+
+    # Results are copies: modifying them does not alter the index
+    structs = cpp_unit.all_structs_recursive()
+    structs.clear()
+    assert len(cpp_unit.all_structs_recursive()) == 1
+
+    # Sub-blocks also have their own index
+    ns = cast(CppNamespace, cpp_unit.all_cpp_elements_recursive(CppNamespace)[0])
+    assert [s.class_name for s in ns.block.all_structs_recursive()] == ["A"]
+
+    # The index is invalidated when the tree is mutated
+    ns.block.add_element(srcmlcpp.srcmlcpp_main.code_first_struct(options, "struct B {};"))
+    assert [s.class_name for s in cpp_unit.all_structs_recursive()] == ["A", "B"]
+    assert [cast(CppStruct, s).class_name for s in ns.block.all_elements_of_type(CppStruct)] == ["A", "B"]
+
+
+def test_elements_index_after_setters():
+    from srcmlcpp.cpp_types import CppParameter
+
+    options = srcmlcpp.SrcmlcppOptions()
+    cpp_unit = srcmlcpp.code_to_cpp_unit(options, "void f(int a, int b);")
+    assert len(cpp_unit.all_cpp_elements_recursive(CppParameter)) == 2
+
+    # The index is invalidated when the tree is mutated via a child setter
+    f = cpp_unit.all_functions_recursive()[0]
+    f.parameter_list.parameters = f.parameter_list.parameters[:1]
+    assert len(cpp_unit.all_cpp_elements_recursive(CppParameter)) == 1
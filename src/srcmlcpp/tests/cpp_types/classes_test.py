@@ -382,3 +382,40 @@ def test_add_method():
             };
     """,
     )
+
+
+def test_symbol_table():
+    options = srcmlcpp.SrcmlcppOptions()
+    code = """
+    struct Base {};
+    namespace A
+    {
+        struct Base {};
+        enum class E { a };
+        void f(int);
+        void f(double);
+        namespace B { struct Derived: public Base {}; }
+    }
+    struct Derived2: public A::Base {};
+    """
+    cpp_unit = srcmlcpp.code_to_cpp_unit(options, code)
+    symbol_table = cpp_unit.symbol_table()
+    assert len(symbol_table.find("A::f")) == 2
+    assert len(symbol_table.find("A::E")) == 1
+    assert set(symbol_table.names_in_scope(srcmlcpp.CppScope.from_string("A")).keys()) == {"Base", "E", "f"}
+
+    # The innermost Base is found first
+    derived = cpp_unit.find_struct_or_class("A::B::Derived")
+    assert derived is not None
+    bases = derived.base_classes()
+    assert len(bases) == 1
+    assert bases[0][1].qualified_class_name() == "A::Base"
+
+    derived2 = cpp_unit.find_struct_or_class("Derived2")
+    assert derived2 is not None
+    assert derived2.base_classes()[0][1].qualified_class_name() == "A::Base"
+
+    # The symbol table is rebuilt when the tree is mutated
+    cpp_unit.add_element(srcmlcpp.srcmlcpp_main.code_first_struct(options, "struct Added {};"))
+    assert cpp_unit.symbol_table() is not symbol_table
+    assert cpp_unit.find_struct_or_class("Added") is not None
@@ -44,3 +44,17 @@ def test_can_access_scope():
 def test_scope_hierarchy():
     abc = CppScope.from_string("A::B::C")
     assert str(abc.scope_hierarchy_list) == "[A::B::C, A::B, A, ]"
+
+
+def test_scope_interning():
+    import copy
+    import pickle
+
+    abc = CppScope.from_string("A::B::C")
+    assert CppScope.from_string("A::B::C") is abc
+    assert CppScope(abc.scope_parts) is abc
+    assert abc.parent_scope is CppScope.from_string("A::B")
+    assert abc.scope_hierarchy_list[1] is abc.parent_scope
+
+    assert copy.deepcopy(abc) is abc
+    assert pickle.loads(pickle.dumps(abc)) is abc
@@ -99,6 +99,43 @@ def test_cpp_type():
     assert cpp_type.typenames == ["int"]
 
 
+def test_cpp_type_parse_cache():
+    options = srcmlcpp.SrcmlcppOptions()
+    type_cache = srcmlcpp_main._CPP_TYPE_PARSE_CACHE
+    type_cache.clear()
+    nb_misses = type_cache.nb_misses
+
+    cpp_type1 = srcmlcpp_main.code_to_cpp_type(options, "const std::vector<int> &")
+    cpp_type2 = srcmlcpp_main.code_to_cpp_type(srcmlcpp.SrcmlcppOptions(), "const std::vector<int> &")
+    assert type_cache.nb_misses == nb_misses + 1
+    # callers receive independent copies, which they may modify
+    assert cpp_type1 is not cpp_type2
+    cpp_type1.modifiers.remove("&")
+    assert cpp_type2.modifiers == ["&"]
+    assert srcmlcpp_main.code_to_cpp_type(options, "const std::vector<int> &").str_code() == "const std::vector<int> &"
+
+    # options that change the parsing result are a part of the key
+    options.functions_api_prefixes = "MY_API"
+    srcmlcpp_main.code_to_cpp_type(options, "const std::vector<int> &")
+    assert type_cache.nb_misses == nb_misses + 2
+
+    # the options objects (not their ids, which may be reused after garbage collection) are a part of the key
+    options.code_preprocess_function = lambda code: code
+    assert options.code_preprocess_function in srcmlcpp_main._options_parse_fingerprint(options)
+
+    # the cache is bounded
+    max_size = type_cache.max_size
+    try:
+        type_cache.max_size = 2
+        for type_str in ["int", "float", "double"]:
+            srcmlcpp_main.code_to_cpp_type(options, type_str)
+        assert len(type_cache._cache) == 2
+    finally:
+        type_cache.max_size = max_size
+    srcmlcpp_main.clear_parse_caches()
+    assert len(type_cache._cache) == 0
+
+
 def test_decl():
     options = srcmlcpp.SrcmlcppOptions()
 
@@ -116,3 +116,63 @@ def test_with_qualified_types():
     # s = f5_qualified.str_code()
     # code_utils.assert_are_codes_equal(f5_qualified.str_code(), "void f5(Ns::E e = Ns::E::a);")
     assert f5_qualified is not f5
+
+
+def test_constructor_from_decls():
+    options = srcmlcpp.SrcmlcppOptions()
+    code = """
+    namespace Ns {
+        struct Inner {};
+        struct Foo {
+            int a = 1;
+            Inner inner;
+            int b{5}; // a comment
+        };
+    }
+    """
+    cpp_unit = srcmlcpp.code_to_cpp_unit(options, code)
+    foo = cpp_unit.all_structs_recursive()[1]
+    assert foo.class_name == "Foo"
+
+    members = foo.get_members()
+    ctor = srcmlcpp.CppConstructorDecl.from_decls(foo, members)
+    code_utils.assert_are_codes_equal(ctor.str_code(), "Foo(int a = 1, Inner inner, int b = {5})")
+    assert ctor.cpp_scope_str() == "Ns::Foo"
+    assert ctor.parameter_list.parameters[2].decl.cpp_scope_str() == "Ns::Foo"
+    assert ctor.parameter_list.parameters[2].decl.cpp_element_comments.full_comment() == ""
+    code_utils.assert_are_codes_equal(
+        ctor.with_qualified_types().str_code(), "Foo(int a = 1, Ns::Inner inner, int b = {5})"
+    )
+
+    # The members and the struct are unchanged
+    assert members[2].initial_value_via_initializer_list
+    assert ctor not in foo.block.block_children
+
+
+def test_clone_path():
+    options = srcmlcpp.SrcmlcppOptions()
+    code = "int f(int a, const char* s = nullptr); // a comment"
+    f = srcmlcpp.srcmlcpp_main.code_first_function_decl(options, code)
+
+    f2 = f.clone_path("parameter_list")
+    param = f2.parameter_list.parameters[1]
+    new_param = param.clone_path("decl", "cpp_type")
+    new_param.decl.decl_name = "text"
+    new_param.decl.cpp_type.typenames = ["std::string"]
+    new_param.decl.cpp_type.specifiers.clear()
+    new_param.decl.cpp_type.modifiers.clear()
+    new_param.decl.initial_value_code = ""
+    f2.parameter_list.parameters[1] = new_param
+    f2.function_name = "g"
+    f2.cpp_element_comments.comment_end_of_line = ""
+    code_utils.assert_are_codes_equal(f2.str_code(), "int g(int a, std::string text);")
+
+    # The untouched children are shared, the cloned path is not
+    assert f2.return_type is f.return_type
+    assert f2.parameter_list is not f.parameter_list
+    assert f2.parameter_list.parameters[0] is f.parameter_list.parameters[0]
+    assert new_param.decl.cpp_type is not param.decl.cpp_type
+
+    # The original function is unchanged
+    code_utils.assert_are_codes_equal(f.str_code(), "int f(int a, const char * s = nullptr);")
+    assert f.cpp_element_comments.comment_end_of_line == " a comment"
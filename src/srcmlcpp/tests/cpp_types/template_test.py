@@ -5,7 +5,14 @@ import pytest
 from codemanip import code_utils
 
 import srcmlcpp
-from srcmlcpp.cpp_types import CppFunctionDecl, CppStruct, CppTemplateSpecialization, CppTemplateSpecializationPart
+from srcmlcpp.cpp_types import (
+    CppElement,
+    CppElementsVisitorEvent,
+    CppFunctionDecl,
+    CppStruct,
+    CppTemplateSpecialization,
+    CppTemplateSpecializationPart,
+)
 
 
 def code_first_function_decl(code: str) -> CppFunctionDecl:
@@ -144,3 +151,75 @@ def test_specialize_class():
         };
     """,
     )
+
+
+def test_specialize_class_keeps_parents():
+    # The specializations share some children with the original class (copy-on-write):
+    # they shall not change the parents inside the original class, nor inside the previous specializations
+    code = """
+    template<typename T> struct Foo
+    {
+        T v;
+        void f(int x);
+        T g(T a, int b);
+    };
+    """
+    struct = code_first_struct(code)
+
+    def assert_parents_are_consistent(s: CppStruct) -> None:
+        for method in s.get_methods():
+            assert method.parameter_list.parent is method
+            assert method.return_type.parent is method
+            for param in method.parameter_list.parameters:
+                assert param.parent is method.parameter_list
+                assert param.decl.parent is param
+                assert param.decl.cpp_type.parent is param.decl
+
+    def assert_members_parents_are_consistent(s: CppStruct) -> None:
+        assert s.block.parent is s
+        for ppp_block in s.block.block_children:
+            assert ppp_block.parent is s.block
+            for member in ppp_block.block_children:  # type: ignore
+                assert member.parent is ppp_block
+
+    assert_parents_are_consistent(struct)
+    struct_int = struct.with_specialized_template(CppTemplateSpecialization.from_type_str("int"))
+    assert struct_int is not None
+    struct_double = struct.with_specialized_template(CppTemplateSpecialization.from_type_str("double"))
+    assert struct_double is not None
+    assert_parents_are_consistent(struct)
+    for s in [struct, struct_int, struct_double]:
+        assert_members_parents_are_consistent(s)
+
+    method_f, method_g = struct.get_methods()
+    method_f_int, method_g_int = struct_int.get_methods()
+    assert method_f_int is not method_f
+    assert str(method_g_int) == "int g(int a, int b);"
+    # The parts of the members that are not changed by the specialization are shared
+    assert method_f_int.parameter_list is method_f.parameter_list
+    assert method_g_int.parameter_list.parameters[1].decl is method_g.parameter_list.parameters[1].decl
+    # The changed parts are consistent
+    assert method_g_int.parameter_list.parent is method_g_int
+    assert method_g_int.parameter_list.parameters[0].decl.parent is method_g_int.parameter_list.parameters[0]
+
+
+def test_specialize_class_shares_unchanged_members():
+    code = """
+    template<typename T> struct Foo { T v; void f(int x); void g(double y, int z); int h(); int a, b, c; };
+    """
+    struct = code_first_struct(code)
+    struct_int = struct.with_specialized_template(CppTemplateSpecialization.from_type_str("int"))
+    assert struct_int is not None
+
+    def all_elements(s: CppStruct) -> list[CppElement]:
+        r: list[CppElement] = []
+        s.visit_cpp_breadth_first(
+            lambda e, event, _depth: r.append(e) if event == CppElementsVisitorEvent.OnElement else None
+        )
+        return r
+
+    original_elements_ids = {id(e) for e in all_elements(struct)}
+    specialized_elements = all_elements(struct_int)
+    nb_shared = sum(1 for e in specialized_elements if id(e) in original_elements_ids)
+    # Only the path to "T v" and the members themselves are cloned
+    assert nb_shared > len(specialized_elements) / 2
@@ -1,7 +1,10 @@
 from __future__ import annotations
 import os
+import shutil
 import sys
 
+import pytest
+
 from codemanip import code_utils
 
 from srcmlcpp.internal import code_to_srcml, srcml_utils
@@ -72,3 +75,26 @@ def test_srcml_does_not_modify_code():
     // A lambda
     auto fnSub = [](int a, int b) { return b - a;};
     """)
+
+
+@pytest.mark.skipif(shutil.which("srcml") is None, reason="requires the srcml executable")
+def test_srcml_executable():
+    code = "int a = 1;"
+    srcml_executable = code_to_srcml._SrcmlExecutable()
+    xml_str = srcml_executable.code_to_xml_str(code, "utf-8", dump_positions=False)
+    assert "<decl_stmt>" in xml_str
+    code2 = srcml_executable.xml_to_code_str(xml_str.encode("utf-8"), "utf-8")
+    assert code2 == code
+    assert srcml_executable.stats_requests.nb_calls == 2
+
+
+def test_srcml_to_code_in_python():
+    code = """
+    template<typename T> T add(const T& a, T b = T{1}) { return a<b&&b>a ? a : b; }  // &amp; <>
+    int arr[10];
+    """
+    root = code_to_srcml.code_to_srcml(code)
+    for element in [root] + list(root.iter()):
+        assert code_to_srcml.srcml_to_code_in_python(element) == code_to_srcml._SRCML_CALLER.srcml_to_code(
+            "utf-8", element
+        )
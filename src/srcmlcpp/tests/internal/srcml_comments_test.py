@@ -59,6 +59,22 @@ def test_group_consecutive_comment():
     code_utils.assert_are_codes_equal(grouped_str, srcml_comments._EXPECTED_COMMENTS_GROUPED)
 
 
+def test_group_consecutive_comment_does_not_modify_srcml_xml():
+    options = SrcmlcppOptions()
+    code = srcml_comments.mark_empty_lines(srcml_comments._EXAMPLE_COMMENTS_TO_GROUPS)
+    srcml_code = srcmlcpp.code_to_srcml_wrapper(options, code)
+    xml_str_before = srcml_utils.srcml_to_str(srcml_code.srcml_xml)
+
+    srcml_comments.get_children_with_comments(srcml_code)
+    assert srcml_utils.srcml_to_str(srcml_code.srcml_xml) == xml_str_before
+
+    # The non comment children are not copied
+    srcml_grouped = srcml_comments._group_consecutive_comments(srcml_code)
+    function_xmls = [child for child in srcml_grouped.srcml_xml if child.tag.endswith("function_decl")]
+    assert len(function_xmls) == 4
+    assert all(any(child is function_xml for child in srcml_code.srcml_xml) for function_xml in function_xmls)
+
+
 def test_iterate_children_simple():
     code = """
 
@@ -0,0 +1,44 @@
+from __future__ import annotations
+import os
+import sys
+
+from srcmlcpp.internal import code_to_srcml, srcml_utils
+from srcmlcpp.internal.srcml_disk_cache import SrcmlDiskCache
+
+_THIS_DIR = os.path.dirname(__file__)
+sys.path.append(_THIS_DIR + "/../..")
+
+
+def test_srcml_disk_cache_hit_and_miss(tmp_path):
+    cache_dir = str(tmp_path / "srcml_cache")
+    code = "int a = 1;"
+    srcml_caller = code_to_srcml._SRCML_CALLER
+    srcml_caller.set_disk_cache(cache_dir, 1.0)
+    try:
+        disk_cache = srcml_caller._disk_caches[cache_dir]
+        element1 = code_to_srcml.code_to_srcml(code)
+        assert (disk_cache.nb_hits, disk_cache.nb_misses) == (0, 1)
+        element2 = code_to_srcml.code_to_srcml(code)
+        assert (disk_cache.nb_hits, disk_cache.nb_misses) == (1, 1)
+        assert srcml_utils.srcml_to_str(element1) == srcml_utils.srcml_to_str(element2)
+
+        # dump_positions is a part of the key
+        code_to_srcml.code_to_srcml(code, dump_positions=False)
+        assert disk_cache.nb_misses == 2
+
+        assert "srcml disk cache" in srcml_caller.profiling_stats()
+    finally:
+        srcml_caller.set_disk_cache(None, 0.0)
+
+
+def test_srcml_disk_cache_eviction(tmp_path):
+    disk_cache = SrcmlDiskCache(str(tmp_path), max_size_mb=0.01)
+    xml_strs = [f"<unit>{i}{os.urandom(2000).hex()}</unit>" for i in range(10)]
+    keys = [SrcmlDiskCache.make_key(str(i), "utf-8", True, "test") for i in range(10)]
+    for key, xml_str in zip(keys, xml_strs):
+        disk_cache.store(key, xml_str)
+    assert disk_cache.total_size() <= disk_cache.max_size_bytes
+    assert disk_cache.nb_evictions > 0
+    # the most recent entry is kept, the oldest one is evicted
+    assert disk_cache.get(keys[-1]) == xml_strs[-1]
+    assert disk_cache.get(keys[0]) is None
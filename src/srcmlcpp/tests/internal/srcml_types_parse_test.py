@@ -342,3 +342,41 @@ def disabled_test_parse_imgui():
 def disabled_test_parse_implot():
     source_filename = os.path.realpath(_THIS_DIR + "../../../../../lg_projects/imgui_bundle/external/implot/implot.h")
     do_parse_imgui_implot(source_filename)
+
+
+def test_code_snippets_to_cpp_units():
+    from srcmlcpp.internal.code_to_srcml import _SRCML_CALLER
+
+    options = srcmlcpp.SrcmlcppOptions()
+    codes = [
+        "// Doc for foo\nvoid foo(int a = 1);",
+        "struct Foo { Foo(int x); };",
+        "namespace N { int b; }\n\n",
+    ]
+    nb_srcml_calls = _SRCML_CALLER._stats_code_to_srcml.nb_calls
+    cpp_units = srcmlcpp.code_snippets_to_cpp_units(options, codes)
+    assert _SRCML_CALLER._stats_code_to_srcml.nb_calls == nb_srcml_calls + 1
+
+    assert len(cpp_units) == len(codes)
+    for code, cpp_unit in zip(codes, cpp_units):
+        expected_unit = srcmlcpp.code_to_cpp_unit(options, code)
+        assert str(cpp_unit) == str(expected_unit)
+
+    # An incomplete snippet swallows the separators: each snippet is then parsed separately
+    cpp_units = srcmlcpp.code_snippets_to_cpp_units(options, ["struct Foo {", "int a;"])
+    assert len(cpp_units) == 2
+
+
+def test_prefetch_code_snippets():
+    options = srcmlcpp.SrcmlcppOptions()
+    codes = ["void foo();", "void bar(int x);"]
+    srcmlcpp_main.prefetch_code_snippets(options, codes)
+    prefetched = srcmlcpp_main._PREFETCHED_SNIPPETS
+    nb_hits = prefetched.nb_hits
+    fn = srcmlcpp_main.code_first_function_decl(options, "void bar(int x);")
+    assert fn.function_name == "bar"
+    assert prefetched.nb_hits == nb_hits + 1
+    # a prefetched snippet is used only once
+    srcmlcpp_main.code_first_function_decl(options, "void bar(int x);")
+    assert prefetched.nb_hits == nb_hits + 1
+    srcmlcpp_main.clear_prefetched_code_snippets()
@@ -251,6 +251,49 @@ def test_make_terse_scope():
     assert new_scoped_identifier == "S3"
 
 
+def test_apply_scoped_identifiers_index():
+    from srcmlcpp.cpp_types.scope.cpp_scope_process import (
+        ScopedIdentifiersIndex,
+        apply_scoped_identifiers_index_to_code,
+    )
+    from srcmlcpp.cpp_types.scope.cpp_scope import CppScope
+
+    index = ScopedIdentifiersIndex(["Main::SubNamespace::Foo", "Main::SubNamespace::CreateFooList", "Main::Bar"])
+    current_scope = CppScope.from_string("Main::Other")
+
+    def qualify(cpp_code: str) -> str:
+        return apply_scoped_identifiers_index_to_code(cpp_code, current_scope.scope_hierarchy_prefix_list, index)
+
+    assert (
+        qualify("std::vector<SubNamespace::Foo> fooList = SubNamespace::CreateFooList();")
+        == "std::vector<Main::SubNamespace::Foo> fooList = Main::SubNamespace::CreateFooList();"
+    )
+    # Identifiers that start with "::" are already qualified, unknown identifiers are left untouched
+    assert qualify("::Bar + Foo + Bar") == "::Bar + Foo + Main::Bar"
+    # Strings and comments are left untouched
+    assert qualify('Bar(L"Bar", "Bar") // Bar') == 'Main::Bar(L"Bar", "Bar") // Bar'
+    assert qualify("") == ""
+
+
+def test_transform_cpp_identifiers():
+    from srcmlcpp.cpp_types.scope.cpp_scope_process import transform_cpp_identifiers, make_terse_code
+
+    tokens: list[str] = []
+
+    def record_token(token: str) -> str:
+        tokens.append(token)
+        return token.upper()
+
+    r = transform_cpp_identifiers('std::vector<N::Foo> v = {"a::b", ::x}; // N::Foo\nint y', record_token)
+    assert r == 'STD::VECTOR<N::FOO> V = {"a::b", ::X}; // N::Foo\nINT Y'
+    assert tokens == ["std::vector", "N::Foo", "v", "::x", "int", "y"]
+
+    assert make_terse_code("std::vector<N0::N1::S> s", "N0::N1::") == "std::vector<S> s"
+    nb_hits = make_terse_code.cache_info().hits
+    assert make_terse_code("std::vector<N0::N1::S> s", "N0::N1::") == "std::vector<S> s"
+    assert make_terse_code.cache_info().hits == nb_hits + 1
+
+
 def test_scope_test_litgen2():
     code = """
     namespace HelloImGui
@@ -332,3 +375,40 @@ def test_make_terse_scoped_identifier():
     context = "N0::N1::N3"
     r = _make_terse_scoped_identifier(scoped_identifier, context)
     assert r == "N2::S2::s1"
+
+
+def test_scope_cache_filled_top_down():
+    from typing import cast
+    from srcmlcpp.cpp_types import CppDecl
+
+    code = """
+    namespace N {
+        enum E { E_a };
+        struct S { int x; };
+    }
+    """
+    options = srcmlcpp.SrcmlcppOptions()
+    cpp_unit = srcmlcpp.code_to_cpp_unit(options, code)
+    # The scope and depth of all elements were filled by fill_children_parents
+    for element in cpp_unit.all_cpp_elements_recursive():
+        assert element._cached_cpp_scope is not None
+        assert element._cached_cpp_scope_include_self is not None
+        assert element._cached_depth is not None
+
+    struct_s = cpp_unit.all_structs_recursive()[0]
+    assert struct_s.cpp_scope_str() == "N"
+    assert struct_s.cpp_scope_str(include_self=True) == "N::S"
+    assert struct_s.depth() == 3  # (unit) > namespace > block > struct
+
+    # C enum decls leak into the parent scope
+    decl_e_a = cast(CppDecl, cpp_unit.all_cpp_elements_recursive(CppDecl)[0])
+    assert decl_e_a.name() == "E_a"
+    assert decl_e_a.cpp_scope_str() == "N"
+
+    # The cached values are identical to the ones computed from the ancestors
+    for element in cpp_unit.all_cpp_elements_recursive():
+        scope, scope_include_self, depth = element.cpp_scope(), element.cpp_scope(True), element.depth()
+        element._clear_scope_cache()
+        assert element.cpp_scope() is scope
+        assert element.cpp_scope(True) is scope_include_self
+        assert element.depth() == depth
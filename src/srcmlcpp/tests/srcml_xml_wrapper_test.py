@@ -128,3 +128,50 @@ tag: unit name:None
         tag: name name:None
         """,
     )
+
+
+def test_elements_use_slots():
+    options = SrcmlcppOptions()
+    code = """
+    // A comment
+    namespace N {
+        enum class E { a = 1 };
+        template<typename T> struct Foo : public Base { T f(int x = 1) const; int values[2]; };
+        #define ANSWER 42
+    }
+    """
+    cpp_unit = srcmlcpp.srcmlcpp_main.code_to_cpp_unit(options, code)
+    all_elements = [cpp_unit] + cpp_unit.all_cpp_elements_recursive()
+    # No element has an instance __dict__: they only store their members in __slots__
+    for element in all_elements:
+        assert not hasattr(element, "__dict__"), f"{type(element).__name__} has a __dict__"
+    assert not hasattr(code_to_srcml_wrapper(options, code), "__dict__")
+
+    # _members() returns the members which are set (unset members, such as the template of a non template
+    # function, are skipped)
+    struct = cpp_unit.all_structs_recursive()[0]
+    members = struct._members()
+    assert members["class_name"] == "Foo"
+    assert members["parent"] is struct.parent
+    assert "_template" in members
+    fn = cpp_unit.all_functions_recursive()[0]
+    assert "_template" not in fn._members()
+    assert not fn.is_template()
+
+
+def test_lazy_positions():
+    options = SrcmlcppOptions()
+    code = "int a = 1;\nint b = 2;"
+    wrapper = code_to_srcml_wrapper(options, code)
+    decl_a, decl_b = wrapper.make_wrapped_children()
+    # The positions are computed on first access only
+    assert not hasattr(decl_a, "_positions_cache")
+    assert decl_a.start() == CodePosition(1, 1)
+    assert decl_a.start() is decl_a.start()
+    assert decl_a.code_position_start == ":1:1"
+
+    # They are recomputed if the xml node or its end position change
+    decl_a.copy_end_position_from(decl_b)
+    assert decl_a.end() == decl_b.end()
+    decl_a.srcml_xml = decl_b.srcml_xml
+    assert decl_a.start() == CodePosition(2, 1)